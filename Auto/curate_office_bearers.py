@@ -1,4 +1,4 @@
-from sys import path
+from sys import path, argv
 
 
 path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
@@ -8,4 +8,4 @@ from Models.Builder import Builder
 
 
 Corporate_Database_Builder = Builder()
-Corporate_Database_Builder.curateOfficeBearer()
+Corporate_Database_Builder.curateOfficeBearer("--incremental" in argv)
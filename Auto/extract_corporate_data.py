@@ -1,6 +1,7 @@
 from datetime import datetime
 from datetime import timedelta
-from sys import path
+from sys import path, argv
+from os import cpu_count
 
 
 path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
@@ -13,4 +14,4 @@ module_limit_execution = datetime.now() + timedelta(minutes=15)
 module_limit_execution_time = module_limit_execution.timestamp()
 while datetime.now().timestamp() < module_limit_execution_time:
     Corporate_Database_Builder = Builder()
-    Corporate_Database_Builder.extractCorporateData()
+    Corporate_Database_Builder.extractCorporateData(workers=cpu_count() or 1, debug_mode="--debug" in argv)
@@ -0,0 +1,97 @@
+"""
+Benchmarking the startup of the Builder for every entry point of
+the Auto directory.  The previous startup constructed every model
+along with the document reader, while the current one only
+constructs the models which are used by the stage of the entry
+point.  The models only borrow a connection when a query is sent,
+so the database server is not needed, but the environment of the
+application has to be configured.
+
+Usage:
+    python3 Benchmarks/benchmark_builder_startup.py [ITERATIONS]
+
+Authors:
+    Darkness4869
+"""
+
+
+from sys import path, argv
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+
+path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
+
+
+from Models.Builder import Builder
+
+
+iterations: int = int(argv[1]) if len(argv) > 1 else 10
+"""
+The amount of builders which are constructed per entry point, as
+the loops of the entry points construct one builder per
+iteration.
+"""
+eager_dependencies: Tuple[str, ...] = (
+    "getDatabaseHandler", "getFinancialCalendar", "getFinCorpLogs", "getCompanyDetails", "getDocumentFiles", "getDocumentReader", "getBusinessDetails",
+    "getStateCapital", "getOfficeBearers", "getShareholders", "getMembers", "getFinancialSummaries", "getProfitStatements", "getBalanceSheets", "getAssets",
+    "getNonCurrentAssets", "getCurrentAssets", "getLiabilities", "getEquityAndLiabilities", "getNonCurrentLiabilities", "getCurrentLiabilities",
+    "getAnnualReturns", "getObjections", "getDetails", "getCharges"
+)
+"""
+The dependencies which were constructed by the previous
+initialization of the builder.
+"""
+entry_points: Dict[str, Tuple[str, ...]] = {
+    "Auto/collect_corporate_metadata.py": ("getCompanyDetails", "getFinCorpLogs", "getFinancialCalendar"),
+    "Auto/curate_business_details.py": ("getBusinessDetails", "getCompanyDetails", "getFinCorpLogs", "getFinancialCalendar"),
+    "Auto/curate_members.py": ("getFinCorpLogs", "getFinancialCalendar", "getMembers"),
+    "Auto/curate_office_bearers.py": ("getFinCorpLogs", "getFinancialCalendar", "getOfficeBearers"),
+    "Auto/curate_shareholders.py": ("getFinCorpLogs", "getFinancialCalendar", "getShareholders"),
+    "Auto/curate_state_capital.py": ("getFinCorpLogs", "getFinancialCalendar", "getStateCapital"),
+    "Auto/download_corporate_file.py": ("getCompanyDetails", "getDocumentFiles", "getFinCorpLogs", "getFinancialCalendar"),
+    "Auto/extract_corporate_data.py": eager_dependencies + ("getWriteBehindBuffer",)
+}
+"""
+The dependencies which are used by the stage of every entry
+point.
+"""
+
+
+def measure(dependencies: Tuple[str, ...]) -> float:
+    """
+    Measuring the average duration of the construction of a
+    builder along with its dependencies in milliseconds.
+
+    Parameters:
+        dependencies (Tuple[str, ...]): The getters of the dependencies to be constructed.
+
+    Returns:
+        float
+    """
+    durations: List[float] = []
+    for _ in range(0, iterations, 1):
+        start: float = perf_counter()
+        builder: Builder = Builder()
+        for dependency in dependencies:
+            getattr(builder, dependency)()
+        durations.append((perf_counter() - start) * 1000)
+    return sum(durations) / len(durations)
+
+
+def main() -> None:
+    """
+    Measuring the previous and the current startup of every entry
+    point.
+
+    Returns:
+        None
+    """
+    previous: float = measure(eager_dependencies)
+    print("entry point\tdependencies\tprevious (ms)\tcurrent (ms)")
+    for entry_point, dependencies in entry_points.items():
+        print(f"{entry_point}\t{len(dependencies)}\t{previous:.3f}\t{measure(dependencies):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmarking the curation of the names of the shareholders and
+of the members on synthetic data transfer objects, so that the
+single pass curation can be measured at the scale of the full
+tables.  The blacklist pattern and the verification of the names
+are timed directly, so that neither the builder nor the
+environment of the application nor the database server is
+needed.
+
+Usage:
+    python3 Benchmarks/benchmark_curation.py [ROWS]
+
+Authors:
+    Darkness4869
+"""
+
+
+from sys import path, argv
+from time import perf_counter
+from typing import Callable, List, Tuple, Any
+
+
+path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
+
+
+from Models.NameCuration import name_blacklist_pattern, isCuratedName
+from Data.Shareholders import Shareholder
+from Data.Members import Member
+
+
+rows: int = int(argv[1]) if len(argv) > 1 else 1000000
+"""
+The amount of synthetic rows of each table.
+"""
+names: Tuple[str, ...] = ("JOHN DOE", "ACME HOLDINGS LTD", "12, Royal Street", "Port Louis", "MAURITIUS", "Jane Smith", "Office Bearers", "Part Sociale")
+"""
+The names of the synthetic rows, which are both valid names and
+addresses or headers of the corporate registries.
+"""
+
+
+def buildShareholders(amount: int) -> List[Shareholder]:
+    """
+    Building the synthetic shareholders.
+
+    Parameters:
+        amount (int): The amount of shareholders.
+
+    Returns:
+        List[Shareholder]
+    """
+    return [Shareholder.fromRow((index, index // 4, names[index % len(names)], index % 1000 + 1, "Ordinary", "Mauritius Rupee")) for index in range(0, amount, 1)]
+
+
+def buildMembers(amount: int) -> List[Member]:
+    """
+    Building the synthetic members.
+
+    Parameters:
+        amount (int): The amount of members.
+
+    Returns:
+        List[Member]
+    """
+    return [Member.fromRow((index, index // 4, names[index % len(names)], index % 1000, 0, "Mauritius Rupee")) for index in range(0, amount, 1)]
+
+
+def measure(name: str, amount: int, function: Callable[[], Any]) -> None:
+    """
+    Measuring the duration of a curation and printing it.
+
+    Parameters:
+        name (str): The name of the curation.
+        amount (int): The amount of rows which are curated.
+        function (Callable[[], Any]): The curation.
+
+    Returns:
+        None
+    """
+    start: float = perf_counter()
+    function()
+    duration: float = perf_counter() - start
+    print(f"{name}\t{amount}\t{duration:.3f}\t{duration * 1000000 / amount:.3f}")
+
+
+def main() -> None:
+    """
+    Measuring the blacklist pattern, the verification of the
+    names and the filtering of the shareholders and of the
+    members on the full amount of rows.
+
+    Returns:
+        None
+    """
+    lowered_names: List[str] = [names[index % len(names)].lower() for index in range(0, rows, 1)]
+    shareholders: List[Shareholder] = buildShareholders(rows)
+    members: List[Member] = buildMembers(rows)
+    print("curation\trows\tduration (s)\tper row (us)")
+    measure("name_blacklist_pattern.search", rows, lambda: [name_blacklist_pattern.search(name) for name in lowered_names])
+    measure("isCuratedName", rows, lambda: [isCuratedName(name) for name in lowered_names])
+    measure("shareholders name filter", rows, lambda: [shareholder for shareholder in shareholders if isCuratedName(shareholder.name)])
+    measure("members name filter", rows, lambda: [member for member in members if isCuratedName(member.name)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmarking the memory held by the data transfer objects of the
+curated tables on synthetic rows.  The previous objects, which
+had a dictionary per instance and were built from the rows of a
+dictionary cursor, are compared with the slotted objects built
+from the rows of a tuple cursor.
+
+Usage:
+    python3 Benchmarks/benchmark_data_transfer_objects.py [ROWS]
+
+Authors:
+    Darkness4869
+"""
+
+
+from sys import path, argv
+from dataclasses import make_dataclass
+from typing import Callable, Dict, List, Tuple, Any
+import tracemalloc
+import gc
+
+
+path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
+
+
+from Data.Members import Member
+from Data.Shareholders import Shareholder
+from Data.OfficeBearers import OfficeBearer
+
+
+rows: int = int(argv[1]) if len(argv) > 1 else 1000000
+"""
+The amount of synthetic rows of each table.
+"""
+tables: List[Tuple[Any, Callable[[int], Tuple[Any, ...]]]] = [
+    (Member, lambda index: (index, index // 4, f"MEMBER {index}", index % 1000, 0, "Mauritius Rupee")),
+    (Shareholder, lambda index: (index, index // 4, f"SHAREHOLDER {index} LTD", index % 1000 + 1, "Ordinary", "Mauritius Rupee")),
+    (OfficeBearer, lambda index: (index, index // 4, "Director", f"OFFICE BEARER {index}", f"{index} Royal Street, Port Louis", 0))
+]
+"""
+The data transfer objects to be measured along with the factory
+of their synthetic rows.
+"""
+
+
+def measure(function: Callable[[], Any]) -> Tuple[int, int]:
+    """
+    Measuring the memory which is retained by the result of a
+    function as well as the peak memory of its call.
+
+    Parameters:
+        function (Callable[[], Any]): The function building the objects.
+
+    Returns:
+        Tuple[int, int]
+    """
+    gc.collect()
+    tracemalloc.start()
+    result: Any = function()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return (retained, peak)
+
+
+def buildPrevious(previous_class: Any, dataset: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Building the previous objects from the rows of a dictionary
+    cursor, which are all fetched before the objects are built.
+
+    Parameters:
+        previous_class (Any): The data transfer object without slots.
+        dataset (List[Dict[str, Any]]): The rows of the dictionary cursor.
+
+    Returns:
+        List[Any]
+    """
+    return [previous_class(**row) for row in dataset]
+
+
+def main() -> None:
+    """
+    Measuring the previous and the current objects of every table,
+    along with the rows they are built from, and printing the
+    memory per row.
+
+    Returns:
+        None
+    """
+    print("object\trows\tprevious retained (MB)\tcurrent retained (MB)\tprevious peak (MB)\tcurrent peak (MB)\tprevious per row (B)\tcurrent per row (B)")
+    for data_class, factory in tables:
+        columns: List[str] = data_class.columns.split(", ")
+        previous_class: Any = make_dataclass(data_class.__name__, columns)
+        previous: Tuple[int, int] = measure(lambda: buildPrevious(previous_class, [dict(zip(columns, factory(index))) for index in range(0, rows, 1)]))
+        current: Tuple[int, int] = measure(lambda: [data_class.fromRow(row) for row in [factory(index) for index in range(0, rows, 1)]])
+        print(f"{data_class.__name__}\t{rows}\t{previous[0] / 1048576:.1f}\t{current[0] / 1048576:.1f}\t{previous[1] / 1048576:.1f}\t{current[1] / 1048576:.1f}\t{previous[0] / rows:.0f}\t{current[0] / rows:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmarking the extractors of the Document_Reader model on
+synthetic corporate registries of growing size, so that the
+linear scaling of the extraction pipelines can be verified.
+Every extractor is run with the previous exclusion of the
+extracted lines, which scanned the extracted lines for each
+line of the section, and with the current one.  The model is
+not initialized and only the extractors which do not look up
+the database server are run, which are the extractors of the
+office bearers and of the charges, as the extractors of the
+shareholders and of the members retrieve the possible share
+types and currencies from it.
+
+Usage:
+    python3 Benchmarks/benchmark_document_reader.py [ENTRIES ...]
+
+Authors:
+    Darkness4869
+"""
+
+
+from sys import path, argv
+from time import perf_counter
+from types import MethodType
+from typing import Callable, Dict, List, Any
+
+
+path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
+
+
+from Models.DocumentReader import Document_Reader
+
+
+sizes: List[int] = [int(size) for size in argv[1:]] or [100, 1000, 4000]
+"""
+The amounts of office bearers and of charges of the synthetic
+corporate registries.
+"""
+
+
+def buildCorporateRegistry(size: int) -> List[str]:
+    """
+    Building the result set of a synthetic corporate registry
+    with the given amount of office bearers and of charges, in
+    the layout of the portable document file version of the
+    corporate registry.
+
+    Parameters:
+        size (int): The amount of office bearers and of charges.
+
+    Returns:
+        List[str]
+    """
+    result_set: List[str] = ["Office Bearers", "Position Name Service Address Appointed Date"]
+    for index in range(0, size, 1):
+        result_set += ["DIRECTOR", f"OFFICE BEARER {index}", f"{index} ROYAL ROAD PORT LOUIS MAURITIUS", "01/02/2015"]
+    result_set += ["No. of Shares Type of Shares", "Charges", "Volume Property Nature Amount Date Charged Date Filed Currency"]
+    for index in range(0, size, 1):
+        result_set += [f"TV/{index}/", f"{1000 + index}", "Floating Charge On Land", "FIXED", f"{index + 1},000,000 01/02/2015 03/04/2015", "Mauritius Rupee"]
+    result_set.append("Winding Up Details")
+    return result_set
+
+
+def excludeLinesPrevious(self: Document_Reader, result_set: List[str], excluded_lines: List[Any]) -> List[str]:
+    """
+    The previous exclusion, which scans the extracted lines for
+    each line of the section.
+
+    Parameters:
+        result_set (List[str]): The lines of the section.
+        excluded_lines (List[Any]): The lines that have already been extracted.
+
+    Returns:
+        List[str]
+    """
+    return [value for value in result_set if value not in excluded_lines]
+
+
+def measure(extractor: Callable[[List[str]], List[Dict[str, Any]]], result_set: List[str]) -> float:
+    """
+    Measuring the duration of an extraction in milliseconds.
+
+    Parameters:
+        extractor (Callable[[List[str]], List[Dict[str, Any]]]): The extractor to be measured.
+        result_set (List[str]): The result set of the corporate registry.
+
+    Returns:
+        float
+    """
+    start: float = perf_counter()
+    extractor(result_set)
+    return (perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """
+    Measuring the extractors with the previous and the current
+    exclusion for every size and printing their durations per
+    line, which stay constant for a linear implementation.
+
+    Returns:
+        None
+    """
+    current: Document_Reader = Document_Reader.__new__(Document_Reader)
+    previous: Document_Reader = Document_Reader.__new__(Document_Reader)
+    previous._excludeLines = MethodType(excludeLinesPrevious, previous) # type: ignore
+    print("entries\tlines\textractor\trows\tprevious (ms)\tcurrent (ms)\tprevious per line (us)\tcurrent per line (us)")
+    for size in sizes:
+        result_set: List[str] = buildCorporateRegistry(size)
+        current._indexResultSet(result_set)
+        previous._indexResultSet(result_set)
+        for extractor in ("extractOfficeBearers", "extractCharges"):
+            rows: int = len(getattr(current, extractor)(result_set))
+            previous_duration: float = measure(getattr(previous, extractor), result_set)
+            current_duration: float = measure(getattr(current, extractor), result_set)
+            print(f"{size}\t{len(result_set)}\t{extractor}\t{rows}\t{previous_duration:.3f}\t{current_duration:.3f}\t{previous_duration * 1000 / len(result_set):.3f}\t{current_duration * 1000 / len(result_set):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from mysql.connector.types import RowType
 from typing import Union, Dict
 
-@dataclass
+@dataclass(slots=True)
 class Assets:
     """
     The Data Transfer Object for the Assets.
@@ -8,10 +8,10 @@ Authors:
 
 from dataclasses import dataclass
 from mysql.connector.types import RowType
-from typing import Union, Dict
+from typing import Union, Dict, Tuple, Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessDetails:
     """
     The Data Transfer Object for the Business Details.
@@ -22,6 +22,11 @@ class BusinessDetails:
     name: Union[str, None]
     nature: Union[str, None]
     operational_address: Union[str, None]
+    columns: ClassVar[str] = "identifier, CompanyDetail, registered_address, name, nature, operational_address"
+    """
+    The columns of the table, in the order expected by `fromRow`.
+    """
+
     def __init__(self, dataset: Union[RowType, Dict[str, Union[int, str, None]]]) -> None:
         """
         Initializing the data class object.
@@ -37,4 +42,26 @@ class BusinessDetails:
         self.registered_address = dataset["registered_address"] # type: ignore
         self.name = dataset["name"] # type: ignore
         self.nature = dataset["nature"] # type: ignore
-        self.operational_address = dataset["operational_address"] # type: ignore
\ No newline at end of file
+        self.operational_address = dataset["operational_address"] # type: ignore
+
+    @classmethod
+    def fromRow(cls, row: Tuple[Any, ...]) -> "BusinessDetails":
+        """
+        Initializing the data class object from a row of a tuple
+        cursor, whose values are in the order of `columns`, without
+        building a dictionary for the row.
+
+        Parameters:
+            row: (identifier: int, CompanyDetail: int, registered_address: string|null, name: string|null, nature: string|null, operational_address: string|null): The row from the relational database server.
+
+        Returns:
+            BusinessDetails
+        """
+        business_detail: BusinessDetails = cls.__new__(cls)
+        business_detail.identifier = int(row[0])
+        business_detail.CompanyDetail = int(row[1])
+        business_detail.registered_address = row[2]
+        business_detail.name = row[3]
+        business_detail.nature = row[4]
+        business_detail.operational_address = row[5]
+        return business_detail
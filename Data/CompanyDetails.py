@@ -8,10 +8,10 @@ Authors:
 
 from dataclasses import dataclass
 from mysql.connector.types import RowType
-from typing import Union, Dict
+from typing import Union, Dict, Tuple, Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyDetails:
     """
     The Data Transfer Object for the Company Details.
@@ -28,6 +28,10 @@ class CompanyDetails:
     is_extracted: int
     company_identifier: int
     company_type: str
+    columns: ClassVar[str] = "identifier, business_registration_number, name, file_number, category, date_incorporation, nature, status, date_verified, is_extracted, company_identifier, company_type"
+    """
+    The columns of the table, in the order expected by `fromRow`.
+    """
 
     def __init__(self, dataset: Union[RowType, Dict[str, Union[int, str, None]]]) -> None:
         """
@@ -50,4 +54,32 @@ class CompanyDetails:
         self.date_verified = dataset["date_verified"] # type: ignore
         self.is_extracted = dataset["is_extracted"] # type: ignore
         self.company_identifier = dataset["company_identifier"] # type: ignore
-        self.company_type = dataset["company_type"] # type: ignore
\ No newline at end of file
+        self.company_type = dataset["company_type"] # type: ignore
+
+    @classmethod
+    def fromRow(cls, row: Tuple[Any, ...]) -> "CompanyDetails":
+        """
+        Initializing the data class object from a row of a tuple
+        cursor, whose values are in the order of `columns`, without
+        building a dictionary for the row.
+
+        Parameters:
+            row: (identifier: int, business_registration_number: string, name: string, file_number: string, category: string, date_incorporation: int, nature: string, status: string, date_verified: int, is_extracted: int, company_identifier: int, company_type: string): The row from the relational database server.
+
+        Returns:
+            CompanyDetails
+        """
+        company_detail: CompanyDetails = cls.__new__(cls)
+        company_detail.identifier = int(row[0])
+        company_detail.business_registration_number = str(row[1])
+        company_detail.name = str(row[2])
+        company_detail.file_number = str(row[3])
+        company_detail.category = str(row[4])
+        company_detail.date_incorporation = int(row[5])
+        company_detail.nature = str(row[6])
+        company_detail.status = str(row[7])
+        company_detail.date_verified = row[8]
+        company_detail.is_extracted = row[9]
+        company_detail.company_identifier = row[10]
+        company_detail.company_type = row[11]
+        return company_detail
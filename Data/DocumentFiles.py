@@ -11,7 +11,7 @@ from mysql.connector.types import RowType
 from typing import Union, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentFiles:
     """
     The Data Transfer Object for the corporate registries.
@@ -14,7 +14,7 @@ from datetime import datetime
 from datetime import timedelta
 
 
-@dataclass
+@dataclass(slots=True)
 class FinCorpLogs:
     """
     The Data Transfer Object for the Financial Calendar.
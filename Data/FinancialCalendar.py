@@ -11,7 +11,7 @@ from mysql.connector.types import RowType
 from typing import Union, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialCalendar:
     """
     The Data Transfer Object for the Financial Calendar.
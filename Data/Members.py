@@ -5,10 +5,10 @@ The Data Transfer Object for the Member.
 
 from dataclasses import dataclass
 from mysql.connector.types import RowType
-from typing import Union, Dict
+from typing import Union, Dict, Tuple, Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class Member:
     """
     The Data Transfer Object for the Member.
@@ -19,6 +19,10 @@ class Member:
     amount: int
     date_start: int
     currency: str
+    columns: ClassVar[str] = "identifier, CompanyDetail, name, amount, date_start, currency"
+    """
+    The columns of the table, in the order expected by `fromRow`.
+    """
 
     def __init__(self, dataset: Union[RowType, Dict[str, Union[int, str]]]) -> None:
         """
@@ -35,4 +39,26 @@ class Member:
         self.name = str(dataset["name"]) # type: ignore
         self.amount = int(dataset["amount"]) # type: ignore
         self.date_start = int(dataset["date_start"]) # type: ignore
-        self.currency = str(dataset["currency"]) # type: ignore
\ No newline at end of file
+        self.currency = str(dataset["currency"]) # type: ignore
+
+    @classmethod
+    def fromRow(cls, row: Tuple[Any, ...]) -> "Member":
+        """
+        Initializing the data class object from a row of a tuple
+        cursor, whose values are in the order of `columns`, without
+        building a dictionary for the row.
+
+        Parameters:
+            row: (identifier: int, CompanyDetail: int, name: string, amount: int, date_start: int, currency: string): The row from the relational database server.
+
+        Returns:
+            Member
+        """
+        member: Member = cls.__new__(cls)
+        member.identifier = int(row[0])
+        member.CompanyDetail = int(row[1])
+        member.name = str(row[2])
+        member.amount = int(row[3])
+        member.date_start = int(row[4])
+        member.currency = str(row[5])
+        return member
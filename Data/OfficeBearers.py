@@ -5,10 +5,10 @@ The Data Transfer Object for the Office Bearer.
 
 from dataclasses import dataclass
 from mysql.connector.types import RowType
-from typing import Union, Dict
+from typing import Union, Dict, Tuple, Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class OfficeBearer:
     """
     The Data Transfer Object for the Office Bearer.
@@ -19,6 +19,11 @@ class OfficeBearer:
     name: str
     address: Union[str, None]
     date_appointment: int
+    columns: ClassVar[str] = "identifier, CompanyDetail, position, name, address, date_appointment"
+    """
+    The columns of the table, in the order expected by `fromRow`.
+    """
+
     def __init__(self, dataset: Union[RowType, Dict[str, Union[int, str, None]]]) -> None:
         """
         Initializing the data class object.
@@ -34,4 +39,26 @@ class OfficeBearer:
         self.position = str(dataset["position"]) # type: ignore
         self.name = str(dataset["name"]) # type: ignore
         self.address = dataset["address"] # type: ignore
-        self.date_appointment = int(dataset["date_appointment"]) # type: ignore
\ No newline at end of file
+        self.date_appointment = int(dataset["date_appointment"]) # type: ignore
+
+    @classmethod
+    def fromRow(cls, row: Tuple[Any, ...]) -> "OfficeBearer":
+        """
+        Initializing the data class object from a row of a tuple
+        cursor, whose values are in the order of `columns`, without
+        building a dictionary for the row.
+
+        Parameters:
+            row: (identifier: int, CompanyDetail: int, position: string, name: string, address: string | null, date_appointment: int): The row from the relational database server.
+
+        Returns:
+            OfficeBearer
+        """
+        office_bearer: OfficeBearer = cls.__new__(cls)
+        office_bearer.identifier = int(row[0])
+        office_bearer.CompanyDetail = int(row[1])
+        office_bearer.position = str(row[2])
+        office_bearer.name = str(row[3])
+        office_bearer.address = row[4]
+        office_bearer.date_appointment = int(row[5])
+        return office_bearer
@@ -5,10 +5,10 @@ The Data Transfer Object for the Shareholder.
 
 from dataclasses import dataclass
 from mysql.connector.types import RowType
-from typing import Union, Dict
+from typing import Union, Dict, Tuple, Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class Shareholder:
     """
     The Data Transfer Object for the Shareholder.
@@ -19,6 +19,10 @@ class Shareholder:
     amount_shares: int
     type_shares: str
     currency: str
+    columns: ClassVar[str] = "identifier, CompanyDetail, name, amount_shares, type_shares, currency"
+    """
+    The columns of the table, in the order expected by `fromRow`.
+    """
 
     def __init__(self, dataset: Union[RowType, Dict[str, Union[int, str]]]) -> None:
         """
@@ -35,4 +39,26 @@ class Shareholder:
         self.name = str(dataset["name"]) # type: ignore
         self.amount_shares = int(dataset["amount_shares"]) # type: ignore
         self.type_shares = str(dataset["type_shares"]) # type: ignore
-        self.currency = str(dataset["currency"]) # type: ignore
\ No newline at end of file
+        self.currency = str(dataset["currency"]) # type: ignore
+
+    @classmethod
+    def fromRow(cls, row: Tuple[Any, ...]) -> "Shareholder":
+        """
+        Initializing the data class object from a row of a tuple
+        cursor, whose values are in the order of `columns`, without
+        building a dictionary for the row.
+
+        Parameters:
+            row: (identifier: int, CompanyDetail: int, name: string, amount_shares: int, type_shares: string, currency: string): The row from the relational database server.
+
+        Returns:
+            Shareholder
+        """
+        shareholder: Shareholder = cls.__new__(cls)
+        shareholder.identifier = int(row[0])
+        shareholder.CompanyDetail = int(row[1])
+        shareholder.name = str(row[2])
+        shareholder.amount_shares = int(row[3])
+        shareholder.type_shares = str(row[4])
+        shareholder.currency = str(row[5])
+        return shareholder
@@ -8,10 +8,10 @@ Authors:
 
 from dataclasses import dataclass
 from mysql.connector.types import RowType
-from typing import Union, Dict
+from typing import Union, Dict, Tuple, Any, ClassVar
 
 
-@dataclass
+@dataclass(slots=True)
 class StateCapital:
     """
     The Data Transfer Object for the State Capital.
@@ -23,6 +23,11 @@ class StateCapital:
     stated_capital: Union[float, None]
     amount_unpaid: Union[float, None]
     currency: Union[str, None]
+    columns: ClassVar[str] = "identifier, CompanyDetail, type, amount, stated_capital, amount_unpaid, currency"
+    """
+    The columns of the table, in the order expected by `fromRow`.
+    """
+
     def __init__(self, dataset: Union[RowType, Dict[str, Union[int, str, float, None]]]) -> None:
         """
         Initializing the data class object.
@@ -39,4 +44,27 @@ class StateCapital:
         self.amount = dataset["amount"] # type: ignore
         self.stated_capital = dataset["stated_capital"] # type: ignore
         self.amount_unpaid = dataset["amount_unpaid"] # type: ignore
-        self.currency = dataset["currency"] # type: ignore
\ No newline at end of file
+        self.currency = dataset["currency"] # type: ignore
+
+    @classmethod
+    def fromRow(cls, row: Tuple[Any, ...]) -> "StateCapital":
+        """
+        Initializing the data class object from a row of a tuple
+        cursor, whose values are in the order of `columns`, without
+        building a dictionary for the row.
+
+        Parameters:
+            row: (identifier: int, CompanyDetail: int, type: string|null, amount: int|null, stated_capital: float|null, amount_unpaid: float|null, currency: string|null): The row from the relational database server.
+
+        Returns:
+            StateCapital
+        """
+        stated_capital: StateCapital = cls.__new__(cls)
+        stated_capital.identifier = int(row[0])
+        stated_capital.CompanyDetail = int(row[1])
+        stated_capital.type = row[2]
+        stated_capital.amount = row[3]
+        stated_capital.stated_capital = row[4]
+        stated_capital.amount_unpaid = row[5]
+        stated_capital.currency = row[6]
+        return stated_capital
@@ -0,0 +1,10 @@
+-- Supporting indexes for the date of incorporation queries of the
+-- Company_Details and Document_Files models, which filter on a
+-- half-open range of Unix timestamps for a given day.
+
+CREATE INDEX CompanyDetailsDateIncorporationExtracted ON CompanyDetails (date_incorporation, is_extracted);
+CREATE INDEX CompanyDetailsDateIncorporationVerified ON CompanyDetails (date_incorporation, date_verified);
+CREATE INDEX DocumentFilesCompanyDetail ON DocumentFiles (CompanyDetail);
+
+-- The plans are checked by check_001_date_incorporation_indexes.py,
+-- which fails when the queries are not using these indexes.
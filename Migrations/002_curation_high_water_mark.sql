@@ -0,0 +1,13 @@
+-- Flag of the rows that have already been curated, so that the
+-- incremental curation of the Members, Shareholders and Office
+-- Bearers only processes the rows that have been extracted since
+-- the previous run.  A full curation has to be run once after the
+-- migration for the existing rows to be flagged as curated.
+
+ALTER TABLE Members ADD COLUMN is_curated TINYINT(1) NOT NULL DEFAULT 0;
+ALTER TABLE Shareholders ADD COLUMN is_curated TINYINT(1) NOT NULL DEFAULT 0;
+ALTER TABLE OfficeBearers ADD COLUMN is_curated TINYINT(1) NOT NULL DEFAULT 0;
+
+CREATE INDEX MembersIsCurated ON Members (is_curated);
+CREATE INDEX ShareholdersIsCurated ON Shareholders (is_curated);
+CREATE INDEX OfficeBearersIsCurated ON OfficeBearers (is_curated);
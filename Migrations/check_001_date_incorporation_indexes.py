@@ -0,0 +1,184 @@
+"""
+Checking that the date of incorporation queries of the
+Company_Details and Document_Files models are using the indexes
+of the migration 001.  Every query is explained and the script
+fails when the key used for one of its tables is not one of the
+indexes which are expected for it.
+
+Usage:
+    python3 Migrations/check_001_date_incorporation_indexes.py [YYYY-MM-DD]
+
+Authors:
+    Darkness4869
+"""
+
+
+from sys import path, argv, exit
+from datetime import datetime
+from typing import Dict, List, Set, Tuple, Any
+
+
+path.insert(0, "/home/darkness4869/Documents/Corporate_Database_Builder")
+
+
+from Environment import Environment
+from Models.DatabaseHandler import Database_Handler
+from mysql.connector import connect
+from mysql.connector.connection import MySQLConnection
+
+
+company_details_indexes: Set[str] = {"CompanyDetailsDateIncorporationExtracted", "CompanyDetailsDateIncorporationVerified"}
+"""
+The indexes of the Company Details table which are created by the
+migration.
+"""
+document_files_indexes: Set[str] = {"DocumentFilesCompanyDetail"}
+"""
+The indexes of the Document Files table which are created by the
+migration.  The index backing the foreign key on its company is
+accepted as well, as it covers the same column.
+"""
+queries: List[Tuple[str, str, List[str]]] = [
+    (
+        "Company_Details.getAmount",
+        "SELECT COUNT(CompanyDetails.identifier) AS amount_found FROM CompanyDetails WHERE date_incorporation >= %s AND date_incorporation < %s",
+        ["CompanyDetails"]
+    ),
+    (
+        "Company_Details.getAmountDownloadedCorporateDocuments",
+        "SELECT COUNT(CompanyDetails.identifier) AS amount_found FROM CompanyDetails LEFT JOIN DocumentFiles ON DocumentFiles.CompanyDetail = CompanyDetails.identifier WHERE CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s AND DocumentFiles.identifier IS NOT NULL",
+        ["CompanyDetails", "DocumentFiles"]
+    ),
+    (
+        "Company_Details.getCompanyDetailsForDownloadCorporateDocumentFile",
+        "SELECT * FROM CompanyDetails WHERE date_incorporation >= %s AND date_incorporation < %s AND date_verified IS NULL",
+        ["CompanyDetails"]
+    ),
+    (
+        "Company_Details.getRunStatistics",
+        "SELECT COUNT(DISTINCT CompanyDetails.identifier) AS amount, COUNT(DocumentFiles.identifier) AS amount_downloaded, COALESCE(SUM(DocumentFiles.identifier IS NOT NULL AND CompanyDetails.is_extracted = 1), 0) AS amount_found, COUNT(DISTINCT CASE WHEN CompanyDetails.is_extracted = 1 THEN CompanyDetails.identifier END) AS amount_extracted FROM CompanyDetails LEFT JOIN DocumentFiles ON DocumentFiles.CompanyDetail = CompanyDetails.identifier WHERE CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s",
+        ["CompanyDetails", "DocumentFiles"]
+    ),
+    (
+        "Company_Details.getAmountExtracted",
+        "SELECT COUNT(identifier) AS amount_found FROM CompanyDetails WHERE date_incorporation >= %s AND date_incorporation < %s AND is_extracted = 1",
+        ["CompanyDetails"]
+    ),
+    (
+        "Document_Files.getCorporateRegistries",
+        "SELECT DocumentFiles.identifier, DocumentFiles.file_data, DocumentFiles.CompanyDetail FROM DocumentFiles LEFT JOIN CompanyDetails ON DocumentFiles.CompanyDetail = CompanyDetails.identifier WHERE CompanyDetails.is_extracted = 0 AND CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s ORDER BY DocumentFiles.identifier ASC",
+        ["CompanyDetails", "DocumentFiles"]
+    ),
+    (
+        "Document_Files.iterCorporateRegistries",
+        "SELECT DocumentFiles.identifier, DocumentFiles.file_data, DocumentFiles.CompanyDetail FROM DocumentFiles LEFT JOIN CompanyDetails ON DocumentFiles.CompanyDetail = CompanyDetails.identifier WHERE CompanyDetails.is_extracted = 0 AND CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s ORDER BY DocumentFiles.identifier ASC",
+        ["CompanyDetails", "DocumentFiles"]
+    ),
+    (
+        "Document_Files.getAmount",
+        "SELECT COUNT(DocumentFiles.identifier) AS amount_found FROM DocumentFiles LEFT JOIN CompanyDetails ON DocumentFiles.CompanyDetail = CompanyDetails.identifier WHERE CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s",
+        ["CompanyDetails", "DocumentFiles"]
+    ),
+    (
+        "Document_Files.getAmountFound",
+        "SELECT COUNT(DocumentFiles.identifier) AS amount_found FROM DocumentFiles LEFT JOIN CompanyDetails ON DocumentFiles.CompanyDetail = CompanyDetails.identifier WHERE CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s AND CompanyDetails.is_extracted = 1",
+        ["CompanyDetails", "DocumentFiles"]
+    )
+]
+"""
+The name, the statement and the tables to be verified of every
+query filtering on the date of incorporation, as they are built by
+the models.
+"""
+
+
+def getForeignKeyIndexes(connection: MySQLConnection, table: str, column: str) -> Set[str]:
+    """
+    Retrieving the indexes of a table whose first column is the
+    given one, which includes the index backing its foreign key.
+
+    Parameters:
+        connection (MySQLConnection): The connection to the database server.
+        table (str): The name of the table.
+        column (str): The name of the column.
+
+    Returns:
+        Set[str]
+    """
+    cursor = connection.cursor()
+    cursor.execute("SELECT INDEX_NAME FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s AND SEQ_IN_INDEX = 1", (table, column))
+    indexes: Set[str] = {str(row[0]) for row in cursor.fetchall()} # type: ignore
+    cursor.close()
+    return indexes
+
+
+def explain(connection: MySQLConnection, query: str, parameters: Tuple[int, int]) -> List[Dict[str, Any]]:
+    """
+    Retrieving the plan of a query.
+
+    Parameters:
+        connection (MySQLConnection): The connection to the database server.
+        query (str): The query to be explained.
+        parameters (Tuple[int, int]): The range of the dates of incorporation.
+
+    Returns:
+        List[Dict[str, Any]]
+    """
+    cursor = connection.cursor(dictionary=True)
+    cursor.execute(f"EXPLAIN {query}", parameters)
+    plan: List[Dict[str, Any]] = cursor.fetchall() # type: ignore
+    cursor.close()
+    return plan
+
+
+def check(name: str, plan: List[Dict[str, Any]], expectations: Dict[str, Set[str]]) -> bool:
+    """
+    Verifying that every table of the plan is accessed through one
+    of its expected indexes.
+
+    Parameters:
+        name (str): The name of the query.
+        plan (List[Dict[str, Any]]): The plan of the query.
+        expectations (Dict[str, Set[str]]): The expected indexes per table.
+
+    Returns:
+        bool
+    """
+    is_valid: bool = True
+    for table, indexes in expectations.items():
+        rows: List[Dict[str, Any]] = [row for row in plan if row["table"] == table]
+        keys: List[str] = [str(row["key"]) for row in rows]
+        is_used: bool = len(rows) > 0 and all(key in indexes for key in keys)
+        print(f"{'OK' if is_used else 'FAIL'}\t{name}\t{table}\tkey: {', '.join(keys) or None}\texpected: {', '.join(sorted(indexes))}")
+        is_valid = is_valid and is_used
+    return is_valid
+
+
+def main() -> int:
+    """
+    Explaining every query and verifying its plan.
+
+    Returns:
+        int: The exit status, which is 1 when an index is not used.
+    """
+    ENV = Environment()
+    parameters: Tuple[int, int] = Database_Handler()._getDateRange(argv[1] if len(argv) > 1 else datetime.now().strftime("%Y-%m-%d"))
+    connection: MySQLConnection = connect(
+        host=ENV.getHost(),
+        database=ENV.getDatabase(),
+        user=ENV.getUsername(),
+        password=ENV.getPassword()
+    ) # type: ignore
+    try:
+        indexes: Dict[str, Set[str]] = {
+            "CompanyDetails": company_details_indexes,
+            "DocumentFiles": document_files_indexes | getForeignKeyIndexes(connection, "DocumentFiles", "CompanyDetail")
+        }
+        results: List[bool] = [check(name, explain(connection, query, parameters), {table: indexes[table] for table in tables}) for name, query, tables in queries]
+    finally:
+        connection.close()
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
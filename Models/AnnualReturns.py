@@ -8,7 +8,8 @@ Authors:
 
 
 from Models.DatabaseHandler import Database_Handler
-from typing import Dict, Union, Tuple
+from Models.WriteBehindBuffer import Write_Behind_Buffer
+from typing import Dict, Union, Tuple, List
 from mysql.connector.errors import Error
 
 
@@ -74,6 +75,35 @@ class Annual_Returns(Database_Handler):
             )
             self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
             return self.created
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return self.service_unavailable
+
+    def addAnnualReturnsBatch(self, dataset: List[Dict[str, int]], company_detail: int, buffer: Union[Write_Behind_Buffer, None] = None) -> int:
+        """
+        Adding the annual returns of the company in a single batch.
+
+        Parameters:
+            dataset: [{date_annual_return: int, date_annual_meeting: int, date_filled: int}]: The data of the annual returns
+            company_detail: int: The identifier of a company
+            buffer: Write_Behind_Buffer|null: The write-behind buffer in which the rows are staged instead of being inserted.
+
+        Returns:
+            int
+        """
+        try:
+            rows: List[Tuple[int, int, int, int]] = [(company_detail, data["date_annual_return"], data["date_annual_meeting"], data["date_filled"]) for data in dataset]
+            columns: str = "CompanyDetail, date_annual_return, date_annual_meeting, date_filled"
+            if buffer is None:
+                self.postDataBatch(
+                    table=self.getTableName(),
+                    columns=columns,
+                    rows=rows # type: ignore
+                )
+            else:
+                buffer.stage(self.getTableName(), columns, rows) # type: ignore
+            self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
+            return self.created
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
             return self.service_unavailable
\ No newline at end of file
@@ -55,30 +55,41 @@ class Balance_Sheets(Database_Handler):
     def setTableName(self, table_name: str) -> None:
         self.__table_name = table_name
 
-    def addBalanceSheet(self, data: Dict[str, Union[int, str]], company_detail: int) -> int:
+    def addBalanceSheet(self, data: Dict[str, Union[int, str]], company_detail: int) -> Dict[str, int]:
         """
-        Adding the balance sheet of the company.
+        Adding the balance sheet of the company.  When it has
+        already been stored, the identifier of the stored one is
+        returned.
 
         Parameters:
             data: {financial_year: int, currency: string, unit: int}: The data of the profit statement.
             company_detail: int: The identifier of a company.
 
         Returns:
-            int
+            {status: int, identifier: int}
         """
         try:
             parameters: Tuple[int, int, str, int] = (company_detail, int(data["financial_year"]), str(data["currency"]), int(data["unit"])) # type: ignore
-            self.postData(
+            identifier: int = self.postData(
                 table=self.getTableName(),
                 columns="CompanyDetail, financial_year, currency, unit",
                 values="%s, %s, %s, %s",
                 parameters=parameters # type: ignore
             )
+            if identifier == 0:
+                identifier = self.getSpecific(company_detail, int(data["financial_year"])).identifier
+                self.getLogger().warn(f"The balance sheet has already been stored, so its stored identifier is used.\nIdentifier: {identifier}")
             self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
-            return self.created
+            return {
+                "status": self.created,
+                "identifier": identifier
+            }
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
-            return self.service_unavailable
+            return {
+                "status": self.service_unavailable,
+                "identifier": 0
+            }
 
     def getSpecific(self, company_detail:int, financial_year: int) -> BalanceSheets:
         """
@@ -99,7 +110,7 @@ class Balance_Sheets(Database_Handler):
                 parameters=parameters # type: ignore
             )
             response: Dict[str, Union[int, BalanceSheets]] = self._getSpecific(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data})
             return response["data"] # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
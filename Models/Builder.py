@@ -24,22 +24,24 @@ from Models.StateCapital import State_Capital
 from Models.OfficeBearers import Office_Bearers
 from Models.Shareholders import Shareholders
 from Models.Members import Member as Member_Model
+from Models.DictionaryColumn import Dictionary_Column
+from Models.NameCuration import isCuratedName
+from Models.WriteBehindBuffer import Write_Behind_Buffer
 from datetime import datetime, timedelta
 from Environment import Environment
-from typing import List, Tuple, Union, Dict
+from typing import List, Tuple, Union, Dict, Iterator, Iterable, Deque, Set
+from concurrent.futures import ProcessPoolExecutor, Future
+from collections import deque
 from time import time, sleep
-from re import L, findall, search
+from re import L, findall, search, compile, Pattern, IGNORECASE
 from Models.Mail import Mail
 from Models.FinancialSummaries import Financial_Summaries
 from Models.ProfitStatements import Profit_Statements
 from Models.BalanceSheets import Balance_Sheets
-from Data.BalanceSheets import BalanceSheets
 from Models.Assets import Assets as Assets_Model
-from Data.Assets import Assets
 from Models.NonCurrentAssets import Non_Current_Assets
 from Models.CurrentAssets import Current_Assets
 from Models.Liabilities import Liabilities as Liabilities_Model
-from Data.Liabilities import Liabilities
 from Models.EquityAndLiabilities import Equity_And_Liabilities
 from Models.NonCurrentLiabilities import Non_Current_Liabilities
 from Models.CurrentLiabilities import Current_Liabilities
@@ -50,9 +52,170 @@ from Models.Charges import Charges
 from Data.OfficeBearers import OfficeBearer
 from Data.Shareholders import Shareholder
 from Data.Members import Member
+from functools import lru_cache
+from mysql.connector.errors import Error
 import os
 
 
+social_part_types: Set[str] = {"part sociale", "part d'interet"}
+"""
+The types of the shares which are curated as Part Sociale.
+"""
+stated_capital_currency_rules: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...], str], ...] = (
+    ("Mauritian Rupee", ("mauritius", "rupee"), (), "Mauritian Rupee"),
+    ("United States Dollar", ("us",), (), "United States Dollar"),
+    ("Singapore Dollar", ("singapore",), (), "Singapore Dollar")
+)
+"""
+The ordered rules curating the currencies of the stated
+capitals, as the label, the keywords of which one has to be
+found, the keywords of which none has to be found and the
+curated currency.
+"""
+stated_capital_type_rules: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...], str], ...] = (
+    ("ordinary", ("ordinary",), ("class",), "Ordinary"),
+    ("sociale", ("social", "interet"), (), "Part Sociale"),
+    ("D", ("class d",), (), "Class D"),
+    ("B", ("class b",), (), "Class B"),
+    ("A", ("class a",), (), "Class A"),
+    ("management", ("management",), (), "Management"),
+    ("Class C", ("class c",), (), "Class C"),
+    ("Founder", ("founder",), (), "Founder"),
+    ("Preference", ("preference",), (), "Preference")
+)
+"""
+The ordered rules curating the types of the stated capitals,
+in the same form as `stated_capital_currency_rules`.
+"""
+digit_pattern: Pattern[str] = compile(r"\d")
+"""
+The pattern of the digits in an address.
+"""
+address_stop_words: Set[str] = {"No", "No.", "Floor", "Lot", "Plot", "Suite", "Level", "Effective", "Date", "For", "Registered", "Office", "Address:", "(Ex", "Gds", "-", "Apt.", "Hse"}
+"""
+The words which are removed from the erroneous addresses.
+"""
+registered_address_replacements: Tuple[Tuple[str, str, bool], ...] = (("-", "", True), (", ", "", True), (". ", "", True), ("(B) ", "", True), ("(", "", True), ("& ", "", True), (" morc ", " Morcellement ", False), (" st,", " Street, ", False), (" rd, ", " Road, ", False), (" ave ", " Avenue ", False), (" ste ", " Sainte ", False), ("apps ", "Appartment ", False), ("appt ", "Appartment ", False), ("apt ", "Appartment ", False), ("blk ", "Block ", False), (" rt ", " Route ", False), (" rd ", " Road, ", False), (" ave, ", " Avenue ", False), (" mt ", " Montagne ", False), (" - ", " ", False), (" se ", " Sugar Estate ", False), ("blvd", "Boulevard ", True), ("grnw ", "Grand River North West, ", False), ("govt ", "Government ", False), ("imp ", "Impasse ", False), ("morc ", "Morcellement ", False), ("morc.", "Morcellement ", False), ("mont", "Montagne ", False), ("pte ", "Pointe ", False))
+"""
+The ordered replacements of the registered addresses.  A tuple
+contains the substring to be replaced, the replacement string
+and whether the replacement applies only when the substring is
+at the beginning of the address.
+"""
+
+
+business_details_nature_rules: Tuple[Tuple[str, Tuple[Pattern[str], ...], Union[str, None]], ...] = (
+    ("a job contractor", (compile(r"(?i:job contractor|grade)|A,"),), "Other Business Support Activities"),
+    ("not elsewhere classified", (compile(r"N\.E\.C|n\.e\.c"),), "Other Business Support Activities"),
+    ("other professional, scientific and technical activities", (compile(r"other", IGNORECASE), compile(r"professional", IGNORECASE)), "Other Professional, Scientific And Technical Activities"),
+    ("a firm", (compile(r"\(Firm\)"),), None),
+    ("a general retailer", (compile(r"general retailer|foodstuff", IGNORECASE),), "General Retailer"),
+    ("a wholesaler", (compile(r"non-specialised wholesale trade", IGNORECASE),), "Non-Specialised Wholesale Trade"),
+    ("a head office", (compile(r"head offices", IGNORECASE),), "Activities Of Head Offices"),
+    ("a web portal", (compile(r"web portals", IGNORECASE),), "Activities Of Head Offices"),
+    ("a restaurant", (compile(r"Restaurant"),), "Restaurants"),
+    ("an investment company", (compile(r"investment", IGNORECASE), compile(r"companies", IGNORECASE)), "Investment Companies"),
+    ("real estate", (compile(r"real estate", IGNORECASE),), "Real Estate Activities"),
+    ("a management company", (compile(r"Holding"),), "Management Companies"),
+    ("other business support activities", (compile(r"Other Business Support Service Activities"),), "Other Business Support Service Activities"),
+    ("a freight transportation company", (compile(r"Freight Transport"),), "Freight Transport"),
+    ("a motor vehicle contractor", (compile(r"Contractor"), compile(r"Motor")), "Motor Vehicles Rental"),
+    ("a passenger car rental company", (compile(r"Renting"), compile(r"Car")), "Motor Vehicles Rental"),
+    ("a pre-primary school", (compile(r"Pre"), compile(r"Primary")), "Pre-Primary Education"),
+    ("a frozen products retailer", (compile(r"Retail"), compile(r"Poultry")), "Retail Sale of Frozen Products"),
+    ("other tourism reservation activities", (compile(r"Other"), compile(r"Tourism")), "Other Tourism Reservation Services"),
+    ("a clothing retailer", (compile(r"retail", IGNORECASE), compile(r"clothing", IGNORECASE)), "Retail Sale Of Clothing"),
+    ("a hardware retailer", (compile(r"Retail"), compile(r"Hardware")), "Retail Sale Of Hardware"),
+    ("a bread manufacturer", (compile(r"Manufacture"), compile(r"Bread")), "Manufacture Of Bread"),
+    ("a repairer of electrical equipment", (compile(r"Repair"), compile(r"Electrical"), compile(r"Equipment")), "Repair Of Electrical Equipment"),
+    ("a photographer", (compile(r"Photograph"),), "Photo And Video Editing"),
+    ("residential nursing care activities", (compile(r"Residential"), compile(r"Nursing")), "Residential Nursing Care Activities"),
+    ("construction of buildings", (compile(r"construction", IGNORECASE), compile(r"building", IGNORECASE)), "Construction Of Buildings"),
+    ("development of buildings", (compile(r"development", IGNORECASE), compile(r"building", IGNORECASE)), "Construction Of Buildings"),
+    ("planting and establishing of crops", (compile(r"planting", IGNORECASE), compile(r"crops", IGNORECASE)), "Planting And Establishing Of Crops"),
+    ("packaging activities", (compile(r"packaging", IGNORECASE),), "Packaging Activities"),
+    ("event catering", (compile(r"event catering", IGNORECASE),), "Event Catering")
+)
+"""
+The ordered rules of the natures of the businesses.  A rule
+matches a nature when all of its patterns are found in it and
+the nature is then replaced by the nature of the rule, or the
+matching text is removed from the nature when the rule does
+not have one.  The rules are applied in their order.
+"""
+
+
+@lru_cache(maxsize=65536)
+def formatAddress(address: str) -> str:
+    """
+    Removing the redundant spaces of an address and capitalizing
+    its words.
+
+    Parameters:
+        address (str): The address to be formatted.
+
+    Returns:
+        str
+    """
+    return " ".join([value for value in address.split(" ") if value != ""]).title()
+
+
+@lru_cache(maxsize=65536)
+def formatRegisteredAddress(registered_address: str) -> str:
+    """
+    Applying the replacements of the registered addresses in
+    their order.  The substrings to be replaced anywhere are in
+    lowercase, so that they are only found in the address when
+    they are found in its lowercase version as well.
+
+    Parameters:
+        registered_address (str): The registered address to be formatted.
+
+    Returns:
+        str
+    """
+    for current, new, is_start in registered_address_replacements:
+        if is_start and registered_address.startswith(current):
+            registered_address = registered_address.replace(current, new, 1)
+        if not is_start:
+            registered_address = registered_address.replace(current, new)
+    return registered_address
+
+
+@lru_cache(maxsize=65536)
+def sanitizeErroneousAddress(address: str) -> str:
+    """
+    Removing the numbers and the stop words from an address in a
+    single pass over its words.
+
+    Parameters:
+        address (str): The address to be sanitized.
+
+    Returns:
+        str
+    """
+    return " ".join([value.capitalize() for value in address.split(" ") if value != "" and digit_pattern.search(value) == None and value not in address_stop_words])
+
+
+def hasKeywords(value: Union[str, None], keywords: Tuple[str, ...], exclusions: Tuple[str, ...]) -> bool:
+    """
+    Verifying that a value contains one of the keywords and none
+    of the exclusions, regardless of the case.
+
+    Parameters:
+        value (Union[str, None]): The value to be verified.
+        keywords (Tuple[str, ...]): The keywords of which one has to be found.
+        exclusions (Tuple[str, ...]): The keywords of which none has to be found.
+
+    Returns:
+        bool
+    """
+    if value == None:
+        return False
+    lowered: str = value.lower()
+    return any(keyword in lowered for keyword in keywords) and not any(exclusion in lowered for exclusion in exclusions)
+
+
 class Builder:
     """
     The builder which will build the database.
@@ -62,7 +225,7 @@ class Builder:
     The main web-scrapper which will scrape the data from the
     database needed.
     """
-    __Database_Handler: Database_Handler
+    __Database_Handler: Union[Database_Handler, None] = None
     """
     The database handler that will communicate with the database
     server.
@@ -81,54 +244,59 @@ class Builder:
     information which allows the application to operate
     smoothly.
     """
-    __financial_calendar: Financial_Calendar
+    __financial_calendar: Union[Financial_Calendar, None] = None
     """
     The model which will interact exclusively with the Financial
     Calendar.
     """
-    __fincorp_logs: FinCorp_Logs
+    __fincorp_logs: Union[FinCorp_Logs, None] = None
     """
     The model which will interact exclusively with the FinCorp
     Logs.
     """
-    __company_details: Company_Details
+    __company_details: Union[Company_Details, None] = None
     """
     The model which will interact exclusively with the Company
     Details.
     """
-    __document_files: Document_Files
+    __document_files: Union[Document_Files, None] = None
     """
     The model which will interact exclusively with the Document
     Files table.
     """
-    __document_reader: Document_Reader
+    __write_behind_buffer: Union[Write_Behind_Buffer, None] = None
+    """
+    The buffer which accumulates the rows of the child tables of
+    the corporate registry being stored.
+    """
+    __document_reader: Union[Document_Reader, None] = None
     """
     The model needed to generate the portable document file
     version of the corporate registry, as well as extracting the
     data from it before deleting it from the cache of the server
     of the application.
     """
-    __business_details: Business_Details
+    __business_details: Union[Business_Details, None] = None
     """
     The model which will interact exclusively with the Business
     Details.
     """
-    __state_capital: State_Capital
+    __state_capital: Union[State_Capital, None] = None
     """
     The model which will interact exclusively with the State
     Capital.
     """
-    __office_bearers: Office_Bearers
+    __office_bearers: Union[Office_Bearers, None] = None
     """
     The model which will interact exclusively with the Office
     Bearers.
     """
-    __shareholders: Shareholders
+    __shareholders: Union[Shareholders, None] = None
     """
     The model which will interact exclusively with the
     Shareholders.
     """
-    __members: Member_Model
+    __members: Union[Member_Model, None] = None
     """
     The model which will interact exclusively with the Members.
     """
@@ -145,76 +313,80 @@ class Builder:
     """
     The data of the Company Details.
     """
+    __company_details_index: Dict[int, CompanyDetails]
+    """
+    The data of the Company Details indexed by their identifiers.
+    """
     __state_capital_data: List[StateCapital]
     """
     The Data Transfer Object for the State Capital.
     """
-    __financial_summaries: Financial_Summaries
+    __financial_summaries: Union[Financial_Summaries, None] = None
     """
     The model which will interact exclusively with the Financial
     Summaries table.
     """
-    __profit_statements: Profit_Statements
+    __profit_statements: Union[Profit_Statements, None] = None
     """
     The model which will interact exclusively with the Profit
     Statements table.
     """
-    __balance_sheets: Balance_Sheets
+    __balance_sheets: Union[Balance_Sheets, None] = None
     """
     The model which will interact exclusively with the Balance
     Sheets table.
     """
-    __assets: Assets_Model
+    __assets: Union[Assets_Model, None] = None
     """
     The model which will interact exclusively with the Assets
     table.
     """
-    __non_current_assets: Non_Current_Assets
+    __non_current_assets: Union[Non_Current_Assets, None] = None
     """
     The model which will interact exclusively with the Non
     Current Assets table.
     """
-    __current_assets: Current_Assets
+    __current_assets: Union[Current_Assets, None] = None
     """
     The model which will interact exclusively with the Current
     Assets table.
     """
-    __liabilities: Liabilities_Model
+    __liabilities: Union[Liabilities_Model, None] = None
     """
     The model which will interact exclusively with the
     Liabilities table.
     """
-    __equity_and_liabilities: Equity_And_Liabilities
+    __equity_and_liabilities: Union[Equity_And_Liabilities, None] = None
     """
     The model which will interact exclusively with the Equity
     And Liabilities table.
     """
-    __non_current_liabilities: Non_Current_Liabilities
+    __non_current_liabilities: Union[Non_Current_Liabilities, None] = None
     """
     The model which will interact exclusively with the Non
     Current Liabilities table.
     """
-    __current_liabilities: Current_Liabilities
+    __current_liabilities: Union[Current_Liabilities, None] = None
     """
     The model which will interact exclusively with the Current
     Liabilities table.
     """
-    __annual_returns: Annual_Returns
+    __annual_returns: Union[Annual_Returns, None] = None
     """
     The model which will interact exclusively with the Annual
     Returns table.
     """
-    __objections: Objections
+    __objections: Union[Objections, None] = None
     """
     The model which will interact exclusively with the
     Objections table.
     """
-    __details: Details
+    __details: Union[Details, None] = None
     """
     The model which will interact exclusively with the Details
     table.
     """
-    __charges: Charges
+    __charges: Union[Charges, None] = None
     """
     The model which will interact exclusively with the Charges
     table.
@@ -234,37 +406,14 @@ class Builder:
 
     def __init__(self) -> None:
         """
-        Initializing the builder which will import and initialize
-        the dependencies.
+        Initializing the builder which will import the
+        dependencies.  The models are only initialized on their
+        first use, so that each pipeline stage only pays for the
+        models it needs.
         """
         self.ENV = Environment()
         self.setLogger(Corporate_Database_Builder_Logger())
-        self.setDatabaseHandler(Database_Handler())
-        self.setFinancialCalendar(Financial_Calendar())
-        self.setFinCorpLogs(FinCorp_Logs())
-        self.setCompanyDetails(Company_Details())
-        self.setDocumentFiles(Document_Files())
-        self.setDocumentReader(Document_Reader())
-        self.setBusinessDetails(Business_Details())
-        self.setStateCapital(State_Capital())
-        self.setOfficeBearers(Office_Bearers())
-        self.setShareholders(Shareholders())
-        self.setMembers(Member_Model())
-        self.setFinancialSummaries(Financial_Summaries())
-        self.setProfitStatements(Profit_Statements())
-        self.setBalanceSheets(Balance_Sheets())
-        self.setAssets(Assets_Model())
-        self.setNonCurrentAssets(Non_Current_Assets())
-        self.setCurrentAssets(Current_Assets())
-        self.setLiabilities(Liabilities_Model())
-        self.setEquityAndLiabilities(Equity_And_Liabilities())
-        self.setNonCurrentLiabilities(Non_Current_Liabilities())
-        self.setCurrentLiabilities(Current_Liabilities())
-        self.setAnnualReturns(Annual_Returns())
-        self.setObjections(Objections())
-        self.setDetails(Details())
-        self.setCharges(Charges())
-        self.getLogger().inform("The builder has been initialized and all of its dependencies are injected!")
+        self.getLogger().inform("The builder has been initialized and its dependencies will be injected on their first use!")
 
     def getMemberData(self) -> List[Member]:
         return self.__member_data
@@ -285,85 +434,113 @@ class Builder:
         self.__office_bearer_data = office_bearer_data
 
     def getCharges(self) -> Charges:
-        return self.__charges
+        if self.__charges is None:
+            self.setCharges(Charges())
+        return self.__charges # type: ignore
 
     def setCharges(self, charges: Charges) -> None:
         self.__charges = charges
 
     def getDetails(self) -> Details:
-        return self.__details
+        if self.__details is None:
+            self.setDetails(Details())
+        return self.__details # type: ignore
 
     def setDetails(self, details: Details) -> None:
         self.__details = details
 
     def getObjections(self) -> Objections:
-        return self.__objections
+        if self.__objections is None:
+            self.setObjections(Objections())
+        return self.__objections # type: ignore
 
     def setObjections(self, objections: Objections) -> None:
         self.__objections = objections
 
     def getAnnualReturns(self) -> Annual_Returns:
-        return self.__annual_returns
+        if self.__annual_returns is None:
+            self.setAnnualReturns(Annual_Returns())
+        return self.__annual_returns # type: ignore
 
     def setAnnualReturns(self, annual_returns: Annual_Returns) -> None:
         self.__annual_returns = annual_returns
 
     def getCurrentLiabilities(self) -> Current_Liabilities:
-        return self.__current_liabilities
+        if self.__current_liabilities is None:
+            self.setCurrentLiabilities(Current_Liabilities())
+        return self.__current_liabilities # type: ignore
 
     def setCurrentLiabilities(self, current_liabilities: Current_Liabilities) -> None:
         self.__current_liabilities = current_liabilities
 
     def getNonCurrentLiabilities(self) -> Non_Current_Liabilities:
-        return self.__non_current_liabilities
+        if self.__non_current_liabilities is None:
+            self.setNonCurrentLiabilities(Non_Current_Liabilities())
+        return self.__non_current_liabilities # type: ignore
 
     def setNonCurrentLiabilities(self, non_current_liabilities: Non_Current_Liabilities) -> None:
         self.__non_current_liabilities = non_current_liabilities
 
     def getEquityAndLiabilities(self) -> Equity_And_Liabilities:
-        return self.__equity_and_liabilities
+        if self.__equity_and_liabilities is None:
+            self.setEquityAndLiabilities(Equity_And_Liabilities())
+        return self.__equity_and_liabilities # type: ignore
 
     def setEquityAndLiabilities(self, equity_and_liabilities: Equity_And_Liabilities) -> None:
         self.__equity_and_liabilities = equity_and_liabilities
 
     def getLiabilities(self) -> Liabilities_Model:
-        return self.__liabilities
+        if self.__liabilities is None:
+            self.setLiabilities(Liabilities_Model())
+        return self.__liabilities # type: ignore
 
     def setLiabilities(self, liabilities: Liabilities_Model) -> None:
         self.__liabilities = liabilities
 
     def getCurrentAssets(self) -> Current_Assets:
-        return self.__current_assets
+        if self.__current_assets is None:
+            self.setCurrentAssets(Current_Assets())
+        return self.__current_assets # type: ignore
 
     def setCurrentAssets(self, current_assets: Current_Assets) -> None:
         self.__current_assets = current_assets
 
     def getNonCurrentAssets(self) -> Non_Current_Assets:
-        return self.__non_current_assets
+        if self.__non_current_assets is None:
+            self.setNonCurrentAssets(Non_Current_Assets())
+        return self.__non_current_assets # type: ignore
 
     def setNonCurrentAssets(self, non_current_assets: Non_Current_Assets) -> None:
         self.__non_current_assets = non_current_assets
 
     def getAssets(self) -> Assets_Model:
-        return self.__assets
+        if self.__assets is None:
+            self.setAssets(Assets_Model())
+        return self.__assets # type: ignore
 
     def setAssets(self, assets: Assets_Model) -> None:
         self.__assets = assets
 
     def getBalanceSheets(self) -> Balance_Sheets:
-        return self.__balance_sheets
+        if self.__balance_sheets is None:
+            self.setBalanceSheets(Balance_Sheets())
+        return self.__balance_sheets # type: ignore
 
     def setBalanceSheets(self, balance_sheets: Balance_Sheets) -> None:
         self.__balance_sheets = balance_sheets
 
     def getProfitStatements(self) -> Profit_Statements:
-        return self.__profit_statements
+        if self.__profit_statements is None:
+            self.setProfitStatements(Profit_Statements())
+        return self.__profit_statements # type: ignore
 
     def setProfitStatements(self, profit_statements: Profit_Statements) -> None:
         self.__profit_statements = profit_statements
 
     def getFinancialSummaries(self) -> Financial_Summaries:
-        return self.__financial_summaries
+        if self.__financial_summaries is None:
+            self.setFinancialSummaries(Financial_Summaries())
+        return self.__financial_summaries # type: ignore
 
     def setFinancialSummaries(self, financial_summaries: Financial_Summaries) -> None:
         self.__financial_summaries = financial_summaries
@@ -380,6 +557,12 @@ class Builder:
     def setCompanyDetailsData(self, company_details_data: List[CompanyDetails]) -> None:
         self.__company_details_data = company_details_data
 
+    def getCompanyDetailsIndex(self) -> Dict[int, CompanyDetails]:
+        return self.__company_details_index
+
+    def setCompanyDetailsIndex(self, company_details_index: Dict[int, CompanyDetails]) -> None:
+        self.__company_details_index = company_details_index
+
     def getBusinessDetailsData(self) -> List[BusinessDetails]:
         return self.__business_details_data
 
@@ -393,7 +576,9 @@ class Builder:
         self.__crawler = crawler
 
     def getDatabaseHandler(self) -> Database_Handler:
-        return self.__Database_Handler
+        if self.__Database_Handler is None:
+            self.setDatabaseHandler(Database_Handler())
+        return self.__Database_Handler # type: ignore
 
     def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
         self.__Database_Handler = database_handler
@@ -411,61 +596,89 @@ class Builder:
         self.__data = data
 
     def getFinancialCalendar(self) -> Financial_Calendar:
-        return self.__financial_calendar
+        if self.__financial_calendar is None:
+            self.setFinancialCalendar(Financial_Calendar())
+        return self.__financial_calendar # type: ignore
 
     def setFinancialCalendar(self, financial_calendar: Financial_Calendar) -> None:
         self.__financial_calendar = financial_calendar
 
     def getFinCorpLogs(self) -> FinCorp_Logs:
-        return self.__fincorp_logs
+        if self.__fincorp_logs is None:
+            self.setFinCorpLogs(FinCorp_Logs())
+        return self.__fincorp_logs # type: ignore
 
     def setFinCorpLogs(self, fincorp_logs: FinCorp_Logs) -> None:
         self.__fincorp_logs = fincorp_logs
 
     def getCompanyDetails(self) -> Company_Details:
-        return self.__company_details
+        if self.__company_details is None:
+            self.setCompanyDetails(Company_Details())
+        return self.__company_details # type: ignore
 
     def setCompanyDetails(self, company_details: Company_Details) -> None:
         self.__company_details = company_details
 
     def getDocumentFiles(self) -> Document_Files:
-        return self.__document_files
+        if self.__document_files is None:
+            self.setDocumentFiles(Document_Files())
+        return self.__document_files # type: ignore
 
     def setDocumentFiles(self, document_files: Document_Files) -> None:
         self.__document_files = document_files
 
+    def getWriteBehindBuffer(self) -> Write_Behind_Buffer:
+        if self.__write_behind_buffer is None:
+            self.setWriteBehindBuffer(Write_Behind_Buffer())
+        return self.__write_behind_buffer # type: ignore
+
+    def setWriteBehindBuffer(self, write_behind_buffer: Write_Behind_Buffer) -> None:
+        self.__write_behind_buffer = write_behind_buffer
+
     def getDocumentReader(self) -> Document_Reader:
-        return self.__document_reader
+        if self.__document_reader is None:
+            self.setDocumentReader(Document_Reader())
+        return self.__document_reader # type: ignore
 
     def setDocumentReader(self, document_reader: Document_Reader) -> None:
         self.__document_reader = document_reader
 
     def getBusinessDetails(self) -> Business_Details:
-        return self.__business_details
+        if self.__business_details is None:
+            self.setBusinessDetails(Business_Details())
+        return self.__business_details # type: ignore
 
     def setBusinessDetails(self, business_details: Business_Details) -> None:
         self.__business_details = business_details
 
     def getStateCapital(self) -> State_Capital:
-        return self.__state_capital
+        if self.__state_capital is None:
+            self.setStateCapital(State_Capital())
+        return self.__state_capital # type: ignore
 
     def setStateCapital(self, state_capital: State_Capital) -> None:
         self.__state_capital = state_capital
 
     def getOfficeBearers(self) -> Office_Bearers:
-        return self.__office_bearers
+        if self.__office_bearers is None:
+            self.setOfficeBearers(Office_Bearers())
+        return self.__office_bearers # type: ignore
 
     def setOfficeBearers(self, office_bearers: Office_Bearers) -> None:
         self.__office_bearers = office_bearers
 
     def getShareholders(self) -> Shareholders:
-        return self.__shareholders
+        if self.__shareholders is None:
+            self.setShareholders(Shareholders())
+        return self.__shareholders # type: ignore
 
     def setShareholders(self, shareholders: Shareholders) -> None:
         self.__shareholders = shareholders
 
     def getMembers(self) -> Member_Model:
-        return self.__members
+        if self.__members is None:
+            self.setMembers(Member_Model())
+        return self.__members # type: ignore
 
     def setMembers(self, members: Member_Model) -> None:
         self.__members = members
@@ -562,7 +775,7 @@ class Builder:
         """
         return datetime.strftime(datetime.strptime(quarter.start_date, "%m/%d/%Y"), "%Y-%m-%d") if len(fin_corp_logs) == 1 and fin_corp_logs[0].status == 204 else self.getDateExtractCorporateData(fin_corp_logs)
 
-    def extractCorporateData(self, status: int = 200) -> None:
+    def extractCorporateData(self, status: int = 200, workers: int = 1, debug_mode: bool = False) -> None:
         """
         The third run consists of extracting the data from the
         corporate document files that are stored in the corporate
@@ -570,22 +783,26 @@ class Builder:
 
         Parameters:
             status: int: The response status of the function.
+            workers: int: The amount of worker processes extracting the corporate registries.  A single worker extracts them in the current process.
+            debug_mode: bool: Whether the portable document files and the extracted data are written into the cache directory.
 
         Returns:
             void
         """
+        self.getDocumentReader().setDebugMode(debug_mode)
         quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
         successful_logs: List[FinCorpLogs] = self.getFinCorpLogs().getSuccessfulRunsLogs("extractCorporateData")
         date: str = self._getDateExtractCorporateData(successful_logs, quarter)
-        document_files: List[DocumentFiles] = self.getDocumentFiles().getCorporateRegistries(date)
-        amount: int = self.getDocumentFiles().getAmount(date)
-        amount_found: int = self.getDocumentFiles().getAmountFound(date)
+        document_files: Iterator[DocumentFiles] = self.getDocumentFiles().iterCorporateRegistries(date)
+        statistics: Dict[str, int] = self.getCompanyDetails().getRunStatistics(date)
+        amount: int = statistics["amount_downloaded"]
+        amount_found: int = statistics["amount_found"]
         status = status if amount > 0 else 204
         response: int = status
         self.getLogger().inform(f"The corporate registries have been retrieved from the relational database server and they will be used for the extracttion of the data about the companies.\nDate of Incorporation: {date}\nCorporate Registries Amount: {amount}\nAmount Downloaded: {amount_found}")
         if status == 200:
-            response = self._extractCorporateData(document_files)
-            amount_extracted = self.getCompanyDetails().getAmountExtracted(date)
+            response = self._extractCorporateData(document_files, workers)
+            amount_extracted = self.getCompanyDetails().getRunStatistics(date)["amount_extracted"]
             final_amount = amount_extracted
         else:
             final_amount = amount_found
@@ -612,13 +829,17 @@ class Builder:
         for index in range(0, len(data), 1):
             os.remove(f"{data_directory}{data[index]}")
 
-    def _extractCorporateData(self, document_files: List[DocumentFiles]) -> int:
+    def _extractCorporateData(self, document_files: Iterable[DocumentFiles], workers: int = 1) -> int:
         """
         Extracting the corporate data as well as storing it in the
-        relational database server.
+        relational database server.  The corporate registries are
+        consumed one at a time and the write-behind buffer is
+        flushed once they are all stored, even if the extraction has
+        been interrupted.
 
         Parameters:
-            document_files: [{identifier: int, file_data: bytes, company_detail: int}]: The list of corporate registries.
+            document_files: [{identifier: int, file_data: bytes, company_detail: int}]: The corporate registries.
+            workers: int: The amount of worker processes extracting the corporate registries.
 
         Returns:
             int
@@ -626,11 +847,15 @@ class Builder:
         data_manipulations: List[int] = []
         ok: int = 200
         service_unavailable: int = 503
-        for index in range(0, len(document_files), 1):
-            company_detail: CompanyDetails = self.getCompanyDetails().getSpecificCompanyDetails(document_files[index].company_detail)
-            file_generation_status: int = self.getDocumentReader().generatePortableDocumentFile(document_files[index])
-            data_extraction: Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None] = self.getDocumentReader().extractData(file_generation_status, document_files[index], company_detail)
-            data_manipulations.append(self.storeCorporateData(data_extraction, document_files[index], company_detail))
+        try:
+            if workers > 1:
+                data_manipulations = self._extractCorporateDataInParallel(document_files, workers)
+            else:
+                data_manipulations = self._extractCorporateDataSequentially(document_files)
+        finally:
+            flush: int = self.getWriteBehindBuffer().flush()
+            if flush == service_unavailable:
+                data_manipulations.append(flush)
         data_manipulations = list(set(data_manipulations))
         if len(data_manipulations) == 1 and data_manipulations[0] == 201:
             self.getLogger().inform(f"The corporate data has been extracted successfully and stored into the relational database server.\nStatus: {ok}")
@@ -638,6 +863,141 @@ class Builder:
         self.getLogger().error(f"The corporate data has been extracted successfully and stored into the relational database server.\nStatus: {service_unavailable}")
         return service_unavailable
 
+    def _extractCorporateDataInParallel(self, document_files: Iterable[DocumentFiles], workers: int) -> List[int]:
+        """
+        Extracting the corporate data in a pool of worker processes
+        while the current process is the only one storing it in the
+        relational database server.  The results are stored in the
+        order of the corporate registries and at most two corporate
+        registries per worker are in flight at a time.
+
+        Parameters:
+            document_files: [{identifier: int, file_data: bytes, company_detail: int}]: The corporate registries.
+            workers: int: The amount of worker processes.
+
+        Returns:
+            [int]
+        """
+        data_manipulations: List[int] = []
+        extractions: Deque[Tuple[DocumentFiles, CompanyDetails, Future]] = deque()
+        corporate_registries: Iterator[DocumentFiles] = iter(document_files)
+        self.getLogger().inform(f"The corporate registries will be extracted in parallel.\nWorkers: {workers}")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            document_file: Union[DocumentFiles, None] = self.__getNextCorporateRegistry(corporate_registries, data_manipulations)
+            while document_file is not None:
+                try:
+                    company_detail: CompanyDetails = self.getCompanyDetails().getSpecificCompanyDetails(document_file.company_detail)
+                    extractions.append((document_file, company_detail, executor.submit(Document_Reader.extractDataInProcess, document_file, company_detail, self.getDocumentReader().getDebugMode())))
+                except Error as error:
+                    data_manipulations.append(self.__handleCorporateRegistryError(document_file, error))
+                if len(extractions) >= workers * 2:
+                    data_manipulations.append(self.__storeExtractedCorporateData(*extractions.popleft()))
+                document_file = self.__getNextCorporateRegistry(corporate_registries, data_manipulations)
+            while extractions:
+                data_manipulations.append(self.__storeExtractedCorporateData(*extractions.popleft()))
+        return data_manipulations
+
+    def __storeExtractedCorporateData(self, document_file: DocumentFiles, company_detail: CompanyDetails, extraction: Future) -> int:
+        """
+        Storing the corporate data once its extraction by a worker
+        process is completed.  A failed extraction is only failing
+        its own corporate registry, so that the other extractions in
+        flight are still stored.
+
+        Parameters:
+            document_file: {identifier: int, file_data: bytes, company_detail: int}: The corporate registry.
+            company_detail: {identifier: int, business_registration_number: string, name: string, file_number: string, category: string, date_incorporation: int, nature: string, status: string, date_verified: int, is_extracted: int, company_identifier: int, company_type: string}: The data of the Company Details.
+            extraction: Future: The extraction of the corporate registry.
+
+        Returns:
+            int
+        """
+        service_unavailable: int = 503
+        try:
+            data_extraction = extraction.result()
+        except Exception as error:
+            self.getLogger().error(f"The extraction of the corporate registry has failed in the worker process.\nStatus: {service_unavailable}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}\nError: {error!r}")
+            return service_unavailable
+        return self.storeCorporateData(data_extraction, document_file, company_detail)
+
+    def _extractCorporateDataSequentially(self, document_files: Iterable[DocumentFiles]) -> List[int]:
+        """
+        Extracting the corporate data as well as storing it in the
+        relational database server in the current process.
+
+        Parameters:
+            document_files: [{identifier: int, file_data: bytes, company_detail: int}]: The corporate registries.
+
+        Returns:
+            [int]
+        """
+        data_manipulations: List[int] = []
+        corporate_registries: Iterator[DocumentFiles] = iter(document_files)
+        document_file: Union[DocumentFiles, None] = self.__getNextCorporateRegistry(corporate_registries, data_manipulations)
+        while document_file is not None:
+            try:
+                company_detail: CompanyDetails = self.getCompanyDetails().getSpecificCompanyDetails(document_file.company_detail)
+                file_generation_status: int = self.getDocumentReader().generatePortableDocumentFile(document_file)
+                data_extraction: Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None] = self.getDocumentReader().extractData(file_generation_status, document_file, company_detail)
+                data_manipulations.append(self.storeCorporateData(data_extraction, document_file, company_detail))
+            except Error as error:
+                data_manipulations.append(self.__handleCorporateRegistryError(document_file, error))
+            document_file = self.__getNextCorporateRegistry(corporate_registries, data_manipulations)
+        return data_manipulations
+
+    def __getNextCorporateRegistry(self, corporate_registries: Iterator[DocumentFiles], data_manipulations: List[int]) -> Union[DocumentFiles, None]:
+        """
+        Retrieving the next corporate registry of the stream.  Only
+        a failure of the stream itself ends it, so that a failure
+        while storing a corporate registry does not abandon the
+        remaining ones.
+
+        Parameters:
+            corporate_registries: Iterator[DocumentFiles]: The stream of the corporate registries.
+            data_manipulations: [int]: The statuses of the data manipulations, to which the failure of the stream is added.
+
+        Returns:
+            {identifier: int, file_data: bytes, company_detail: int}|null
+        """
+        try:
+            return next(corporate_registries, None)
+        except Error as error:
+            data_manipulations.append(self.__handleCorporateRegistriesStreamError(error))
+            return None
+
+    def __handleCorporateRegistryError(self, document_file: DocumentFiles, error: Error) -> int:
+        """
+        Handling the failure of a single corporate registry, which
+        is extracted again in the next run while the other ones are
+        still extracted.
+
+        Parameters:
+            document_file: {identifier: int, file_data: bytes, company_detail: int}: The corporate registry.
+            error: Error: The error raised while extracting or storing it.
+
+        Returns:
+            int
+        """
+        service_unavailable: int = 503
+        self.getLogger().error(f"The corporate registry cannot be extracted.  It will be extracted in the next run.\nStatus: {service_unavailable}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}\nError: {error}")
+        return service_unavailable
+
+    def __handleCorporateRegistriesStreamError(self, error: Error) -> int:
+        """
+        Handling the failure of the stream of the corporate
+        registries, so that the run is not reported as successful
+        when only part of the corporate registries are extracted.
+
+        Parameters:
+            error: Error: The error raised by the stream.
+
+        Returns:
+            int
+        """
+        service_unavailable: int = 503
+        self.getLogger().error(f"The corporate registries cannot be streamed from the relational database server.  The remaining corporate registries will be extracted in the next run.\nStatus: {service_unavailable}\nError: {error}")
+        return service_unavailable
+
     def _storeCorporateData(self, dataset: Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None], document_file: DocumentFiles, company_detail: CompanyDetails) -> int:
         """
         Storing the corporate data that is extracted from the
@@ -669,7 +1029,23 @@ class Builder:
     def storeCorporateData(self, dataset: Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None], document_file: DocumentFiles, company_detail: CompanyDetails) -> int:
         """
         Storing the corporate data that is extracted from the
-        corporate registry.
+        corporate registry.  All of its writes are grouped into a
+        single unit of work which is committed once the corporate
+        registry is stored and rolled back otherwise.  It is nested
+        into the unit of work of the group of corporate registries
+        of the write-behind buffer, so that a corporate registry
+        which cannot be stored only fails its own statements.  The
+        rows of its child tables are staged in the write-behind
+        buffer and are pending once it is stored, until the buffer
+        is flushed along with the rows of the other corporate
+        registries of the group and the companies of the group are
+        marked as extracted, so that a company whose rows are
+        committed is always marked as extracted.  A flush which
+        fails rolls back the whole group.  A corporate registry which
+        is rejected without any of its statements failing, such as
+        one of a category which is not supported, would be rejected
+        on every run, so its company is marked as failed instead of
+        being extracted again.
 
         Parameters:
             dataset: {status: int, company_details: {business_registration_number: string, name: string, file_number: string, category: string, date_incorporation: int, nature: string, status: string}, business_details: {registered_address: string, name: string, nature: string, operational: string}, certificates: [{certificate: string, type: str, date_effective: int, date_expiry: int}], office_bearers: [{position: string, name: string, address: string, date_appointment: int}], shareholders: [{name: string, amount: int, type: string, currency: string}], members: [{name: string, amount: int, date_start: int, currency: string}], annual_return: [{date_annual_return: int, date_annual_meeting: int, date_filled: int}], financial_summaries: [{financial_year: int, currency: string, date_approved: int, unit: int}], profit_statement: {financial_summary: {financial_year: int, currency: string, date_approved: int, unit: int}, turnover: float, cost_of_sales: float, gross_profit: float, other_income: float, distribution_cost: float, administration_cost: float, expenses: float, finance_cost: float, net_profit_before_taxation: float, taxation: float, net_profit: float}, state_capital: {type: string, amount: int, currency: string, state_capital: int, amount_unpaid: int, par_value: int}, balance_sheet: {balance_sheet: {financial_year: int, currency: string, unit: int}, assets: {non_current_assets: {property_plant_equipment: float, investment_properties: float, intangible_assets: float, other_investments: float, subsidiaries_investments: float, biological_assets: float, others: float, total: float}, current_assets: {inventories: float, trade: float, cash: float, others: float, total: float}, total: float}, liabilities: {equity_and_liabilities: {share_capital: float, other_reserves: float, retained_earnings: float, others: float, total: float}, non_current: {long_term_borrowings: float, deferred_tax: float, long_term_provisions: float, others: float, total: float}, current: {trade: float, short_term_borrowings: float, current_tax_payable: float, short_term_provisions: float, others: float, total: float}, total_liabilities: float, total_equity_and_liabilities: float}}, charges: [{volume: int, property: string, nature: string, amount: int, date_charged: int, date_filled: int, currency: string}], liquidators: {liquidator: {name: string, appointed_date: int, address: string}, affidavits: [{date_filled: int, date_from: int, date_to: int}]}, receivers: {receiver: {name: string, date_appointed: int, address: string}, reports: [{date_filled: int, date_from: int, date_to: int}], affidavits: [{date_filled: int, date_from: int, date_to: int}]}, administrators: {administrator: {name: string, date_appointed: int, designation: string, address: string}, accounts: [{date_filled: int, date_from: int, date_to: int}]}, details: [{type: string, date_start: int, date_end: int, status: string}], objections: [{date_objection: int, objector: string}]}: The data that has been extracted from the corporate registry.
@@ -680,8 +1056,34 @@ class Builder:
             int
         """
         created: int = 201
-        response: int = self._storeCorporateData(dataset, document_file, company_detail)
-        return created if response >= 200 and response <= 299 else response
+        no_content: int = 204
+        service_unavailable: int = 503
+        response: int
+        is_rejected: bool = False
+        try:
+            self.getWriteBehindBuffer().open()
+            with self.getDatabaseHandler().unitOfWork():
+                response = self._storeCorporateData(dataset, document_file, company_detail)
+                if response < 200 or response > 299:
+                    is_rejected = not self.getDatabaseHandler().isUnitOfWorkFailed()
+                    self.getDatabaseHandler().failUnitOfWork()
+            if is_rejected:
+                with self.getDatabaseHandler().unitOfWork():
+                    self.getCompanyDetails().failExtraction(document_file.company_detail)
+        except (RuntimeError, Error) as error:
+            self.getWriteBehindBuffer().rollback()
+            self.getLogger().error(f"The corporate data cannot be stored as its unit of work has failed.  The corporate registry will be extracted in the next run.\nStatus: {service_unavailable}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}\nError: {error}")
+            return service_unavailable
+        except BaseException:
+            self.getWriteBehindBuffer().rollback()
+            raise
+        if response >= 200 and response <= 299 and response != no_content:
+            self.getWriteBehindBuffer().commit(document_file.company_detail)
+        else:
+            self.getWriteBehindBuffer().rollback()
+        if self.getWriteBehindBuffer().isDue() and self.getWriteBehindBuffer().flush() == service_unavailable:
+            return service_unavailable
+        return created if response == no_content else response
 
     def storeCorporateDataForeignDomestic(self, dataset: Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], document_file: DocumentFiles) -> int:
         """
@@ -706,7 +1108,7 @@ class Builder:
             member_response: int = self.storeCorporateDataDomesticMembers(shareholder_response, dataset["members"], document_file) # type: ignore
             annual_return_response: int = self.storeCorporateDataDomesticAnnualReturn(member_response, dataset["annual_return"], document_file) # type: ignore
             financial_summary_response: int = self.storeCorporateDataDomesticFinancialSummary(annual_return_response, dataset["financial_summaries"], document_file) # type: ignore
-            profit_statement_response: int = self.storeCorporateDataDomesticProfitStatement(financial_summary_response, dataset["profit_statement"], document_file) # type: ignore
+            profit_statement_response: int = self.storeCorporateDataDomesticProfitStatement(financial_summary_response, dataset["profit_statement"], dataset["financial_summaries"], document_file) # type: ignore
             state_capital_response: int = self.storeCorporateDataDomesticStateCapital(profit_statement_response, dataset["state_capital"], document_file) # type: ignore
             balance_sheet_response: int = self.storeCorporateDataDomesticBalanceSheet(state_capital_response, dataset["balance_sheet"], document_file) # type: ignore
             charges_response: int = self.storeCorporateDataDomesticCharges(balance_sheet_response, dataset["charges"], document_file) # type: ignore
@@ -737,7 +1139,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299:
             response = self._storeCorporateDataForeignDomesticOfficeBearers(office_bearers, document_file)
-            self.getLogger().inform(f"The data has been successfully updated into the Office Bearers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {office_bearers}")
+            self.getLogger().inform(f"The data has been successfully updated into the Office Bearers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": office_bearers})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -800,7 +1202,7 @@ class Builder:
         response: int
         if status == 202:
             response = self._storeCorporateDataForeignDomesticBusinessDetails(business_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {business_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": business_details})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -825,7 +1227,7 @@ class Builder:
         responses = list(set(responses))
         if len(responses) == 1 and responses[0] == 201:
             response = 201
-            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {company_detail}\nData: {business_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {company_detail}", {"Data": business_details})
         else:
             response = 503
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {response}\nCompany Detail Identifier: {company_detail}")
@@ -891,7 +1293,7 @@ class Builder:
         """
         response: int
         date_verified: int = int(time())
-        is_extracted: int = 1
+        is_extracted: int = 0
         company_identifier: int = int("".join(findall(r"\d+", str(company_details["file_number"]))))
         company_type: str = "".join(findall(r"[A-Z]+", str(company_details["file_number"])))
         if status == 200:
@@ -900,7 +1302,7 @@ class Builder:
             company_details["company_identifier"] = company_identifier
             company_details["company_type"] = company_type
             response = self.getCompanyDetails().updateCorporateMetadataAuthorisedCompany(company_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {company_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": company_details})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -949,7 +1351,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not liquidators:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Liquidators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {liquidators}")
+            self.getLogger().inform(f"There is no data to be inserted into the Liquidators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": liquidators})
         elif status >= 200 and status <= 299 and len(liquidators) != 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Builder.storeCorporateDataDomesticLiquidators()")
             exit()
@@ -974,7 +1376,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not administrators:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Administrators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {administrators}")
+            self.getLogger().inform(f"There is no data to be inserted into the Administrators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": administrators})
         elif status >= 200 and status <= 299 and len(administrators) != 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Builder.storeCorporateDataDomesticAdministrators()")
             exit()
@@ -998,7 +1400,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not receivers:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Receivers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {receivers}")
+            self.getLogger().inform(f"There is no data to be inserted into the Receivers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": receivers})
         elif status >= 200 and status <= 299 and len(receivers) != 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Builder.storeCorporateDataDomesticReceivers()")
             exit()
@@ -1023,7 +1425,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299:
             response = self._storeCorporateDataAuthorisedCompanyOfficeBearers(office_bearers, document_file)
-            self.getLogger().inform(f"The data has been successfully updated into the Office Bearers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {office_bearers}")
+            self.getLogger().inform(f"The data has been successfully updated into the Office Bearers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": office_bearers})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1040,17 +1442,9 @@ class Builder:
         Returns:
             int
         """
-        response: int
-        responses: List[int] = []
-        for index in range(0, len(office_bearers), 1):
-            relational_database_response: int = self.getOfficeBearers().addDirectors(office_bearers[index], document_file.company_detail)
-            responses.append(relational_database_response)
-        responses = list(set(responses))
-        if len(responses) == 1 and responses[0] == 201:
-            response = 201
-        else:
-            response = 503
-        return response
+        if len(office_bearers) == 0:
+            return 503
+        return self.getOfficeBearers().addDirectorsBatch(office_bearers, document_file.company_detail, self.getWriteBehindBuffer())
 
     def storeCorporateDataAuthorisedCompanyBusinessDetails(self, status: int, business_details: Dict[str, str], document_file: DocumentFiles) -> int:
         """
@@ -1068,7 +1462,7 @@ class Builder:
         response: int
         if status == 202:
             response = self.getBusinessDetails().addBusinessDetailsAuthorisedCompany(business_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {business_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": business_details})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1089,7 +1483,7 @@ class Builder:
         """
         response: int
         date_verified: int = int(time())
-        is_extracted: int = 1
+        is_extracted: int = 0
         company_identifier: int = int("".join(findall(r"\d+", str(company_details["file_number"]))))
         company_type: str = "".join(findall(r"[A-Z]+", str(company_details["file_number"])))
         if status == 200:
@@ -1098,7 +1492,7 @@ class Builder:
             company_details["company_identifier"] = company_identifier
             company_details["company_type"] = company_type
             response = self.getCompanyDetails().updateCorporateMetadataAuthorisedCompany(company_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {company_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": company_details})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1152,7 +1546,7 @@ class Builder:
             member_response: int = self.storeCorporateDataDomesticMembers(shareholder_response, dataset["members"], document_file) # type: ignore
             annual_return_response: int = self.storeCorporateDataDomesticAnnualReturn(member_response, dataset["annual_return"], document_file) # type: ignore
             financial_summary_response: int = self.storeCorporateDataDomesticFinancialSummary(annual_return_response, dataset["financial_summaries"], document_file) # type: ignore
-            profit_statement_response: int = self.storeCorporateDataDomesticProfitStatement(financial_summary_response, dataset["profit_statement"], document_file) # type: ignore
+            profit_statement_response: int = self.storeCorporateDataDomesticProfitStatement(financial_summary_response, dataset["profit_statement"], dataset["financial_summaries"], document_file) # type: ignore
             state_capital_response: int = self.storeCorporateDataDomesticStateCapital(profit_statement_response, dataset["state_capital"], document_file) # type: ignore
             balance_sheet_response: int = self.storeCorporateDataDomesticBalanceSheet(state_capital_response, dataset["balance_sheet"], document_file) # type: ignore
             charges_response: int = self.storeCorporateDataDomesticCharges(balance_sheet_response, dataset["charges"], document_file) # type: ignore
@@ -1213,7 +1607,7 @@ class Builder:
         """
         response: int
         date_verified: int = int(time())
-        is_extracted: int = 1
+        is_extracted: int = 0
         company_identifier: int = int("".join(findall(r"\d+", str(company_details["file_number"]))))
         company_type: str = "".join(findall(r"[A-Z]+", str(company_details["file_number"])))
         if status == 200:
@@ -1222,7 +1616,7 @@ class Builder:
             company_details["company_identifier"] = company_identifier
             company_details["company_type"] = company_type
             response = self.getCompanyDetails().updateCorporateMetadataDomesticCivil(company_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {company_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": company_details})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1251,7 +1645,7 @@ class Builder:
             member_response: int = self.storeCorporateDataDomesticMembers(shareholder_response, dataset["members"], document_file) # type: ignore
             annual_return_response: int = self.storeCorporateDataDomesticAnnualReturn(member_response, dataset["annual_return"], document_file) # type: ignore
             financial_summary_response: int = self.storeCorporateDataDomesticFinancialSummary(annual_return_response, dataset["financial_summaries"], document_file) # type: ignore
-            profit_statement_response: int = self.storeCorporateDataDomesticProfitStatement(financial_summary_response, dataset["profit_statement"], document_file) # type: ignore
+            profit_statement_response: int = self.storeCorporateDataDomesticProfitStatement(financial_summary_response, dataset["profit_statement"], dataset["financial_summaries"], document_file) # type: ignore
             state_capital_response: int = self.storeCorporateDataDomesticStateCapital(profit_statement_response, dataset["state_capital"], document_file) # type: ignore
             balance_sheet_response: int = self.storeCorporateDataDomesticBalanceSheet(state_capital_response, dataset["balance_sheet"], document_file) # type: ignore
             charges_response: int = self.storeCorporateDataDomesticCharges(balance_sheet_response, dataset["charges"], document_file) # type: ignore
@@ -1282,14 +1676,14 @@ class Builder:
         service_unavailable: int = 503
         created: int = 201
         if status >= 200 and status <= 299 and len(objections) == 0:
-            self.getLogger().inform(f"There is no data to be inserted into the Objections table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {objections}")
+            self.getLogger().inform(f"There is no data to be inserted into the Objections table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": objections})
             return ok
         if status < 200 and status > 299:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {status}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return service_unavailable
         statuses: List[int] = list(set([self.getObjections().addObjection(objection, document_file.company_detail) for objection in objections]))
         response: int = created if len(statuses) == 1 and statuses[0] == created else service_unavailable
-        self.getLogger().inform(f"Data has been inserted into the Objections table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {objections}")
+        self.getLogger().inform(f"Data has been inserted into the Objections table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": objections})
         return response
 
     def storeCorporateDataDomesticDetails(self, status: int, details: List[Dict[str, Union[str, int, None]]], document_file: DocumentFiles) -> int:
@@ -1308,14 +1702,14 @@ class Builder:
         service_unavailable: int = 503
         created: int = 201
         if status >= 200 and status <= 299 and len(details) == 0:
-            self.getLogger().inform(f"There is no data to be inserted into the Details table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {details}")
+            self.getLogger().inform(f"There is no data to be inserted into the Details table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": details})
             return ok
         if status < 200 and status > 299:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {service_unavailable}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return service_unavailable
         statuses: List[int] = list(set([self.getDetails().addDetail(detail, document_file.company_detail) for detail in details]))
         response: int = created if len(statuses) == 1 and statuses[0] == created else service_unavailable
-        self.getLogger().inform(f"The data has been successfully inserted into the Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {details}")
+        self.getLogger().inform(f"The data has been successfully inserted into the Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": details})
         return response
 
     def storeCorporateDataDomesticAdministrators(self, status: int, administrators: Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], document_file: DocumentFiles) -> int:
@@ -1333,7 +1727,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not administrators:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Administrators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {administrators}")
+            self.getLogger().inform(f"There is no data to be inserted into the Administrators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": administrators})
         elif status >= 200 and status <= 299 and len(administrators) != 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Builder.storeCorporateDataDomesticAdministrators()")
             exit()
@@ -1357,7 +1751,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not receivers:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Receivers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {receivers}")
+            self.getLogger().inform(f"There is no data to be inserted into the Receivers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": receivers})
         elif status >= 200 and status <= 299 and len(receivers) != 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Builder.storeCorporateDataDomesticReceivers()")
             exit()
@@ -1381,7 +1775,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not liquidators:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Liquidators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {liquidators}")
+            self.getLogger().inform(f"There is no data to be inserted into the Liquidators table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": liquidators})
         elif status >= 200 and status <= 299 and len(liquidators) != 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Builder.storeCorporateDataDomesticLiquidators()")
             exit()
@@ -1404,16 +1798,14 @@ class Builder:
         """
         ok: int = 200
         service_unavailable: int = 503
-        created: int = 201
         if status >= 200 and status <= 299 and len(charges) == 0:
-            self.getLogger().inform(f"There is no data to be inserted into the Charges table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {charges}")
+            self.getLogger().inform(f"There is no data to be inserted into the Charges table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": charges})
             return ok
         if status < 200 and status > 299:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {service_unavailable}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return service_unavailable
-        statuses: List[int] = [self.getCharges().addCharge(charge, document_file.company_detail) for charge in charges]
-        response: int = created if len(statuses) == 1 and statuses[0] == created else service_unavailable
-        self.getLogger().inform(f"The data has been successfully inserted in the Charges table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {charges}")
+        response: int = self.getCharges().addChargesBatch(charges, document_file.company_detail, self.getWriteBehindBuffer())
+        self.getLogger().inform(f"The data has been successfully inserted in the Charges table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": charges})
         return response
 
     def storeCorporateDataDomesticBalanceSheet(self, status: int, balance_sheet: Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], document_file: DocumentFiles) -> int:
@@ -1436,48 +1828,48 @@ class Builder:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {status}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return status
         if status >= 200 and status <= 299 and not balance_sheet:
-            self.getLogger().inform(f"There is no data to be inserted into the Balance Sheet table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().inform(f"There is no data to be inserted into the Balance Sheet table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return ok
         if not balance_sheet:
             return status
-        response = self.getBalanceSheets().addBalanceSheet(balance_sheet["balance_sheet"], document_file.company_detail) # type: ignore
+        archived_balance_sheet: Dict[str, int] = self.getBalanceSheets().addBalanceSheet(balance_sheet["balance_sheet"], document_file.company_detail) # type: ignore
+        response = archived_balance_sheet["status"]
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the balance sheet into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the balance sheet into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        archived_balance_sheet: BalanceSheets = self.getBalanceSheets().getSpecific(document_file.company_detail, balance_sheet["balance_sheet"]["financial_year"]) # type: ignore
-        response = self.getAssets().addAssets(balance_sheet["assets"], archived_balance_sheet.identifier) # type: ignore
+        assets: Dict[str, int] = self.getAssets().addAssets(balance_sheet["assets"], archived_balance_sheet["identifier"]) # type: ignore
+        response = assets["status"]
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the assets into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the assets into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        assets: Assets = self.getAssets().getSpecific(archived_balance_sheet.identifier)
-        response = self.getNonCurrentAssets().addAsset(balance_sheet["assets"]["non_current_assets"], assets.identifier) # type: ignore
+        response = self.getNonCurrentAssets().addAsset(balance_sheet["assets"]["non_current_assets"], assets["identifier"]) # type: ignore
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the non current assets into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the non current assets into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        response = self.getCurrentAssets().addAsset(balance_sheet["assets"]["current_assets"], assets.identifier) # type: ignore
+        response = self.getCurrentAssets().addAsset(balance_sheet["assets"]["current_assets"], assets["identifier"]) # type: ignore
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the current assets into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the current assets into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        response = self.getLiabilities().addLiabilities(balance_sheet["liabilities"], archived_balance_sheet.identifier) # type: ignore
+        liabilities: Dict[str, int] = self.getLiabilities().addLiabilities(balance_sheet["liabilities"], archived_balance_sheet["identifier"]) # type: ignore
+        response = liabilities["status"]
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        liabilities: Liabilities = self.getLiabilities().getSpecific(archived_balance_sheet.identifier)
-        response = self.getEquityAndLiabilities().addLiability(balance_sheet["liabilities"]["equity_and_liabilities"], liabilities.identifier) # type: ignore
+        response = self.getEquityAndLiabilities().addLiability(balance_sheet["liabilities"]["equity_and_liabilities"], liabilities["identifier"]) # type: ignore
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the equity and liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the equity and liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        response = self.getNonCurrentLiabilities().addLiability(balance_sheet["liabilities"]["non_current"], liabilities.identifier) # type: ignore
+        response = self.getNonCurrentLiabilities().addLiability(balance_sheet["liabilities"]["non_current"], liabilities["identifier"]) # type: ignore
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the non current liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the non current liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
-        response = self.getCurrentLiabilities().addLiability(balance_sheet["liabilities"]["current"], liabilities.identifier) # type: ignore
+        response = self.getCurrentLiabilities().addLiability(balance_sheet["liabilities"]["current"], liabilities["identifier"]) # type: ignore
         if response != created:
-            self.getLogger().error(f"An error occurred while inserting the non current liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {balance_sheet}")
+            self.getLogger().error(f"An error occurred while inserting the non current liabilities into the relational database server.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": balance_sheet})
             return service_unavailable
         return response
 
-    def storeCorporateDataDomesticProfitStatement(self, status: int, profit_statement: Dict[str, Union[Dict[str, Union[int, str]], float]], document_file: DocumentFiles) -> int:
+    def storeCorporateDataDomesticProfitStatement(self, status: int, profit_statement: Dict[str, Union[Dict[str, Union[int, str]], float]], financial_summaries: List[Dict[str, Union[int, str]]], document_file: DocumentFiles) -> int:
         """
         Doing the data manipulation on the profit statement result
         set.
@@ -1485,6 +1877,7 @@ class Builder:
         Parameters:
             status: int: The status of the data manipulation.
             profit_statement: {financial_summary: {financial_year: int, currency: string, date_approved: int, unit: int}, turnover: float, cost_of_sales: float, gross_profit: float, other_income: float, distribution_cost: float, administration_cost: float, expenses: float, finance_cost: float, net_profit_before_taxation: float, taxation: float, net_profit: float}: The data that has been extracted for the profit statement table.
+            financial_summaries: [{financial_year: int, currency: string, date_approved: int, unit: int, identifier: int}]: The financial summaries which have been stored for the corporate registry.
             document_file: {identifier: int, file_data: bytes, company_detail: int}: The data about the corporate registry.
 
         Returns:
@@ -1498,17 +1891,46 @@ class Builder:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {status}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return status
         if status >= 200 and status <= 299 and not profit_statement:
-            self.getLogger().inform(f"There is no data to be inserted into the Profit Statement table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {profit_statement}")
+            self.getLogger().inform(f"There is no data to be inserted into the Profit Statement table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": profit_statement})
             return ok
         if not profit_statement:
             return status
-        financial_summary: FinancialSummaries = self.getFinancialSummaries().getSpecific(document_file.company_detail, profit_statement["financial_summary"]["financial_year"]) # type: ignore
+        financial_summary: FinancialSummaries = self._getStoredFinancialSummary(profit_statement["financial_summary"], financial_summaries, document_file.company_detail) # type: ignore
         financial_summary.unit = profit_statement["financial_summary"]["unit"] # type: ignore
         response = self.getFinancialSummaries().update(financial_summary)
         response = self.getProfitStatements().addProfitStatement(profit_statement, financial_summary.identifier) if response == accepted else service_unavailable
-        self.getLogger().inform(f"The data has been successfully inserted into the Profit Statements table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {profit_statement}")
+        self.getLogger().inform(f"The data has been successfully inserted into the Profit Statements table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": profit_statement})
         return response
 
+    def _getStoredFinancialSummary(self, financial_summary: Dict[str, Union[int, str]], financial_summaries: List[Dict[str, Union[int, str]]], company_detail: int) -> FinancialSummaries:
+        """
+        Retrieving the financial summary of the profit statement from
+        the financial summaries which have been stored for the
+        corporate registry along with their generated identifiers.
+        It is only retrieved from the relational database server
+        when it has not been stored for the corporate registry.
+
+        Parameters:
+            financial_summary: {financial_year: int, currency: string, date_approved: int, unit: int}: The financial summary of the profit statement.
+            financial_summaries: [{financial_year: int, currency: string, date_approved: int, unit: int, identifier: int}]: The financial summaries which have been stored for the corporate registry.
+            company_detail: int: The identifier of the company.
+
+        Returns:
+            {identifier: int, CompanyDetail: int, financial_year: int, currency: string, date_approved: int, unit: int|null}
+        """
+        financial_year: int = int(financial_summary["financial_year"])
+        stored_financial_summaries: List[Dict[str, Union[int, str]]] = [stored_financial_summary for stored_financial_summary in financial_summaries if int(stored_financial_summary.get("identifier", 0)) > 0 and int(stored_financial_summary["financial_year"]) == financial_year]
+        if len(stored_financial_summaries) == 0:
+            return self.getFinancialSummaries().getSpecific(company_detail, financial_year)
+        return FinancialSummaries({
+            "identifier": stored_financial_summaries[0]["identifier"],
+            "CompanyDetail": company_detail,
+            "financial_year": financial_year,
+            "currency": stored_financial_summaries[0]["currency"],
+            "date_approved": stored_financial_summaries[0]["date_approved"],
+            "unit": None
+        })
+
     def storeCorporateDataDomesticFinancialSummary(self, status: int, financial_summaries: List[Dict[str, Union[int, str]]], document_file: DocumentFiles) -> int:
         """
         Doing the data manipulation on the financial summary result
@@ -1529,11 +1951,16 @@ class Builder:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {status}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return status
         if status >= 200 and status <= 299 and len(financial_summaries) == 0:
-            self.getLogger().inform(f"There is no data to be inserted into the Financial Summaries table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {financial_summaries}")
+            self.getLogger().inform(f"There is no data to be inserted into the Financial Summaries table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": financial_summaries})
             return ok
-        statuses: List[int] = list(set([self.getFinancialSummaries().addFinancialSummary(financial_summary, document_file.company_detail) for financial_summary in financial_summaries]))
+        statuses: List[int] = []
+        for financial_summary in financial_summaries:
+            archived_financial_summary: Dict[str, int] = self.getFinancialSummaries().addFinancialSummary(financial_summary, document_file.company_detail)
+            financial_summary["identifier"] = archived_financial_summary["identifier"]
+            statuses.append(archived_financial_summary["status"])
+        statuses = list(set(statuses))
         response: int = created if len(statuses) == 1 and statuses[0] == created else service_unavailable
-        self.getLogger().inform(f"Data has been stored into the Financial Summaries table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {financial_summaries}")
+        self.getLogger().inform(f"Data has been stored into the Financial Summaries table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": financial_summaries})
         return response
 
     def storeCorporateDataDomesticAnnualReturn(self, status: int, annual_return: List[Dict[str, int]], document_file: DocumentFiles) -> int:
@@ -1549,17 +1976,14 @@ class Builder:
             int
         """
         ok: int = 200
-        created: int = 201
-        service_unavailable: int = 503
         if status < 200 and status > 299:
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {status}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
             return status
         if status >= 200 and status <= 299 and len(annual_return) == 0:
-            self.getLogger().inform(f"There is no data to be inserted into the Annual Return table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}\nData: {annual_return}")
+            self.getLogger().inform(f"There is no data to be inserted into the Annual Return table.\nStatus: {ok}\nIdentifier: {document_file.company_detail}", {"Data": annual_return})
             return ok
-        statuses: List[int] = list(set([self.getAnnualReturns().addAnnualReturn(annual_return_statement, document_file.company_detail) for annual_return_statement in annual_return]))
-        response: int = created if len(statuses) == 1 and statuses[0] else service_unavailable
-        self.getLogger().inform(f"Data has been stored into the Annual Returns table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {annual_return}")
+        response: int = self.getAnnualReturns().addAnnualReturnsBatch(annual_return, document_file.company_detail, self.getWriteBehindBuffer())
+        self.getLogger().inform(f"Data has been stored into the Annual Returns table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": annual_return})
         return response
 
     def storeCorporateDataDomesticMembers(self, status: int, members: List[Dict[str, Union[str, int]]], document_file: DocumentFiles) -> int:
@@ -1577,10 +2001,10 @@ class Builder:
         response: int
         if status == 201 and len(members) > 0:
             response = self._storeCorporateDataDomesticMembers(members, document_file.company_detail)
-            self.getLogger().inform(f"Data has been stored into the Members table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {members}")
+            self.getLogger().inform(f"Data has been stored into the Members table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": members})
         elif status == 201 and len(members) == 0:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Members table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {members}")
+            self.getLogger().inform(f"There is no data to be inserted into the Members table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": members})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1598,16 +2022,7 @@ class Builder:
         Returns:
             int
         """
-        relational_database_responses: List[int] = []
-        response: int
-        for index in range(0, len(members), 1):
-            relational_database_responses.append(self.getMembers().addMember(members[index], company_detail))
-        relational_database_responses = list(set(relational_database_responses))
-        if len(relational_database_responses) == 1 and relational_database_responses[0] == 201:
-            response = relational_database_responses[0]
-        else:
-            response = max(relational_database_responses)
-        return response
+        return self.getMembers().addMembersBatch(members, company_detail, self.getWriteBehindBuffer())
 
     def storeCorporateDataDomesticCertificate(self, status: int, certificates: List[Dict[str, Union[str, int]]], document_file: DocumentFiles) -> int:
         """
@@ -1626,7 +2041,7 @@ class Builder:
             exit()
         elif status == 201 and len(certificates) == 0:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the Certificate table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {certificates}")
+            self.getLogger().inform(f"There is no data to be inserted into the Certificate table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": certificates})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1647,7 +2062,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299:
             response = self._storeCorporateDataDomesticShareholders(shareholders, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Shareholders table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {shareholders}")
+            self.getLogger().inform(f"The data has been successfully updated into the Shareholders table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": shareholders})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1664,19 +2079,9 @@ class Builder:
         Returns:
             int
         """
-        response: int
-        responses: List[int] = []
-        for index in range(0, len(shareholders), 1):
-            relational_database_response: int = self.getShareholders().addShareholders(shareholders[index], company_detail)
-            responses.append(relational_database_response)
-        responses = list(set(responses))
-        if len(responses) == 1 and responses[0] == 201:
-            response = 201
-        elif len(responses) == 0:
-            response = 200
-        else:
-            response = 503
-        return response
+        if len(shareholders) == 0:
+            return 200
+        return self.getShareholders().addShareholdersBatch(shareholders, company_detail, self.getWriteBehindBuffer())
 
     def storeCorporateDataDomesticOfficeBearers(self, status: int, office_bearers: List[Dict[str, Union[str, int]]], document_file: DocumentFiles) -> int:
         """
@@ -1694,7 +2099,7 @@ class Builder:
         response: int
         if status >= 200 and status <= 299:
             response = self._storeCorporateDataDomesticOfficeBearers(office_bearers, document_file)
-            self.getLogger().inform(f"The data has been successfully updated into the Office Bearers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {office_bearers}")
+            self.getLogger().inform(f"The data has been successfully updated into the Office Bearers table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": office_bearers})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1711,17 +2116,9 @@ class Builder:
         Returns:
             int
         """
-        response: int
-        responses: List[int] = []
-        for index in range(0, len(office_bearers), 1):
-            relational_database_response: int = self.getOfficeBearers().addDirectors(office_bearers[index], document_file.company_detail)
-            responses.append(relational_database_response)
-        responses = list(set(responses))
-        if len(responses) == 1 and responses[0] == 201:
-            response = 201
-        else:
-            response = 503
-        return response
+        if len(office_bearers) == 0:
+            return 503
+        return self.getOfficeBearers().addDirectorsBatch(office_bearers, document_file.company_detail, self.getWriteBehindBuffer())
 
     def storeCorporateDataDomesticStateCapital(self, status: int, state_capital: List[Dict[str, Union[str, int]]], document_file: DocumentFiles) -> int:
         """
@@ -1738,10 +2135,10 @@ class Builder:
         response: int
         if status >= 200 and status <= 299 and not state_capital:
             response = 200
-            self.getLogger().inform(f"There is no data to be inserted into the State Capital table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {state_capital}")
+            self.getLogger().inform(f"There is no data to be inserted into the State Capital table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": state_capital})
         elif status >= 200 and status <= 299 and len(state_capital) > 0:
             response = self._storeCorporateDataDomesticStateCapital(state_capital, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the State Capital table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {state_capital}")
+            self.getLogger().inform(f"The data has been successfully updated into the State Capital table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": state_capital})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1785,7 +2182,7 @@ class Builder:
         response: int
         if company_detail == 202:
             response = self._storeCorporateDataDomesticPrivateBusinessDetail(business_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {business_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": business_details})
         else:
             response = company_detail
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {company_detail}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1807,7 +2204,7 @@ class Builder:
         response: int
         if status == 202:
             response = self.getBusinessDetails().addBusinessDetailsDomesticCivil(business_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {business_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": business_details})
         else:
             response = status
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {status}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1832,7 +2229,7 @@ class Builder:
         responses = list(set(responses))
         if len(responses) == 1 and responses[0] == 201:
             response = 201
-            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {company_detail}\nData: {business_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Business Details table.\nStatus: {response}\nIdentifier: {company_detail}", {"Data": business_details})
         else:
             response = 503
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {response}\nCompany Detail Identifier: {company_detail}")
@@ -1853,7 +2250,7 @@ class Builder:
         """
         response: int
         date_verified: int = int(time())
-        is_extracted: int = 1
+        is_extracted: int = 0
         company_identifier: int = int("".join(findall(r"\d+", str(company_details["file_number"]))))
         company_type: str = "".join(findall(r"[A-Z]+", str(company_details["file_number"])))
         if data_extraction == 200:
@@ -1862,7 +2259,7 @@ class Builder:
             company_details["company_identifier"] = company_identifier
             company_details["company_type"] = company_type
             response = self.getCompanyDetails().updateCorporateMetadataDomesticPrivate(company_details, document_file.company_detail)
-            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}\nData: {company_details}")
+            self.getLogger().inform(f"The data has been successfully updated into the Company Details table.\nStatus: {response}\nIdentifier: {document_file.company_detail}", {"Data": company_details})
         else:
             response = data_extraction
             self.getLogger().error(f"An error occurred in the application.  The extraction will be aborted and the corporate registry will be removed from the processing server.\nStatus: {response}\nExtraction Status: {data_extraction}\nCompany Detail Identifier: {document_file.company_detail}\nDocument File Identifier: {document_file.identifier}")
@@ -1882,8 +2279,9 @@ class Builder:
         successful_logs: List[FinCorpLogs] = self.getFinCorpLogs().getSuccessfulRunsLogs("downloadCorporateFile")
         date: str = self._getDateDownloadCorporateFile(successful_logs, quarter)
         company_details: List[CompanyDetails] = self.getCompanyDetails().getCompanyDetailsForDownloadCorporateDocumentFile(date)
-        amount: int = self.getCompanyDetails().getAmount(date)
-        amount_found: int = self.getCompanyDetails().getAmountDownloadedCorporateDocuments(date)
+        statistics: Dict[str, int] = self.getCompanyDetails().getRunStatistics(date)
+        amount: int = statistics["amount"]
+        amount_found: int = statistics["amount_downloaded"]
         self.getLogger().inform(f"The data that will be used as payloads for retrieving the corporate document files from the Mauritius Network Services Online Search platform.\nDate of Incorporation: {date}\nCompany Details Amount: {len(company_details)}\nAmount Downloaded: {amount_found}")
         for index in range(0, len(company_details), 1):
             self.setCrawler(Crawler())
@@ -2059,24 +2457,39 @@ class Builder:
             )
             self.getCompanyDetails().addCompany(parameters)  # type: ignore
 
-    def curateStateCapital(self) -> None:
+    def curateStateCapital(self, batch_size: int = 10000) -> None:
         """
         Curating the data that is in the State Capital table.
         Santizing the type of the stated capital for a better
         filtering of the data.  Sanitizing the current of the stated
         capital for a better filtering and conversion of the data.
+        The table is read, curated and updated page by page.
+
+        Parameters:
+            batch_size (int): The amount of stated capitals to be curated per page.
 
         Returns:
             void
         """
         quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
         current_time: int = int(time())
-        self.setStateCapitalData(self.getStateCapital().get())
-        self.curateStateCapitalType()
-        self.curateStateCapitalCurrency()
-        self.getStateCapitalData().sort(key=lambda stated_capital: stated_capital.identifier)
-        response: int = self.updateCuratedStateCapital()
-        log: Tuple[str, str, int, int, int, int, int] = ("curateStateCapital", quarter.quarter, current_time, current_time, response, len(self.getStateCapitalData()), len(self.getStateCapitalData()))
+        service_unavailable: int = 503
+        amount: int = 0
+        statuses: List[int] = []
+        try:
+            for stated_capitals in self.getStateCapital().iterAll(batch_size):
+                self.setStateCapitalData(stated_capitals)
+                self.curateStateCapitalType()
+                self.curateStateCapitalCurrency()
+                self.getStateCapitalData().sort(key=lambda stated_capital: stated_capital.identifier)
+                statuses.append(self.updateCuratedStateCapital())
+                amount += len(self.getStateCapitalData())
+        except (Error, RuntimeError) as error:
+            statuses.append(service_unavailable)
+            self.getLogger().error(f"State Capital: The pages cannot be retrieved.\nStatus: {service_unavailable}\nError: {error}")
+        self.setStateCapitalData([])
+        response: int = service_unavailable if service_unavailable in statuses else 202
+        log: Tuple[str, str, int, int, int, int, int] = ("curateStateCapital", quarter.quarter, current_time, current_time, response, amount, amount)
         self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
 
     def updateCuratedStateCapital(self) -> int:
@@ -2089,477 +2502,226 @@ class Builder:
         """
         good: int = 202
         bad: int = 503
-        statuses: List[int] = list(set([self.getStateCapital().updateStatedCapital(stated_capital) for stated_capital in self.getStateCapitalData()]))
-        return good if len(statuses) == 1 and statuses[0] == good else bad
+        statuses: List[int] = self.getStateCapital().updateStatedCapitals(self.getStateCapitalData())
+        self.getLogger().inform(f"Stated Capital: Update: Storing the curated stated capitals.\nAmount: {len(self.getStateCapitalData())}\nChunks: {len(statuses)}\nFailed Chunks: {[index for index, status in enumerate(statuses) if status != good]}")
+        return bad if bad in statuses else good
 
     def curateStateCapitalCurrency(self) -> None:
         """
         Sanitizing the current of the stated capital for a better
-        filtering and conversion of the data.
+        filtering and conversion of the data.  The rules of
+        `stated_capital_currency_rules` are applied in order on the
+        dictionary encoded currencies.
 
         Returns:
             void
         """
-        self.curateStateCapitalCurrencyMur()
-        self.curateStateCapitalCurrencyUsd()
-        self.curateStateCapitalCurrencySd()
+        column: Dictionary_Column = Dictionary_Column(self.getStateCapitalData(), "currency")
+        for label, keywords, exclusions, currency in stated_capital_currency_rules:
+            amount: int = column.replace(lambda value: hasKeywords(value, keywords, exclusions), currency)
+            self.getLogger().inform(f"Stated Capital: Currency: Filtering the data for the {label} currency.\nAmount: {amount}")
 
-    def curateStateCapitalCurrencySd(self) -> None:
+    def curateStateCapitalType(self) -> None:
         """
-        Filtering the data for the Singapore Dollar currency.
+        Santizing the type of the stated capital for a better
+        filtering of the data.  The rules of
+        `stated_capital_type_rules` are applied in order on the
+        dictionary encoded types.
 
         Returns:
             void
         """
-        singapore_dollar: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.currency != None and "singapore" in stated_capital.currency.lower()]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in singapore_dollar]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Currency: Filtering the data for the Singapore Dollar currency.\nAmount: {len(singapore_dollar)}")
-        for index in range(0, len(singapore_dollar), 1):
-            singapore_dollar[index].currency = "Singapore Dollar"
-        self.setStateCapitalData(singapore_dollar + filtered_data)
+        column: Dictionary_Column = Dictionary_Column(self.getStateCapitalData(), "type")
+        for label, keywords, exclusions, type in stated_capital_type_rules:
+            amount: int = column.replace(lambda value: hasKeywords(value, keywords, exclusions), type)
+            self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the {label} type.\nAmount: {amount}")
 
-    def curateStateCapitalCurrencyUsd(self) -> None:
+    def curateBusinessDetails(self, batch_size: int = 10000) -> None:
         """
-        Filtering the data for the United States Dollar currency.
+        Curating the data that is in the Business Details table. The
+        registered addresses have to be sanitized for the
+        geographical information system to be able to process it
+        afterwards.  The names have to be sanitized to reflect the
+        companies they are affliated with.  The natures have to be
+        sanitized to be processed afterwards to obtain the sector of
+        activity of the company by doing a sentiment analysis.  The
+        operational addresses have to be sanitized for the
+        geographical information system to be able to process it
+        afterwards.  The table is read, curated and updated page by
+        page, along with the companies of each page.
+
+        Parameters:
+            batch_size (int): The amount of business details to be curated per page.
 
         Returns:
             void
         """
-        united_states_dollar: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.currency != None and "us" in stated_capital.currency.lower()]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in united_states_dollar]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Currency: Filtering the data for the United States Dollar currency.\nAmount: {len(united_states_dollar)}")
-        for index in range(0, len(united_states_dollar), 1):
-            united_states_dollar[index].currency = "United States Dollar"
-        self.setStateCapitalData(united_states_dollar + filtered_data)
+        quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
+        current_time: int = int(time())
+        service_unavailable: int = 503
+        amount: int = 0
+        statuses: List[int] = []
+        try:
+            for business_details in self.getBusinessDetails().iterAll(batch_size):
+                self.setBusinessDetailsData(business_details)
+                self.setCompanyDetailsData(self.getCompanyDetails().getManyByIdentifiers([business_detail.CompanyDetail for business_detail in self.getBusinessDetailsData()]))
+                self.setCompanyDetailsIndex({company_detail.identifier: company_detail for company_detail in self.getCompanyDetailsData()})
+                self.sanitizeBusinessDetailsRegisteredAddresses()
+                self.sanitizeBusinessDetailsName()
+                self.sanitizeBusinessDetailsNature()
+                self.sanitizeBusinessDetailOperationalAddress()
+                statuses.append(self.updateCuratedBusinessDetails())
+                amount += len(self.getBusinessDetailsData())
+        except (Error, RuntimeError) as error:
+            statuses.append(service_unavailable)
+            self.getLogger().error(f"Business Details: The pages cannot be retrieved.\nStatus: {service_unavailable}\nError: {error}")
+        self.setBusinessDetailsData([])
+        self.setCompanyDetailsData([])
+        self.setCompanyDetailsIndex({})
+        response: int = service_unavailable if service_unavailable in statuses else 202
+        log: Tuple[str, str, int, int, int, int, int] = ("curateBusinessDetails", quarter.quarter, current_time, current_time, response, amount, amount)
+        self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
 
-    def curateStateCapitalCurrencyMur(self) -> None:
+    def updateCuratedBusinessDetails(self) -> int:
         """
-        Filtering the data for the Mauritian Rupee currency.
+        Storing the curated business details data that are in the
+        cache memory into the relational database server.
 
         Returns:
-            void
+            int
         """
-        mauritian_rupee: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.currency != None and ("mauritius" in stated_capital.currency.lower() or "rupee" in stated_capital.currency.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in mauritian_rupee]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Currency: Filtering the data for the Mauritian Rupee currency.\nAmount: {len(mauritian_rupee)}")
-        for index in range(0, len(mauritian_rupee), 1):
-            mauritian_rupee[index].currency = "Mauritian Rupee"
-        self.setStateCapitalData(mauritian_rupee + filtered_data)
+        good: int = 202
+        bad: int = 503
+        statuses: List[int] = self.getBusinessDetails().updateBusinessDetails(self.getBusinessDetailsData())
+        self.getLogger().inform(f"Business Details: Update: Storing the curated business details.\nAmount: {len(self.getBusinessDetailsData())}\nChunks: {len(statuses)}\nFailed Chunks: {[index for index, status in enumerate(statuses) if status != good]}")
+        return bad if bad in statuses else good
 
-    def curateStateCapitalType(self) -> None:
+    def sanitizeBusinessDetailsRegisteredAddresses(self) -> None:
         """
-        Santizing the type of the stated capital for a better
-        filtering of the data.
+        Sanitizing the registered addresses which are going to be
+        used by the geographical information system to be able to
+        process it afterwards.
 
         Returns:
             void
         """
-        self.curateStateCapitalTypeOrdinary()
-        self.curateStateCapitalTypeSociale()
-        self.curateStateCapitalTypeD()
-        self.curateStateCapitalTypeB()
-        self.curateStateCapitalTypeA()
-        self.curateStateCapitalTypeManagement()
-        self.curateStateCapitalTypeC()
-        self.curateStateCapitalTypeFounder()
-        self.curateStateCapitalTypePreference()
+        self.sanitizeBusinessDetailsRegisteredAddressesFormat()
+        self.sanitizeBusinessDetailsRegisteredAddressesErroneous()
+        self.santizeBusinessDetailsRegisteredAddressesFormatting()
 
-    def curateStateCapitalTypePreference(self) -> None:
+    def santizeBusinessDetailsRegisteredAddressesFormatting(self) -> None:
         """
-        Filtering the data for the preference type.
+        Sanitizing and standardizing the formatting of registered addresses in business details.
+
+        This method processes a list of business details, modifying the registered addresses to ensure a consistent format.  It applies the replacements of `registered_address_replacements`, such as removing or substituting specific substrings, capitalizing words, and correcting abbreviations.  The formatted addresses are memoised, as many companies share the same registered address.
 
         Returns:
-            void
+            None
         """
-        preference: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("preference" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in preference]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the Preference type.\nAmount: {len(preference)}")
-        for index in range(0, len(preference), 1):
-            preference[index].type = "Preference"
-        self.setStateCapitalData(preference + filtered_data)
+        self.getLogger().inform(f"Business Details: Registered Address: Formatting the registered addresses into the correct format for processing.\nAmount: {len(self.getBusinessDetailsData())}")
+        for business_detail in self.getBusinessDetailsData():
+            if not business_detail.registered_address:
+                continue
+            business_detail.registered_address = formatRegisteredAddress(business_detail.registered_address)
 
-    def curateStateCapitalTypeFounder(self) -> None:
+    def sanitizeBusinessDetailsRegisteredAddressesFormat(self)-> None:
         """
-        Filtering the data for the founder type.
+        Formating the registered addresses into the correct format
+        for processing.
 
         Returns:
             void
         """
-        founder: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("founder" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in founder]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the Founder type.\nAmount: {len(founder)}")
-        for index in range(0, len(founder), 1):
-            founder[index].type = "Founder"
-        self.setStateCapitalData(founder + filtered_data)
+        self.getLogger().inform(f"Business Details: Registered Address: Formating the registered addresses into the correct format for processing.\nAmount: {len(self.getBusinessDetailsData())}")
+        for business_detail in self.getBusinessDetailsData():
+            business_detail.registered_address = formatAddress(business_detail.registered_address) if business_detail.registered_address != None else business_detail.registered_address
 
-    def curateStateCapitalTypeC(self) -> None:
+    def sanitizeBusinessDetailOperationalAddress(self) -> None:
         """
-        Filtering the data for the C type.
+        Sanitizing the operational addresses which are going to be
+        used by the geographical information system to be able to
+        process it afterwards.
 
         Returns:
             void
         """
-        c_type: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("class c" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in c_type]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the Class C type.\nAmount: {len(c_type)}")
-        for index in range(0, len(c_type), 1):
-            c_type[index].type = "Class C"
-        self.setStateCapitalData(c_type + filtered_data)
+        self.sanitizeBusinessDetailOperationalAddressFormat()
+        self.sanitizeBusinessDetailOperationalAddressMissingAddress()
+        self.sanitizeBusinessDetailOperationalAddressTruncatedAddress()
 
-    def curateStateCapitalTypeManagement(self) -> None:
+    def sanitizeBusinessDetailOperationalAddressTruncatedAddress(self) -> None:
         """
-        Filtering the data for the management type.
+        Setting the data of the operational address to be the one of
+        the registered for the ones that have truncated data.
 
         Returns:
             void
         """
-        management: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("management" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in management]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the management type.\nAmount: {len(management)}")
-        for index in range(0, len(management), 1):
-            management[index].type = "Management"
-        self.setStateCapitalData(management + filtered_data)
+        truncated_data: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData() if business_details.operational_address != None and business_details.registered_address != None and business_details.operational_address in business_details.registered_address]
+        filtered_business_details: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData()if business_details not in truncated_data]
+        self.setBusinessDetailsData([])
+        self.getLogger().inform(f"Business Details: Operational Address: Setting the data of the operational address to be the one of the registered for the ones that have truncated data.\nAmount: {len(truncated_data)}")
+        for index in range(0, len(truncated_data), 1):
+            truncated_data[index].operational_address = truncated_data[index].registered_address
+        self.setBusinessDetailsData(truncated_data + filtered_business_details)
 
-    def curateStateCapitalTypeA(self) -> None:
+    def sanitizeBusinessDetailOperationalAddressMissingAddress(self) -> None:
         """
-        Filtering the data for the A type.
+        Setting the data operational address to be the one of the
+        registered address for the ones missing data.
 
         Returns:
             void
         """
-        class_a: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("class a" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in class_a]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the A type.\nAmount: {len(class_a)}")
-        for index in range(0, len(class_a), 1):
-            class_a[index].type = "Class A"
-        self.setStateCapitalData(class_a + filtered_data)
+        missing_addresses: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData() if business_details.operational_address == "Mauritius" or business_details.operational_address == "() Mauritius" or business_details.operational_address == "Mauritius Mauritius"]
+        filtered_business_details: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData()if business_details not in missing_addresses]
+        self.setBusinessDetailsData([])
+        self.getLogger().inform(f"Business Details: Operational Address: Setting the data operational address to be the one of the registered address for the ones missing data.\nAmount: {len(missing_addresses)}")
+        for index in range(0, len(missing_addresses), 1):
+            missing_addresses[index].operational_address = missing_addresses[index].registered_address
+        self.setBusinessDetailsData(missing_addresses + filtered_business_details)
 
-    def curateStateCapitalTypeB(self) -> None:
+    def sanitizeBusinessDetailOperationalAddressFormat(self) -> None:
         """
-        Filtering the data for the B type.
+        Formating the operational addresses into the correct format
+        for processing.
 
         Returns:
             void
         """
-        class_b: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("class b" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in class_b]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the B type.\nAmount: {len(class_b)}")
-        for index in range(0, len(class_b), 1):
-            class_b[index].type = "Class B"
-        self.setStateCapitalData(class_b + filtered_data)
+        self.getLogger().inform(f"Business Details: Operational Address: Formating the operational addresses into the correct format for processing.\nAmount: {len(self.getBusinessDetailsData())}")
+        for business_detail in self.getBusinessDetailsData():
+            business_detail.operational_address = formatAddress(business_detail.operational_address) if business_detail.operational_address != None else business_detail.operational_address
 
-    def curateStateCapitalTypeD(self) -> None:
+    def sanitizeBusinessDetailsRegisteredAddressesErroneous(self) -> None:
         """
-        Filtering the data for the D type.
+        Sanitizing the registered addresses that are going to be
+        used by the geographical information system to be able to
+        process it afterwards.
 
         Returns:
             void
         """
-        class_d: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("class d" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in class_d]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the D type.\nAmount: {len(class_d)}")
-        for index in range(0, len(class_d), 1):
-            class_d[index].type = "Class D"
-        self.setStateCapitalData(class_d + filtered_data)
+        erroneous_registered_addresses: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.registered_address != None and digit_pattern.search(business_detail.registered_address) != None]
+        self.getLogger().inform(f"Business Details: Registered Address: Sanitizing the registered addresses that are going to be used by the geographical information system to be able to process it afterwards.\nAmount: {len(erroneous_registered_addresses)}")
+        for business_detail in erroneous_registered_addresses:
+            business_detail.registered_address = sanitizeErroneousAddress(str(business_detail.registered_address))
 
-    def curateStateCapitalTypeSociale(self) -> None:
+    def sanitizeBusinessDetailsNameSameNames(self) -> None:
         """
-        Filtering the data for the sociale type.
+        Replacing placeholder business names with their corresponding company names.
+
+        This method processes business details where the `name` field contains placeholder values such as `"."` or `"-"`. It replaces these placeholders with the actual company names retrieved from `CompanyDetails`.
 
         Returns:
-            void
-        """
-        sociale: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and ("social" in stated_capital.type.lower() or "interet" in stated_capital.type.lower())]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in sociale]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the sociale type.\nAmount: {len(sociale)}")
-        for index in range(0, len(sociale), 1):
-            sociale[index].type = "Part Sociale"
-        self.setStateCapitalData(sociale + filtered_data)
-
-    def curateStateCapitalTypeOrdinary(self) -> None:
-        """
-        Filtering the data for the ordinary type.
-
-        Returns:
-            void
-        """
-        ordinary: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital.type != None and "ordinary" in stated_capital.type.lower() and "class" not in stated_capital.type.lower()]
-        filtered_data: List[StateCapital] = [stated_capital for stated_capital in self.getStateCapitalData() if stated_capital not in ordinary]
-        self.setStateCapitalData([])
-        self.getLogger().inform(f"Stated Capital: Type: Filtering the data for the ordinary type.\nAmount: {len(ordinary)}")
-        for index in range(0, len(ordinary), 1):
-            ordinary[index].type = "Ordinary"
-        self.setStateCapitalData(ordinary + filtered_data)
-
-    def curateBusinessDetails(self) -> None:
-        """
-        Curating the data that is in the Business Details table. The
-        registered addresses have to be sanitized for the
-        geographical information system to be able to process it
-        afterwards.  The names have to be sanitized to reflect the
-        companies they are affliated with.  The natures have to be
-        sanitized to be processed afterwards to obtain the sector of
-        activity of the company by doing a sentiment analysis.  The
-        operational addresses have to be sanitized for the
-        geographical information system to be able to process it
-        afterwards.
-
-        Returns:
-            void
-        """
-        quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
-        current_time: int = int(time())
-        self.setBusinessDetailsData(self.getBusinessDetails().getBusinessDetails())
-        self.setCompanyDetailsData([self.getCompanyDetails().getSpecificCompanyDetails(identifier) for identifier in list(set([business_detail.CompanyDetail for business_detail in self.getBusinessDetailsData()]))])
-        self.sanitizeBusinessDetailsRegisteredAddresses()
-        self.sanitizeBusinessDetailsName()
-        self.sanitizeBusinessDetailsNature()
-        self.sanitizeBusinessDetailOperationalAddress()
-        response: int = self.updateCuratedBusinessDetails()
-        log: Tuple[str, str, int, int, int, int, int] = ("curateBusinessDetails", quarter.quarter, current_time, current_time, response, len(self.getBusinessDetailsData()), len(self.getBusinessDetailsData()))
-        self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
-
-    def updateCuratedBusinessDetails(self) -> int:
-        """
-        Storing the curated business details data that are in the
-        cache memory into the relational database server.
-
-        Returns:
-            int
-        """
-        good: int = 202
-        bad: int = 503
-        statuses: List[int] = list(set([self.getBusinessDetails().updateBusinessDetail(business_detail) for business_detail in self.getBusinessDetailsData()]))
-        return good if len(statuses) == 1 and statuses[0] == good else bad
-
-    def sanitizeBusinessDetailsRegisteredAddresses(self) -> None:
-        """
-        Sanitizing the registered addresses which are going to be
-        used by the geographical information system to be able to
-        process it afterwards.
-
-        Returns:
-            void
-        """
-        self.sanitizeBusinessDetailsRegisteredAddressesFormat()
-        self.sanitizeBusinessDetailsRegisteredAddressesErroneous()
-        self.santizeBusinessDetailsRegisteredAddressesFormatting()
-
-    def santizeBusinessDetailsRegisteredAddressesFormatting(self) -> None:
-        """
-        Sanitizing and standardizing the formatting of registered addresses in business details.
-
-        This method processes a list of business details, modifying the registered addresses to ensure a consistent format. It applies various replacements, such as removing or substituting specific substrings, capitalizing words, and correcting abbreviations.
-
-        The function logs the number of business details being processed before applying transformations.  The replacements list contains tuples defining:
-            - `current_value`: The substring to be replaced.
-            - `new_value`: The replacement string.
-            - `is_start`: A boolean indicating whether the replacement should apply only if `current_value` appears at the beginning of the address.
-
-        Returns:
-            None
-        """
-        replacements: List[Tuple[str, str, bool]] = [("-", "", True), (", ", "", True), (". ", "", True), ("(B) ", "", True), ("(", "", True), ("& ", "", True), (" morc ", " Morcellement ", False), (" st,", " Street, ", False), (" rd, ", " Road, ", False), (" ave ", " Avenue ", False), (" ste ", " Sainte ", False), ("apps ", "Appartment ", False), ("appt ", "Appartment ", False), ("apt ", "Appartment ", False), ("blk ", "Block ", False), (" rt ", " Route ", False), (" rd ", " Road, ", False), (" ave, ", " Avenue ", False), (" mt ", " Montagne ", False), (" - ", " ", False), (" se ", " Sugar Estate ", False), ("blvd", "Boulevard ", True), ("grnw ", "Grand River North West, ", False), ("govt ", "Government ", False), ("imp ", "Impasse ", False), ("morc ", "Morcellement ", False), ("morc.", "Morcellement ", False), ("mont", "Montagne ", False), ("pte ", "Pointe ", False)]
-        business_details: List[BusinessDetails] = []
-        self.getLogger().inform(f"Business Details: Registered Address: Formatting the registered addresses into the correct format for processing.\nAmount: {len(self.getBusinessDetailsData())}")
-        for business_detail in self.getBusinessDetailsData():
-            business_details = self.__businessDetailsRegisteredAddressesFormat(business_details, replacements, business_detail)
-        self.setBusinessDetailsData(business_details)
-
-    def __businessDetailsRegisteredAddressesFormat(self, processeds: List[BusinessDetails], replacements: List[Tuple[str, str, bool]], business_detail: BusinessDetails) -> List[BusinessDetails]:
-        """
-        Applying formatting corrections to a business's registered address.
-
-        This method modifies the `registered_address` of a given `BusinessDetails` object based on a list of replacement rules and appends the processed object to a list.
-
-        Parameters:
-            processeds (List[BusinessDetails]): A list to store processed business details.
-            replacements (List[Tuple[str, str, bool]]): A list of tuples where:
-                - `current` (str): The substring to replace.
-                - `new` (str): The replacement string.
-                - `is_start` (bool): If True, the replacement applies only if `current` appears at the beginning of the address.
-            business_detail (BusinessDetails): The business detail object to be formatted.
-
-        Returns:
-            List[BusinessDetails]: The updated list of processed business details.
-        """
-        registered_address: Union[str, None] = business_detail.registered_address
-        if not registered_address:
-            processeds.append(business_detail)
-            return processeds
-        for current, new, is_start in replacements:
-            registered_address = self.__businessDetailsRegisteredAddressesFormatCorrectValue(current, new, is_start, registered_address)
-        business_detail.registered_address = registered_address
-        processeds.append(business_detail)
-        return processeds
-
-    def __businessDetailsRegisteredAddressesFormatCorrectValue(self, current_needle: str, new_needle: str, is_start: bool, registered_address: str) -> str:
-        """
-        Applying a specific formatting correction to a registered address.
-
-        This method checks whether a given substring (`current_needle`) is present in the `registered_address` and replaces it with `new_needle` based on the specified conditions.
-
-        Parameters:
-            current_needle (str): The substring to be replaced.
-            new_needle (str): The replacement string.
-            is_start (bool): If True, the replacement is applied only if `current_needle` appears at the beginning of `registered_address`.
-            registered_address (str): The address string to be formatted.
-
-        Returns:
-            str
-        """
-        if is_start and registered_address.startswith(current_needle):
-            return registered_address.replace(current_needle, new_needle, 1)
-        if not is_start and current_needle in registered_address.lower():
-            return registered_address.replace(current_needle, new_needle)
-        return registered_address
-
-    def sanitizeBusinessDetailsRegisteredAddressesFormat(self)-> None:
-        """
-        Formating the registered addresses into the correct format
-        for processing.
-
-        Returns:
-            void
-        """
-        business_details: List[BusinessDetails] = []
-        self.getLogger().inform(f"Business Details: Registered Address: Formating the registered addresses into the correct format for processing.\nAmount: {len(self.getBusinessDetailsData())}")
-        for index in range(0, len(self.getBusinessDetailsData()), 1):
-            business_detail: BusinessDetails = self.getBusinessDetailsData()[index]
-            registered_address: Union[str, None] = " ".join([address for address in business_detail.registered_address.split(" ") if address != ""]).title() if business_detail.registered_address != None else business_detail.registered_address
-            business_detail.registered_address = registered_address
-            business_details.append(business_detail)
-        self.setBusinessDetailsData(business_details)
-
-    def sanitizeBusinessDetailOperationalAddress(self) -> None:
-        """
-        Sanitizing the operational addresses which are going to be
-        used by the geographical information system to be able to
-        process it afterwards.
-
-        Returns:
-            void
-        """
-        self.sanitizeBusinessDetailOperationalAddressFormat()
-        self.sanitizeBusinessDetailOperationalAddressMissingAddress()
-        self.sanitizeBusinessDetailOperationalAddressTruncatedAddress()
-
-    def sanitizeBusinessDetailOperationalAddressTruncatedAddress(self) -> None:
-        """
-        Setting the data of the operational address to be the one of
-        the registered for the ones that have truncated data.
-
-        Returns:
-            void
-        """
-        truncated_data: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData() if business_details.operational_address != None and business_details.registered_address != None and business_details.operational_address in business_details.registered_address]
-        filtered_business_details: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData()if business_details not in truncated_data]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Operational Address: Setting the data of the operational address to be the one of the registered for the ones that have truncated data.\nAmount: {len(truncated_data)}")
-        for index in range(0, len(truncated_data), 1):
-            truncated_data[index].operational_address = truncated_data[index].registered_address
-        self.setBusinessDetailsData(truncated_data + filtered_business_details)
-
-    def sanitizeBusinessDetailOperationalAddressMissingAddress(self) -> None:
-        """
-        Setting the data operational address to be the one of the
-        registered address for the ones missing data.
-
-        Returns:
-            void
-        """
-        missing_addresses: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData() if business_details.operational_address == "Mauritius" or business_details.operational_address == "() Mauritius" or business_details.operational_address == "Mauritius Mauritius"]
-        filtered_business_details: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData()if business_details not in missing_addresses]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Operational Address: Setting the data operational address to be the one of the registered address for the ones missing data.\nAmount: {len(missing_addresses)}")
-        for index in range(0, len(missing_addresses), 1):
-            missing_addresses[index].operational_address = missing_addresses[index].registered_address
-        self.setBusinessDetailsData(missing_addresses + filtered_business_details)
-
-    def sanitizeBusinessDetailOperationalAddressFormat(self) -> None:
-        """
-        Formating the operational addresses into the correct format
-        for processing.
-
-        Returns:
-            void
-        """
-        business_details: List[BusinessDetails] = []
-        self.getLogger().inform(f"Business Details: Operational Address: Formating the operational addresses into the correct format for processing.\nAmount: {len(self.getBusinessDetailsData())}")
-        for index in range(0, len(self.getBusinessDetailsData()), 1):
-            business_detail: BusinessDetails = self.getBusinessDetailsData()[index]
-            operational_address: Union[str, None] = " ".join([address for address in business_detail.operational_address.split(" ") if address != ""]).title() if business_detail.operational_address != None else business_detail.operational_address
-            business_detail.operational_address = operational_address
-            business_details.append(business_detail)
-        self.setBusinessDetailsData(business_details)
-
-    def sanitizeBusinessDetailsRegisteredAddressesErroneous(self) -> None:
-        """
-        Sanitizing the registered addresses that are going to be
-        used by the geographical information system to be able to
-        process it afterwards.
-
-        Returns:
-            void
-        """
-        erroneous_registered_addresses: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.registered_address != None and bool(search(r"\d", business_detail.registered_address)) == True]
-        self.getLogger().inform(f"Business Details: Registered Address: Sanitizing the registered addresses that are going to be used by the geographical information system to be able to process it afterwards.\nAmount: {len(erroneous_registered_addresses)}")
-        filtered_business_details: List[BusinessDetails] = [business_details for business_details in self.getBusinessDetailsData()if business_details not in erroneous_registered_addresses]
-        self.setBusinessDetailsData([])
-        for index in range(0, len(erroneous_registered_addresses), 1):
-            registered_addresses: List[str] = erroneous_registered_addresses[index].registered_address.split(" ") # type: ignore
-            registered_addresses = [address for address in registered_addresses if address != ""]
-            registered_addresses = [address for address in registered_addresses if bool(search(r"\d", address)) == False]
-            registered_addresses = [address for address in registered_addresses if address != "No"]
-            registered_addresses = [address for address in registered_addresses if address != "No."]
-            registered_addresses = [address for address in registered_addresses if address != "Floor"]
-            registered_addresses = [address for address in registered_addresses if address != "Lot"]
-            registered_addresses = [address for address in registered_addresses if address != "Plot"]
-            registered_addresses = [address for address in registered_addresses if address != "Suite"]
-            registered_addresses = [address for address in registered_addresses if address != "Level"]
-            registered_addresses = [address for address in registered_addresses if address != "Effective"]
-            registered_addresses = [address for address in registered_addresses if address != "Date"]
-            registered_addresses = [address for address in registered_addresses if address != "For"]
-            registered_addresses = [address for address in registered_addresses if address != "Registered"]
-            registered_addresses = [address for address in registered_addresses if address != "Office"]
-            registered_addresses = [address for address in registered_addresses if address != "Address:"]
-            registered_addresses = [address for address in registered_addresses if address != "(Ex"]
-            registered_addresses = [address for address in registered_addresses if address != "Office"]
-            registered_addresses = [address for address in registered_addresses if address != "Gds"]
-            registered_addresses = [address for address in registered_addresses if address != "-"]
-            registered_addresses = [address for address in registered_addresses if address != "Apt."]
-            registered_addresses = [address for address in registered_addresses if address != "Hse"]
-            registered_addresses = [address.capitalize() for address in registered_addresses]
-            registered_address: str = " ".join(registered_addresses)
-            erroneous_registered_addresses[index].registered_address = registered_address
-        self.setBusinessDetailsData(filtered_business_details + erroneous_registered_addresses)
-
-    def sanitizeBusinessDetailsNameSameNames(self) -> None:
-        """
-        Replacing placeholder business names with their corresponding company names.
-
-        This method processes business details where the `name` field contains placeholder values such as `"."` or `"-"`. It replaces these placeholders with the actual company names retrieved from `CompanyDetails`.
-
-        Returns:
-            None
+            None
         """
         names: List[str] = [".", "-"]
         same_names: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.name in names]
         filtered_business_data: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail not in same_names]
         self.getLogger().inform(f"Business Details: Name: The names are being sanitized where '.' will be replaced by their company names.\nAmount: {len(same_names)}")
         for business_detail in same_names:
-            company_detail: CompanyDetails = [company_detail for company_detail in self.getCompanyDetailsData() if company_detail.identifier == business_detail.CompanyDetail][0]
+            company_detail: CompanyDetails = self.getCompanyDetailsIndex()[business_detail.CompanyDetail]
             business_detail.name = company_detail.name.title()
         self.setBusinessDetailsData(same_names + filtered_business_data)
 
@@ -2576,7 +2738,7 @@ class Builder:
         self.getLogger().inform(f"Business Details: Name: The names are being sanitized where the values which are the country names will be replaced by their company names.\nAmount: {len(countries_names)}")
         self.setBusinessDetailsData([])
         for index in range(0, len(countries_names), 1):
-            company_detail: CompanyDetails = [company_detail for company_detail in self.getCompanyDetailsData() if company_detail.identifier == countries_names[index].CompanyDetail][0]
+            company_detail: CompanyDetails = self.getCompanyDetailsIndex()[countries_names[index].CompanyDetail]
             countries_names[index].name = company_detail.name.title()
         self.setBusinessDetailsData(countries_names + filtered_business_data)
 
@@ -2593,7 +2755,7 @@ class Builder:
         self.getLogger().inform(f"Business Details: Name: The names are being sanitized where there is no business name given that they are domestic companies which are the country names will be replaced by their company names.\nAmount: {len(no_name_domestic_companies)}")
         self.setBusinessDetailsData([])
         for index in range(0, len(no_name_domestic_companies), 1):
-            company_detail: CompanyDetails = [company_detail for company_detail in self.getCompanyDetailsData() if company_detail.identifier == no_name_domestic_companies[index].CompanyDetail][0]
+            company_detail: CompanyDetails = self.getCompanyDetailsIndex()[no_name_domestic_companies[index].CompanyDetail]
             no_name_domestic_companies[index].name = company_detail.name.title()
         self.setBusinessDetailsData(no_name_domestic_companies + filtered_business_data)
 
@@ -2610,7 +2772,7 @@ class Builder:
         self.getLogger().inform(f"Business Details: Name: The names are being sanitized where they are the addresses in the names which are the country names will be replaced by their company names.\nAmount: {len(addresses_as_names)}")
         self.setBusinessDetailsData([])
         for index in range(0, len(addresses_as_names), 1):
-            company_detail: CompanyDetails = [company_detail for company_detail in self.getCompanyDetailsData() if company_detail.identifier == addresses_as_names[index].CompanyDetail][0]
+            company_detail: CompanyDetails = self.getCompanyDetailsIndex()[addresses_as_names[index].CompanyDetail]
             addresses_as_names[index].name = company_detail.name.title()
         self.setBusinessDetailsData(addresses_as_names + filtered_business_data)
 
@@ -2626,7 +2788,7 @@ class Builder:
         self.getLogger().inform(f"Business Details: Name: The names are being sanitized where the business name are the business natures which are the country names will be replaced by their company names.\nAmount: {len(names_as_natures)}")
         self.setBusinessDetailsData([])
         for index in range(0, len(names_as_natures), 1):
-            company_detail: CompanyDetails = [company_detail for company_detail in self.getCompanyDetailsData() if company_detail.identifier == names_as_natures[index].CompanyDetail][0]
+            company_detail: CompanyDetails = self.getCompanyDetailsIndex()[names_as_natures[index].CompanyDetail]
             names_as_natures[index].name = company_detail.name.title()
         self.setBusinessDetailsData(names_as_natures + filtered_business_data)
 
@@ -2668,558 +2830,164 @@ class Builder:
         """
         The natures have to be sanitized to be processed afterwards
         to obtain the sector of activity of the company by doing a
-        sentiment analysis.
-
-        Returns:
-            void
-        """
-        self.sanitizeBusinessDetailsNatureSameAsName()
-        self.sanitizeBusinessDetailsNatureJobContractors()
-        self.sanitizeBusinessDetailsNatureNotElsewhereClassified()
-        self.sanitizeBusinessDetailsNatureOtherProfessionalScientificTechnicalActivities()
-        self.sanitizeBusinessDetailsNatureFirms()
-        self.sanitizeBusinessDetailsNatureGeneralRetailers()
-        self.sanitizeBusinessDetailsNatureWholesalers()
-        self.sanitizeBusinessDetailsNatureHeadOffices()
-        self.sanitizeBusinessDetailsNatureWebPortals()
-        self.sanitizeBusinessDetailsNatureRestaurants()
-        self.sanitizeBusinessDetailsNatureInvestmentCompanies()
-        self.sanitizeBusinessDetailsNatureRealEstate()
-        self.sanitizeBusinessDetailsNatureManagementCompanies()
-        self.sanitizeBusinessDetailsNatureOtherBusinessSupportActivites()
-        self.sanitizeBusinessDetailsNatureFreightTransportation()
-        self.sanitizeBusinessDetailsNatureMotorVehicleRental()
-        self.sanitizeBusinessDetailsNatureRentingOfPassengerCar()
-        self.sanitizeBusinessDetailsNaturePrePrimaryEducation()
-        self.sanitizeBusinessDetailsNatureFrozenProductsRetailers()
-        self.sanitizeBusinessDetailsNatureOtherTourismReservationActivities()
-        self.sanitizeBusinessDetailsNatureClothingRetailers()
-        self.sanitizeBusinessDetailsNatureHardwareRetailers()
-        self.sanitizeBusinessDetailsNatureBreadManufacturers()
-        self.sanitizeBusinessDetailsNatureRepairElectricalEquipment()
-        self.sanitizeBusinessDetailsNaturePhotoAndVideoEditing()
-        self.sanitizeBusinessDetailsNatureResidentialNursingCareActivities()
-        self.sanitizeBusinessDetailsNatureConstructionOfBuildings()
-        self.sanitizeBusinessDetailsNatureDevelopmentOfBuildings()
-        self.sanitizeBusinessDetailsNaturePlantingAndEstablishingOfCrops()
-        self.sanitizeBusinessDetailsNaturePackagingActivities()
-        self.sanitizeBusinessDetailsNatureEventCatering()
-
-    def sanitizeBusinessDetailsNatureEventCatering(self) -> None:
-        """
-        Sanitizing the nature where they are classified as event
-        catering.
+        sentiment analysis.  Every business detail is classified
+        once against the rules of the natures and the distinct
+        natures are only classified once.
 
         Returns:
             void
         """
-        event_catering: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "event catering" in business_detail.nature.lower()]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in event_catering]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as event catering.\nAmount: {len(event_catering)}")
-        for index in range(0, len(event_catering), 1):
-            event_catering[index].nature = "Event Catering"
-        self.setBusinessDetailsData(event_catering + filtered_business_details)
-
-    def sanitizeBusinessDetailsNaturePackagingActivities(self) -> None:
-        """
-        Sanitizing the nature where they are classified as packaging
-        activities.
-
-        Returns:
-            void
-        """
-        packaging_activities: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "packaging" in business_detail.nature.lower()]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in packaging_activities]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as packaging activities.\nAmount: {len(packaging_activities)}")
-        for index in range(0, len(packaging_activities), 1):
-            packaging_activities[index].nature = "Packaging Activities"
-        self.setBusinessDetailsData(packaging_activities + filtered_business_details)
-
-    def sanitizeBusinessDetailsNaturePlantingAndEstablishingOfCrops(self) -> None:
-        """
-        Sanitizing the nature where they are classified as
-        planting and establishing crops.
-
-        Returns:
-            void
-        """
-        planting_and_establishing_of_crops: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("planting" in business_detail.nature.lower() and "crops" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in planting_and_establishing_of_crops]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as planting and establishing crops.\nAmount: {len(planting_and_establishing_of_crops)}")
-        for index in range(0, len(planting_and_establishing_of_crops), 1):
-            planting_and_establishing_of_crops[index].nature = "Planting And Establishing Of Crops"
-        self.setBusinessDetailsData(planting_and_establishing_of_crops + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureDevelopmentOfBuildings(self) -> None:
-        """
-        Sanitizing the nature where they are classified as
-        development of buildings.
-
-        Returns:
-            void
-        """
-        development_of_buildings: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("development" in business_detail.nature.lower() and "building" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in development_of_buildings]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as development of buildings.\nAmount: {len(development_of_buildings)}")
-        for index in range(0, len(development_of_buildings), 1):
-            development_of_buildings[index].nature = "Construction Of Buildings"
-        self.setBusinessDetailsData(development_of_buildings + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureConstructionOfBuildings(self) -> None:
-        """
-        Sanitizing the nature where they are classified as
-        construction of buildings.
-
-        Returns:
-            void
-        """
-        construction_of_buildings: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("construction" in business_detail.nature.lower() and "building" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in construction_of_buildings]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as construction of buildings.\nAmount: {len(construction_of_buildings)}")
-        for index in range(0, len(construction_of_buildings), 1):
-            construction_of_buildings[index].nature = "Construction Of Buildings"
-        self.setBusinessDetailsData(construction_of_buildings + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureResidentialNursingCareActivities(self) -> None:
-        """
-        Sanitizing the nature where they are classified as
-        residential nursing care activities.
-
-        Returns:
-            void
-        """
-        residential_nursing_care_activities: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Residential" in business_detail.nature and "Nursing" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in residential_nursing_care_activities]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as residential nursing care activities.\nAmount: {len(residential_nursing_care_activities)}")
-        for index in range(0, len(residential_nursing_care_activities), 1):
-            residential_nursing_care_activities[index].nature = "Residential Nursing Care Activities"
-        self.setBusinessDetailsData(residential_nursing_care_activities + filtered_business_details)
-
-    def sanitizeBusinessDetailsNaturePhotoAndVideoEditing(self) -> None:
-        """
-        Sanitizing the nature where they are photographers.
-
-        Returns:
-            void
-        """
-        content_creators: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "Photograph" in business_detail.nature]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in content_creators]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are photographers.\nAmount: {len(content_creators)}")
-        for index in range(0, len(content_creators), 1):
-            content_creators[index].nature = "Photo And Video Editing"
-        self.setBusinessDetailsData(content_creators + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureRepairElectricalEquipment(self) -> None:
-        """
-        Sanitizing the nature where they are repairers of electrical
-        equipment.
-
-        Returns:
-            void
-        """
-        electrical_repairers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Repair" in business_detail.nature and "Electrical" in business_detail.nature and "Equipment" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in electrical_repairers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are repairers of electrical equipment.\nAmount: {len(electrical_repairers)}")
-        for index in range(0, len(electrical_repairers), 1):
-            electrical_repairers[index].nature = "Repair Of Electrical Equipment"
-        self.setBusinessDetailsData(electrical_repairers + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureBreadManufacturers(self) -> None:
-        """
-        Sanitizing the nature where they are bread manufacturers.
-
-        Returns:
-            void
-        """
-        bread_manufacturers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Manufacture" in business_detail.nature and "Bread" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in bread_manufacturers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are bread manufacturers.\nAmount: {len(bread_manufacturers)}")
-        for index in range(0, len(bread_manufacturers), 1):
-            bread_manufacturers[index].nature = "Manufacture Of Bread"
-        self.setBusinessDetailsData(bread_manufacturers + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureHardwareRetailers(self) -> None:
-        """
-        Sanitizing the nature where they are hardware retailers.
-
-        Returns:
-            void
-        """
-        hardware_retailers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Retail" in business_detail.nature and "Hardware" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in hardware_retailers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are hardware retailers.\nAmount: {len(hardware_retailers)}")
-        for index in range(0, len(hardware_retailers), 1):
-            hardware_retailers[index].nature = "Retail Sale Of Hardware"
-        self.setBusinessDetailsData(hardware_retailers + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureClothingRetailers(self) -> None:
-        """
-        Sanitizing the nature where they are clothing retailers.
-
-        Returns:
-            void
-        """
-        clothing_retailers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("retail" in business_detail.nature.lower() and "clothing" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in clothing_retailers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are clothing retailers.\nAmount: {len(clothing_retailers)}")
-        for index in range(0, len(clothing_retailers), 1):
-            clothing_retailers[index].nature = "Retail Sale Of Clothing"
-        self.setBusinessDetailsData(clothing_retailers + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureOtherTourismReservationActivities(self) -> None:
-        """
-        Sanitizing the nature where they are clasified as other
-        tourism reservation activities.
-
-        Returns:
-            void
-        """
-        other_tourism_reservation_activities: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Other" in business_detail.nature and "Tourism" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in other_tourism_reservation_activities]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are clasified as other tourism reservation activities.\nAmount: {len(other_tourism_reservation_activities)}")
-        for index in range(0, len(other_tourism_reservation_activities), 1):
-            other_tourism_reservation_activities[index].nature = "Other Tourism Reservation Services"
-        self.setBusinessDetailsData(other_tourism_reservation_activities + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureFrozenProductsRetailers(self) -> None:
-        """
-        Sanitizing the nature where they are frozen products
-        retailers.
-
-        Returns:
-            void
-        """
-        frozen_product_retailers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Retail" in business_detail.nature and "Poultry" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in frozen_product_retailers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are frozen products retailers.\nAmount: {len(frozen_product_retailers)}")
-        for index in range(0, len(frozen_product_retailers), 1):
-            frozen_product_retailers[index].nature = "Retail Sale of Frozen Products"
-        self.setBusinessDetailsData(frozen_product_retailers + filtered_business_details)
-
-    def sanitizeBusinessDetailsNaturePrePrimaryEducation(self) -> None:
-        """
-        Sanitizing the nature where they are pre-primary schools.
-
-        Returns:
-            void
-        """
-        pre_primary_school: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Pre" in business_detail.nature and "Primary" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in pre_primary_school]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are pre-primary schools.\nAmount: {len(pre_primary_school)}")
-        for index in range(0, len(pre_primary_school), 1):
-            pre_primary_school[index].nature = "Pre-Primary Education"
-        self.setBusinessDetailsData(pre_primary_school + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureRentingOfPassengerCar(self) -> None:
-        """
-        Sanitizing the nature where they are motor vehicles rental
-        companies.
-
-        Returns:
-            void
-        """
-        motor_vehicle_rentals: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Renting" in business_detail.nature and "Car" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in motor_vehicle_rentals]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are motor vehicles rental companies.\nAmount: {len(motor_vehicle_rentals)}")
-        for index in range(0, len(motor_vehicle_rentals), 1):
-            motor_vehicle_rentals[index].nature = "Motor Vehicles Rental"
-        self.setBusinessDetailsData(motor_vehicle_rentals + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureMotorVehicleRental(self) -> None:
-        """
-        Sanitizing the nature where they are motor vehicles rental
-        companies.
-
-        Returns:
-            void
-        """
-        motor_vehicle_rentals: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Contractor" in business_detail.nature and "Motor" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in motor_vehicle_rentals]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are motor vehicles rental companies.\nAmount: {len(motor_vehicle_rentals)}")
-        for index in range(0, len(motor_vehicle_rentals), 1):
-            motor_vehicle_rentals[index].nature = "Motor Vehicles Rental"
-        self.setBusinessDetailsData(motor_vehicle_rentals + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureFreightTransportation(self) -> None:
-        """
-        Sanitizing the nature where they are freight transportation
-        companies.
-
-        Returns:
-            void
-        """
-        freight_transportations: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "Freight Transport" in business_detail.nature]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in freight_transportations]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are freight transportation companies.\nAmount: {len(freight_transportations)}")
-        for index in range(0, len(freight_transportations), 1):
-            freight_transportations[index].nature = "Freight Transport"
-        self.setBusinessDetailsData(freight_transportations + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureOtherBusinessSupportActivites(self) -> None:
-        """
-        Sanitizing the nature where they are classified as Other
-        Business Support Activities.
-
-        Returns:
-            void
-        """
-        other_business_support_activities: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "Other Business Support Service Activities" in business_detail.nature]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in other_business_support_activities]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are classified as Other Business Support Activities.\nAmount: {len(other_business_support_activities)}")
-        for index in range(0, len(other_business_support_activities), 1):
-            other_business_support_activities[index].nature = "Other Business Support Service Activities"
-        self.setBusinessDetailsData(other_business_support_activities + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureManagementCompanies(self) -> None:
-        """
-        Sanitizing the nature where they are management companies.
-
-        Returns:
-            void
-        """
-        management_companies: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "Holding" in business_detail.nature]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in management_companies]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are management companies.\nAmount: {len(management_companies)}")
-        for index in range(0, len(management_companies), 1):
-            management_companies[index].nature = "Management Companies"
-        self.setBusinessDetailsData(management_companies + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureRealEstate(self) -> None:
-        """
-        Sanitizing the nature where they are real estate.
-
-        Returns:
-            void
-        """
-        real_estate: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "real estate" in business_detail.nature.lower()]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in real_estate]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are real estate.\nAmount: {len(real_estate)}")
-        for index in range(0, len(real_estate), 1):
-            real_estate[index].nature = "Real Estate Activities"
-        self.setBusinessDetailsData(real_estate + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureInvestmentCompanies(self) -> None:
-        """
-        Sanitizing the nature where they are investment companies.
-
-        Returns:
-            void
-        """
-        investment_companies: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("investment" in business_detail.nature.lower() and "companies" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in investment_companies]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are investment companies.\nAmount: {len(investment_companies)}")
-        for index in range(0, len(investment_companies), 1):
-            investment_companies[index].nature = "Investment Companies"
-        self.setBusinessDetailsData(investment_companies + filtered_business_details)
+        same_as_name: str = "Other Business Support Activities"
+        hits: Dict[str, int] = {"the same as the name": 0}
+        hits.update({label: 0 for label, patterns, nature in business_details_nature_rules})
+        natures: Dict[str, Tuple[str, List[str]]] = {}
+        for business_detail in self.getBusinessDetailsData():
+            if business_detail.nature == None:
+                continue
+            nature: str = str(business_detail.nature)
+            if business_detail.name != None and nature in str(business_detail.name):
+                hits["the same as the name"] += 1
+                nature = same_as_name
+            if nature not in natures:
+                natures[nature] = self.classifyBusinessDetailsNature(nature)
+            classified_nature, labels = natures[nature]
+            for label in labels:
+                hits[label] += 1
+            business_detail.nature = classified_nature
+        for label, amount in hits.items():
+            self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where it is {label}.\nAmount: {amount}")
+
+    def classifyBusinessDetailsNature(self, nature: str) -> Tuple[str, List[str]]:
+        """
+        Classifying the nature of a business against the rules of
+        the natures.  The rules are applied in their order and a
+        rule is evaluated against the nature that has been produced
+        by the previous rules, so that the later rules take
+        precedence.
 
-    def sanitizeBusinessDetailsNatureRestaurants(self) -> None:
-        """
-        Sanitizing the nature where they are restaurants.
+        Parameters:
+            nature (str): The nature of the business.
 
         Returns:
-            void
-        """
-        restaurants: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("Restaurants" in business_detail.nature or "Restaurant" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in restaurants]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are restaurants.\nAmount: {len(restaurants)}")
-        for index in range(0, len(restaurants), 1):
-            restaurants[index].nature = "Restaurants"
-        self.setBusinessDetailsData(restaurants + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureWebPortals(self) -> None:
+            (str, [str])
         """
-        Sanitizing the nature where they are web portals.
+        labels: List[str] = []
+        for label, patterns, classified_nature in business_details_nature_rules:
+            if not all([pattern.search(nature) != None for pattern in patterns]):
+                continue
+            labels.append(label)
+            nature = classified_nature if classified_nature != None else patterns[0].sub("", nature)
+        return (nature, labels)
 
-        Returns:
-            void
+    def renumber(self, dataset: Iterable[Union[Member, Shareholder, OfficeBearer]]) -> Iterator[Union[Member, Shareholder, OfficeBearer]]:
         """
-        web_portals: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "web portals" in business_detail.nature.lower()]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in web_portals]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are web portals.\nAmount: {len(web_portals)}")
-        for index in range(0, len(web_portals), 1):
-            web_portals[index].nature = "Activities Of Head Offices"
-        self.setBusinessDetailsData(web_portals + filtered_business_details)
+        Renumbering the curated records from one as they are being
+        stored.
 
-    def sanitizeBusinessDetailsNatureHeadOffices(self) -> None:
-        """
-        Sanitizing the nature where they are head offices.
+        Parameters:
+            dataset (Iterable[Union[Member, Shareholder, OfficeBearer]]): The curated records.
 
         Returns:
-            void
-        """
-        head_offices: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "head offices" in business_detail.nature.lower()]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in head_offices]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are head offices.\nAmount: {len(head_offices)}")
-        for index in range(0, len(head_offices), 1):
-            head_offices[index].nature = "Activities Of Head Offices"
-        self.setBusinessDetailsData(head_offices + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureWholesalers(self) -> None:
+            Iterator[Union[Member, Shareholder, OfficeBearer]]
         """
-        Sanitizing the nature where they are wholesalers.
+        for identifier, record in enumerate(dataset, 1):
+            record.identifier = identifier
+            yield record
 
-        Returns:
-            void
+    def curateOfficeBearer(self, is_incremental: bool = False, batch_size: int = 10000) -> None:
         """
-        wholesalers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "non-specialised wholesale trade" in business_detail.nature.lower()]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in wholesalers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are wholesalers.\nAmount: {len(wholesalers)}")
-        for index in range(0, len(wholesalers), 1):
-            wholesalers[index].nature = "Non-Specialised Wholesale Trade"
-        self.setBusinessDetailsData(wholesalers + filtered_business_details)
+        Curating the data that is in the Office Bearers table.
+        Curating the positions into the form needed.  Curating and
+        sanitizing the name into the form needed.  Curating and
+        sanitizing the address in to the form needed.
+        The table is read and curated page by page, so that only one
+        page of office bearers is held in memory at a time.
 
-    def sanitizeBusinessDetailsNatureGeneralRetailers(self) -> None:
-        """
-        Sanitizing the nature where they are general retailers.
+        Parameters:
+            is_incremental (bool): Whether only the office bearers which have not been curated yet are curated and updated in place.
+            batch_size (int): The amount of office bearers to be curated per page.
 
         Returns:
             void
         """
-        general_retailers: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("general retailer" in business_detail.nature.lower() or "foodstuff" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in general_retailers]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where they are general retailers.\nAmount: {len(general_retailers)}")
-        for index in range(0, len(general_retailers), 1):
-            general_retailers[index].nature = "General Retailer"
-        self.setBusinessDetailsData(general_retailers + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureFirms(self) -> None:
-        """
-        Sanitizing the nature where '(Firm)' are removed.
+        quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
+        current_time: int = int(time())
+        amounts: Dict[str, int] = {"amount": 0, "amount_found": 0}
+        pages: Iterator[List[int]] = self.iterCuratedOfficeBearers(self.getOfficeBearers().iterUncurated(batch_size) if is_incremental else self.getOfficeBearers().iterAll(batch_size), amounts)
+        status: int = self.storeCuratedOfficeBearersIncrementally(pages) if is_incremental else self.storeCuratedOfficeBearers(pages)
+        self.setOfficeBearerData([])
+        log: Tuple[str, str, int, int, int, int, int] = ("curateOfficeBearer", quarter.quarter, current_time, current_time, status, amounts["amount"], amounts["amount_found"])
+        self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
 
-        Returns:
-            void
+    def iterCuratedOfficeBearers(self, pages: Iterator[List[OfficeBearer]], amounts: Dict[str, int]) -> Iterator[List[int]]:
         """
-        firms: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and "(Firm)" in business_detail.nature]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in firms]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where it is 'Other Professional, Scientific And Technical Activities'.\nAmount: {len(firms)}")
-        for index in range(0, len(firms), 1):
-            nature: str = str(firms[index].nature).replace("(Firm)", "")
-            firms[index].nature = nature
-        self.setBusinessDetailsData(firms + filtered_business_details)
+        Curating the office bearers page by page.  The curated page is
+        kept in the cache memory while the identifiers of the page,
+        as they were before the curation, are yielded.
 
-    def sanitizeBusinessDetailsNatureOtherProfessionalScientificTechnicalActivities(self) -> None:
-        """
-        Sanitizing the nature where it is 'Other Professional,
-        Scientific And Technical Activities'.
+        Parameters:
+            pages (Iterator[List[OfficeBearer]]): The pages of office bearers to be curated.
+            amounts (Dict[str, int]): The amounts of office bearers read and kept, which are accumulated.
 
         Returns:
-            void
+            Iterator[List[int]]
         """
-        other_professional_scientific_technical_activities: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("other" in business_detail.nature.lower() and "professional" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in other_professional_scientific_technical_activities]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where it is 'Other Professional, Scientific And Technical Activities'.\nAmount: {len(other_professional_scientific_technical_activities)}")
-        for index in range(0, len(other_professional_scientific_technical_activities), 1):
-            other_professional_scientific_technical_activities[index].nature = "Other Professional, Scientific And Technical Activities"
-        self.setBusinessDetailsData(other_professional_scientific_technical_activities + filtered_business_details)
+        for page in pages:
+            amounts["amount"] += len(page)
+            self.setOfficeBearerData(page)
+            self.curateOfficeBearerPosition()
+            self.curateOfficeBearerName()
+            self.curateOfficeBearerAddress()
+            amounts["amount_found"] += len(self.getOfficeBearerData())
+            yield [office_bearer.identifier for office_bearer in page]
 
-    def sanitizeBusinessDetailsNatureNotElsewhereClassified(self) -> None:
+    def storeCuratedOfficeBearers(self, pages: Iterator[List[int]]) -> int:
         """
-        Sanitizing the nature where it is the "Not Elsewhere
-        Classfied" but it will be changed to "Other Business Support
-        Activities".
-
-        Returns:
-            void
-        """
-        not_elsewhere_classified: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("N.E.C" in business_detail.nature or "n.e.c" in business_detail.nature)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in not_elsewhere_classified]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where it is the 'Not Elsewhere Classfied' but it will be changed to 'Other Business Support Activities'.\nAmount: {len(not_elsewhere_classified)}")
-        for index in range(0, len(not_elsewhere_classified), 1):
-            not_elsewhere_classified[index].nature = "Other Business Support Activities"
-        self.setBusinessDetailsData(not_elsewhere_classified + filtered_business_details)
+        Replacing the whole table by the curated office bearers, which are
+        renumbered from one.  They are loaded into a shadow table
+        which is swapped with the live one, so that a failed load
+        leaves the live table untouched.
 
-    def sanitizeBusinessDetailsNatureJobContractors(self) -> None:
-        """
-        Sanitizing the nature where it is the "Job Contractor" but
-        it will be changed to "Other Business Support Activities".
+        Parameters:
+            pages (Iterator[List[int]]): The pages of office bearers which are curated into the cache memory.
 
         Returns:
-            void
-        """
-        job_contractors: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and ("job contractor" in business_detail.nature.lower() or "A," in business_detail.nature or "grade" in business_detail.nature.lower())]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in job_contractors]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where it is the 'Job Contractor' but it will be changed to 'Other Business Support Activities'.\nAmount: {len(job_contractors)}")
-        for index in range(0, len(job_contractors), 1):
-            job_contractors[index].nature = "Other Business Support Activities"
-        self.setBusinessDetailsData(job_contractors + filtered_business_details)
-
-    def sanitizeBusinessDetailsNatureSameAsName(self) -> None:
+            int
         """
-        Sanitizing the nature where it is the same as the name but
-        it will be changed to "Other Business Support Activities".
+        accepted: int = 202
+        created: int = 201
+        dataset: Iterator[OfficeBearer] = (office_bearer for _ in pages for office_bearer in self.getOfficeBearerData())
+        status: int = self.getOfficeBearers().replaceCuratedOfficeBearers(self.renumber(dataset)) # type: ignore
+        return accepted if status == created else status
 
-        Returns:
-            void
+    def storeCuratedOfficeBearersIncrementally(self, pages: Iterator[List[int]]) -> int:
         """
-        same_as_name: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData() if business_detail.nature != None and business_detail.name != None and (business_detail.nature == business_detail.name or business_detail.nature in business_detail.name)]
-        filtered_business_details: List[BusinessDetails] = [business_detail for business_detail in self.getBusinessDetailsData()if business_detail not in same_as_name]
-        self.setBusinessDetailsData([])
-        self.getLogger().inform(f"Business Details: Nature: Sanitizing the nature where it is the same as the name but it will be changed to 'Other Business Support Activities'.\nAmount: {len(same_as_name)}")
-        for index in range(0, len(same_as_name), 1):
-            same_as_name[index].nature = "Other Business Support Activities"
-        self.setBusinessDetailsData(same_as_name + filtered_business_details)
+        Updating the curated office bearers in place and deleting the ones
+        which have been discarded by the curation, page by page, so
+        that the identifiers are preserved and the rest of the table
+        is left untouched.  The curation is unavailable if a page
+        cannot be retrieved.
 
-    def curateOfficeBearer(self) -> None:
-        """
-        Curating the data that is in the Office Bearers table.
-        Curating the positions into the form needed.  Curating and
-        sanitizing the name into the form needed.  Curating and
-        sanitizing the address in to the form needed.
+        Parameters:
+            pages (Iterator[List[int]]): The identifiers of the office bearers of each page which is curated into the cache memory.
 
         Returns:
-            void
+            int
         """
         no_content: int = 204
         accepted: int = 202
-        created: int = 201
-        quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
-        current_time: int = int(time())
-        self.setOfficeBearerData(self.getOfficeBearers().get())
-        amount: int = len(self.getOfficeBearerData())
-        self.curateOfficeBearerPosition()
-        self.curateOfficeBearerName()
-        self.curateOfficeBearerAddress()
-        dataset: List[OfficeBearer] = [office_bearer for office_bearer in self.getOfficeBearerData()]
-        for index in range(0, len(dataset), 1):
-            identifier: int = index + 1
-            dataset[index].identifier = identifier
-        self.setOfficeBearerData(dataset)
-        amount_found: int = len(self.getOfficeBearerData())
-        status: int = self.getOfficeBearers().delete()
-        statuses: List[int] = list(set([self.getOfficeBearers().addCuratedDirectors(office_bearer) for office_bearer in self.getOfficeBearerData()])) if status == no_content else [status]
-        status = accepted if len(statuses) == 1 and statuses[0] == created else statuses[0]
-        log: Tuple[str, str, int, int, int, int, int] = ("curateOfficeBearer", quarter.quarter, current_time, current_time, status, amount, amount_found)
-        self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
+        service_unavailable: int = 503
+        statuses: List[int] = []
+        try:
+            for identifiers in pages:
+                curated_identifiers: Set[int] = {office_bearer.identifier for office_bearer in self.getOfficeBearerData()}
+                status: int = self.getOfficeBearers().deleteMany([identifier for identifier in identifiers if identifier not in curated_identifiers])
+                statuses += self.getOfficeBearers().updateCuratedOfficeBearers(self.getOfficeBearerData()) if status == no_content else [status]
+        except (Error, RuntimeError) as error:
+            statuses.append(service_unavailable)
+            self.getLogger().error(f"Office Bearer: The pages cannot be retrieved.\nStatus: {service_unavailable}\nError: {error}")
+        self.getLogger().inform(f"Office Bearer: The curated office bearers have been updated in place.\nChunks: {len(statuses)}\nFailed Chunks: {statuses.count(service_unavailable)}")
+        return service_unavailable if service_unavailable in statuses else accepted
 
     def curateOfficeBearerPosition(self) -> None:
         """
@@ -3276,87 +3044,136 @@ class Builder:
         self.getLogger().inform(f"Office Bearer: Address: Curating and sanitizing the address into the form needed.\nFiltered Data: {len(filtered_data)}")
         self.setOfficeBearerData(filtered_data)
 
-    def curateShareholders(self) -> None:
+    def curateShareholders(self, is_incremental: bool = False, batch_size: int = 10000) -> None:
         """
         Curating the data that is in the Shareholders table.
         Curating and sanitizing the type of the shareholders.
         Curating and sanitizing the currency of the shareholders.
         Curating and sanitizing the name of the shareholders.
+        The table is read and curated page by page, so that only one
+        page of shareholders is held in memory at a time.
+
+        Parameters:
+            is_incremental (bool): Whether only the shareholders which have not been curated yet are curated and updated in place.
+            batch_size (int): The amount of shareholders to be curated per page.
 
         Returns:
             void
         """
-        no_content: int = 204
-        accepted: int = 202
-        created: int = 201
         quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
         current_time: int = int(time())
-        self.setShareholderData(self.getShareholders().get())
-        amount: int = len(self.getShareholderData())
-        self.curateShareholdersType()
-        self.curateShareholdersCurrency()
-        self.curateShareholdersName()
-        dataset: List[Shareholder] = [shareholder for shareholder in self.getShareholderData()]
-        for index in range(0, len(dataset), 1):
-            identifier: int = index + 1
-            dataset[index].identifier = identifier
-        self.setShareholderData(dataset)
-        amount_found: int = len(self.getShareholderData())
-        status: int = self.getShareholders().delete()
-        statuses: List[int] = list(set([self.getShareholders().addCuratedShareholder(shareholder) for shareholder in self.getShareholderData()])) if status == no_content else [status]
-        status = accepted if len(statuses) == 1 and statuses[0] == created else statuses[0]
-        log: Tuple[str, str, int, int, int, int, int] = ("curateShareholders", quarter.quarter, current_time, current_time, status, amount, amount_found)
+        amounts: Dict[str, int] = {"amount": 0, "amount_found": 0}
+        pages: Iterator[List[int]] = self.iterCuratedShareholders(self.getShareholders().iterUncurated(batch_size) if is_incremental else self.getShareholders().iterAll(batch_size), amounts)
+        status: int = self.storeCuratedShareholdersIncrementally(pages) if is_incremental else self.storeCuratedShareholders(pages)
+        self.setShareholderData([])
+        log: Tuple[str, str, int, int, int, int, int] = ("curateShareholders", quarter.quarter, current_time, current_time, status, amounts["amount"], amounts["amount_found"])
         self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
 
+    def iterCuratedShareholders(self, pages: Iterator[List[Shareholder]], amounts: Dict[str, int]) -> Iterator[List[int]]:
+        """
+        Curating the shareholders page by page.  The curated page is
+        kept in the cache memory while the identifiers of the page,
+        as they were before the curation, are yielded.
+
+        Parameters:
+            pages (Iterator[List[Shareholder]]): The pages of shareholders to be curated.
+            amounts (Dict[str, int]): The amounts of shareholders read and kept, which are accumulated.
+
+        Returns:
+            Iterator[List[int]]
+        """
+        for page in pages:
+            amounts["amount"] += len(page)
+            self.setShareholderData(page)
+            self.curateShareholdersType()
+            self.curateShareholdersCurrency()
+            self.curateShareholdersName()
+            amounts["amount_found"] += len(self.getShareholderData())
+            yield [shareholder.identifier for shareholder in page]
+
+    def storeCuratedShareholders(self, pages: Iterator[List[int]]) -> int:
+        """
+        Replacing the whole table by the curated shareholders, which are
+        renumbered from one.  They are loaded into a shadow table
+        which is swapped with the live one, so that a failed load
+        leaves the live table untouched.
+
+        Parameters:
+            pages (Iterator[List[int]]): The pages of shareholders which are curated into the cache memory.
+
+        Returns:
+            int
+        """
+        accepted: int = 202
+        created: int = 201
+        dataset: Iterator[Shareholder] = (shareholder for _ in pages for shareholder in self.getShareholderData())
+        status: int = self.getShareholders().replaceCuratedShareholders(self.renumber(dataset)) # type: ignore
+        return accepted if status == created else status
+
+    def storeCuratedShareholdersIncrementally(self, pages: Iterator[List[int]]) -> int:
+        """
+        Updating the curated shareholders in place and deleting the ones
+        which have been discarded by the curation, page by page, so
+        that the identifiers are preserved and the rest of the table
+        is left untouched.  The curation is unavailable if a page
+        cannot be retrieved.
+
+        Parameters:
+            pages (Iterator[List[int]]): The identifiers of the shareholders of each page which is curated into the cache memory.
+
+        Returns:
+            int
+        """
+        no_content: int = 204
+        accepted: int = 202
+        service_unavailable: int = 503
+        statuses: List[int] = []
+        try:
+            for identifiers in pages:
+                curated_identifiers: Set[int] = {shareholder.identifier for shareholder in self.getShareholderData()}
+                status: int = self.getShareholders().deleteMany([identifier for identifier in identifiers if identifier not in curated_identifiers])
+                statuses += self.getShareholders().updateCuratedShareholders(self.getShareholderData()) if status == no_content else [status]
+        except (Error, RuntimeError) as error:
+            statuses.append(service_unavailable)
+            self.getLogger().error(f"Shareholders: The pages cannot be retrieved.\nStatus: {service_unavailable}\nError: {error}")
+        self.getLogger().inform(f"Shareholders: The curated shareholders have been updated in place.\nChunks: {len(statuses)}\nFailed Chunks: {statuses.count(service_unavailable)}")
+        return service_unavailable if service_unavailable in statuses else accepted
+
     def curateShareholdersType(self) -> None:
         """
-        Curating and sanitizing the type of the shares.
+        Curating and sanitizing the type of the shares.  The types
+        are dictionary encoded, so that each rule is evaluated once
+        per distinct type, and the ones matching no rule are curated
+        as Ordinary Shares.
 
         Returns:
             void
         """
-        ordinary: List[Shareholder] = [shareholder for shareholder in self.getShareholderData() if "ordinary" in shareholder.type_shares.lower()]
-        remaining_data: List[Shareholder] = [shareholder for shareholder in self.getShareholderData() if shareholder not in ordinary]
-        social_part: List[Shareholder] = [shareholder for shareholder in remaining_data if shareholder.type_shares.lower() == "part sociale" or shareholder.type_shares.lower() == "part d'interet"]
-        remaining_data = [shareholder for shareholder in remaining_data if shareholder not in social_part]
-        class_d: List[Shareholder] = [shareholder for shareholder in remaining_data if "class d" in shareholder.type_shares.lower()]
-        remaining_data = [shareholder for shareholder in remaining_data if shareholder not in class_d]
-        ordinary = ordinary + remaining_data
-        for index in range(0, len(ordinary), 1):
-            type: str = "Ordinary"
-            ordinary[index].type_shares = type
-        self.getLogger().inform(f"Shareholders: Type: Curating and sanitizing the type of the shares for Ordinary Shares.\nAmount: {len(ordinary)}")
-        for index in range(0, len(social_part), 1):
-            type: str = "Part Sociale"
-            social_part[index].type_shares = type
-        self.getLogger().inform(f"Shareholders: Type: Curating and sanitizing the type of the shares for Part Sociale.\nAmount: {len(social_part)}")
-        for index in range(0, len(class_d), 1):
-            type: str = "Class D"
-            class_d[index].type_shares = type
-        self.getLogger().inform(f"Shareholders: Type: Curating and sanitizing the type of the shares for Class D Shares.\nAmount: {len(class_d)}")
-        self.setShareholderData(ordinary + social_part + class_d)
+        column: Dictionary_Column = Dictionary_Column(self.getShareholderData(), "type_shares")
+        ordinary: int = column.replace(lambda type_shares: "ordinary" in type_shares.lower(), "Ordinary")
+        social_part: int = column.replace(lambda type_shares: type_shares.lower() in social_part_types, "Part Sociale")
+        class_d: int = column.replace(lambda type_shares: "class d" in type_shares.lower(), "Class D")
+        ordinary += column.replace(lambda type_shares: type_shares not in ("Ordinary", "Part Sociale", "Class D"), "Ordinary")
+        self.getLogger().inform(f"Shareholders: Type: Curating and sanitizing the type of the shares for Ordinary Shares.\nAmount: {ordinary}")
+        self.getLogger().inform(f"Shareholders: Type: Curating and sanitizing the type of the shares for Part Sociale.\nAmount: {social_part}")
+        self.getLogger().inform(f"Shareholders: Type: Curating and sanitizing the type of the shares for Class D Shares.\nAmount: {class_d}")
 
     def curateShareholdersCurrency(self) -> None:
         """
         Curating and sanitizing the currency of the shareholders.
+        The currencies are dictionary encoded, so that each rule is
+        evaluated once per distinct currency, and the ones matching
+        no rule are curated as Mauritius Rupee.
 
         Returns:
             void
         """
-        mauritian_rupee: List[Shareholder] = [shareholder for shareholder in self.getShareholderData() if "mauritius rupee" in shareholder.currency.lower()]
-        remaining_data: List[Shareholder] = [shareholder for shareholder in self.getShareholderData() if shareholder not in mauritian_rupee]
-        us_dollar: List[Shareholder] = [shareholder for shareholder in remaining_data if "us dollar" in shareholder.currency.lower()]
-        remaining_data = [shareholder for shareholder in remaining_data if shareholder not in us_dollar]
-        mauritian_rupee = mauritian_rupee + remaining_data
-        for index in range(0, len(mauritian_rupee), 1):
-            currency: str = "Mauritius Rupee"
-            mauritian_rupee[index].currency = currency
-        self.getLogger().inform(f"Shareholders: Currency: Curating and sanitizing the currency of the shares for Mauritian Rupee.\nAmount: {len(mauritian_rupee)}")
-        for index in range(0, len(us_dollar), 1):
-            currency: str = "US Dollar"
-            us_dollar[index].currency = currency
-        self.getLogger().inform(f"Shareholders: Currency: Curating and sanitizing the currency of the shares for American Dollar.\nAmount: {len(us_dollar)}")
-        self.setShareholderData(mauritian_rupee + us_dollar)
+        column: Dictionary_Column = Dictionary_Column(self.getShareholderData(), "currency")
+        mauritian_rupee: int = column.replace(lambda currency: "mauritius rupee" in currency.lower(), "Mauritius Rupee")
+        us_dollar: int = column.replace(lambda currency: "us dollar" in currency.lower(), "US Dollar")
+        mauritian_rupee += column.replace(lambda currency: currency not in ("Mauritius Rupee", "US Dollar"), "Mauritius Rupee")
+        self.getLogger().inform(f"Shareholders: Currency: Curating and sanitizing the currency of the shares for Mauritian Rupee.\nAmount: {mauritian_rupee}")
+        self.getLogger().inform(f"Shareholders: Currency: Curating and sanitizing the currency of the shares for American Dollar.\nAmount: {us_dollar}")
 
     def curateShareholdersName(self) -> None:
         """
@@ -3365,91 +3182,123 @@ class Builder:
         Returns:
             void
         """
-        filtered_data: List[Shareholder] = [shareholder for shareholder in self.getShareholderData() if "service address" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "street" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "lane" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "morcellement" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "port louis" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "mauritius rupee" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "avenue" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "quatre bornes" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if shareholder.name.lower() != "mauritius"]
-        filtered_data = [shareholder for shareholder in filtered_data if "vacoas" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "office bearers" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "position" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "gerant" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "date issued" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "road" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "," not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "part" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "d'interet" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "louis mauritius" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if " rd " not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "floor" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "goodlands" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "nhdc" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "mahebourg" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if "rue" not in shareholder.name.lower()]
-        filtered_data = [shareholder for shareholder in filtered_data if " morc " not in shareholder.name.lower()]
+        filtered_data: List[Shareholder] = [shareholder for shareholder in self.getShareholderData() if isCuratedName(shareholder.name)]
         for index in range(0, len(filtered_data), 1):
             name: str = filtered_data[index].name.title().replace("ltd", "LTD").replace("Ltd", "LTD")
             filtered_data[index].name = name
         self.getLogger().inform(f"Shareholders: Name: Curating and sanitizing the name of the shareholders.\nAmount: {len(filtered_data)}")
         self.setShareholderData(filtered_data)
 
-    def curateMembers(self) -> None:
+    def curateMembers(self, is_incremental: bool = False, batch_size: int = 10000) -> None:
         """
         Curating the data that is in the Members table.  Curating
         the currency in the members table.  Curating and sanitizing
         the names of the members. Curating the amount of the shares
         of the members and filtering based on them.
+        The table is read and curated page by page, so that only one
+        page of members is held in memory at a time.
+
+        Parameters:
+            is_incremental (bool): Whether only the members which have not been curated yet are curated and updated in place.
+            batch_size (int): The amount of members to be curated per page.
 
         Returns:
             void
         """
-        no_content: int = 204
-        accepted: int = 202
-        created: int = 201
         quarter: FinancialCalendar = self.getFinancialCalendar().getCurrentQuarter()  # type: ignore
         current_time: int = int(time())
-        self.setMemberData(self.getMembers().get())
-        amount: int = len(self.getMemberData())
-        self.curateMembersCurrencies()
-        self.curateMembersNames()
-        self.curateMembersAmount()
-        dataset: List[Member] = [member for member in self.getMemberData()]
-        for index in range(0, len(dataset), 1):
-            identifier: int = index + 1
-            dataset[index].identifier = identifier
-        self.setMemberData(dataset)
-        amount_found: int = len(self.getMemberData())
-        status: int = self.getMembers().delete()
-        statuses: List[int] = list(set([self.getMembers().addCuratedMember(member) for member in self.getMemberData()])) if status == no_content else [status]
-        status = accepted if len(statuses) == 1 and statuses[0] == created else statuses[0]
-        log: Tuple[str, str, int, int, int, int, int] = ("curateMembers", quarter.quarter, current_time, current_time, status, amount, amount_found)
+        amounts: Dict[str, int] = {"amount": 0, "amount_found": 0}
+        pages: Iterator[List[int]] = self.iterCuratedMembers(self.getMembers().iterUncurated(batch_size) if is_incremental else self.getMembers().iterAll(batch_size), amounts)
+        status: int = self.storeCuratedMembersIncrementally(pages) if is_incremental else self.storeCuratedMembers(pages)
+        self.setMemberData([])
+        log: Tuple[str, str, int, int, int, int, int] = ("curateMembers", quarter.quarter, current_time, current_time, status, amounts["amount"], amounts["amount_found"])
         self.getFinCorpLogs().postSuccessfulCorporateDataCollectionRun(log) # type: ignore
 
+    def iterCuratedMembers(self, pages: Iterator[List[Member]], amounts: Dict[str, int]) -> Iterator[List[int]]:
+        """
+        Curating the members page by page.  The curated page is
+        kept in the cache memory while the identifiers of the page,
+        as they were before the curation, are yielded.
+
+        Parameters:
+            pages (Iterator[List[Member]]): The pages of members to be curated.
+            amounts (Dict[str, int]): The amounts of members read and kept, which are accumulated.
+
+        Returns:
+            Iterator[List[int]]
+        """
+        for page in pages:
+            amounts["amount"] += len(page)
+            self.setMemberData(page)
+            self.curateMembersCurrencies()
+            self.curateMembersNames()
+            self.curateMembersAmount()
+            amounts["amount_found"] += len(self.getMemberData())
+            yield [member.identifier for member in page]
+
+    def storeCuratedMembers(self, pages: Iterator[List[int]]) -> int:
+        """
+        Replacing the whole table by the curated members, which are
+        renumbered from one.  They are loaded into a shadow table
+        which is swapped with the live one, so that a failed load
+        leaves the live table untouched.
+
+        Parameters:
+            pages (Iterator[List[int]]): The pages of members which are curated into the cache memory.
+
+        Returns:
+            int
+        """
+        accepted: int = 202
+        created: int = 201
+        dataset: Iterator[Member] = (member for _ in pages for member in self.getMemberData())
+        status: int = self.getMembers().replaceCuratedMembers(self.renumber(dataset)) # type: ignore
+        return accepted if status == created else status
+
+    def storeCuratedMembersIncrementally(self, pages: Iterator[List[int]]) -> int:
+        """
+        Updating the curated members in place and deleting the ones
+        which have been discarded by the curation, page by page, so
+        that the identifiers are preserved and the rest of the table
+        is left untouched.  The curation is unavailable if a page
+        cannot be retrieved.
+
+        Parameters:
+            pages (Iterator[List[int]]): The identifiers of the members of each page which is curated into the cache memory.
+
+        Returns:
+            int
+        """
+        no_content: int = 204
+        accepted: int = 202
+        service_unavailable: int = 503
+        statuses: List[int] = []
+        try:
+            for identifiers in pages:
+                curated_identifiers: Set[int] = {member.identifier for member in self.getMemberData()}
+                status: int = self.getMembers().deleteMany([identifier for identifier in identifiers if identifier not in curated_identifiers])
+                statuses += self.getMembers().updateCuratedMembers(self.getMemberData()) if status == no_content else [status]
+        except (Error, RuntimeError) as error:
+            statuses.append(service_unavailable)
+            self.getLogger().error(f"Members: The pages cannot be retrieved.\nStatus: {service_unavailable}\nError: {error}")
+        self.getLogger().inform(f"Members: The curated members have been updated in place.\nChunks: {len(statuses)}\nFailed Chunks: {statuses.count(service_unavailable)}")
+        return service_unavailable if service_unavailable in statuses else accepted
+
     def curateMembersCurrencies(self) -> None:
         """
-        Curating the currency in the members table.
+        Curating the currency in the members table.  The currencies
+        are dictionary encoded, so that each rule is evaluated once
+        per distinct currency.
 
         Returns:
             None
         """
-        mauritian_rupee: List[Member] = [member for member in self.getMemberData() if "mauritius rupee" in member.currency.lower()]
-        remaining_data: List[Member] = [member for member in self.getMemberData() if member not in mauritian_rupee]
-        us_dollar: List[Member] = [member for member in remaining_data if "us dollar" in member.currency.lower()]
-        remaining_data = [member for member in remaining_data if member not in us_dollar]
-        mauritian_rupee = mauritian_rupee + remaining_data
-        for index in range(0, len(mauritian_rupee), 1):
-            currency: str = "Mauritius Rupee"
-            mauritian_rupee[index].currency = currency
-        self.getLogger().inform(f"Members: Currency: Curating and sanitizing the currency of the members for Mauritian Rupee.\nAmount: {len(mauritian_rupee)}")
-        for index in range(0, len(us_dollar), 1):
-            currency: str = "Mauritius Rupee"
-            us_dollar[index].currency = currency
-        self.getLogger().inform(f"Members: Currency: Curating and sanitizing the currency of the members for American Dollar.\nAmount: {len(us_dollar)}")
-        self.setMemberData(mauritian_rupee + us_dollar)
+        column: Dictionary_Column = Dictionary_Column(self.getMemberData(), "currency")
+        mauritian_rupee: int = column.replace(lambda currency: "mauritius rupee" in currency.lower(), "Mauritius Rupee")
+        us_dollar: int = column.replace(lambda currency: "us dollar" in currency.lower(), "Mauritius Rupee")
+        mauritian_rupee += column.replace(lambda currency: currency != "Mauritius Rupee", "Mauritius Rupee")
+        self.getLogger().inform(f"Members: Currency: Curating and sanitizing the currency of the members for Mauritian Rupee.\nAmount: {mauritian_rupee}")
+        self.getLogger().inform(f"Members: Currency: Curating and sanitizing the currency of the members for American Dollar.\nAmount: {us_dollar}")
 
     def curateMembersNames(self) -> None:
         """
@@ -3458,32 +3307,7 @@ class Builder:
         Returns:
             None
         """
-        filtered_data: List[Member] = [member for member in self.getMemberData() if "service address" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "street" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "lane" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "morcellement" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "port louis" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "mauritius rupee" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "avenue" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "quatre bornes" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if member.name.lower() != "mauritius"]
-        filtered_data = [member for member in filtered_data if "vacoas" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "office bearers" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "position" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "gerant" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "date issued" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "road" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "," not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "part" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "d'interet" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "louis mauritius" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if " rd " not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "floor" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "goodlands" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "nhdc" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "mahebourg" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if "rue" not in member.name.lower()]
-        filtered_data = [member for member in filtered_data if " morc " not in member.name.lower()]
+        filtered_data: List[Member] = [member for member in self.getMemberData() if isCuratedName(member.name)]
         for index in range(0, len(filtered_data), 1):
             name: str = filtered_data[index].name.title().replace("ltd", "LTD").replace("Ltd", "LTD")
             filtered_data[index].name = name
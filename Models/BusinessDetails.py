@@ -9,7 +9,7 @@ Authors:
 
 
 from Models.DatabaseHandler import Database_Handler
-from typing import Dict, Tuple, List, Union
+from typing import Dict, Tuple, List, Union, Iterator
 from mysql.connector.errors import Error
 from Data.BusinessDetails import BusinessDetails
 from mysql.connector.types import RowType
@@ -177,7 +177,7 @@ class Business_Details(Database_Handler):
                 table_name=self.getTableName()
             )
             response: Dict[str, Union[int, List[BusinessDetails]]] = self._getBusinessDetailsData(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {response['data']}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
             return response['data']  # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: 503\nError: {error}")
@@ -201,6 +201,50 @@ class Business_Details(Database_Handler):
             "data": data
         }
 
+    def iterAll(self, batch_size: int = 1000) -> Iterator[List[BusinessDetails]]:
+        """
+        Retrieving all of the data from the Business Details table page by
+        page, so that only one page is held in memory at a time.
+
+        Parameters:
+            batch_size (int): The amount of business details per page.
+
+        Returns:
+            Iterator[List[BusinessDetails]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=BusinessDetails.columns,
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=BusinessDetails.fromRow
+        ) # type: ignore
+
+    def updateBusinessDetails(self, dataset: List[BusinessDetails], chunk_size: int = 1000) -> List[int]:
+        """
+        Updating the addresses, the names and the natures of the
+        business details in batches.
+
+        Parameters:
+            dataset (List[BusinessDetails]): The curated business details.
+            chunk_size (int): The amount of business details to be updated per commit.
+
+        Returns:
+            List[int]: The status of each chunk.
+        """
+        rows: List[Tuple[int, int, Union[str, None], Union[str, None], Union[str, None], Union[str, None]]] = [(business_detail.identifier, business_detail.CompanyDetail, business_detail.registered_address, business_detail.name, business_detail.nature, business_detail.operational_address) for business_detail in dataset]
+        statuses: List[bool] = self.updateDataBatch(
+            table=self.getTableName(),
+            columns="registered_address, name, nature, operational_address",
+            keys="identifier, CompanyDetail",
+            rows=rows, # type: ignore
+            chunk_size=chunk_size
+        )
+        return [202 if status else 503 for status in statuses]
+
     def updateBusinessDetail(self, business_detail: BusinessDetails) -> int:
         """
         Updating the data that is stored in the relational database
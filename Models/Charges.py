@@ -8,7 +8,8 @@ Authors:
 
 
 from Models.DatabaseHandler import Database_Handler
-from typing import Dict, Union, Tuple
+from Models.WriteBehindBuffer import Write_Behind_Buffer
+from typing import Dict, Union, Tuple, List
 from mysql.connector.errors import Error
 
 
@@ -74,6 +75,35 @@ class Charges(Database_Handler):
             )
             self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
             return self.created
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return self.service_unavailable
+
+    def addChargesBatch(self, dataset: List[Dict[str, Union[str, int]]], company_detail: int, buffer: Union[Write_Behind_Buffer, None] = None) -> int:
+        """
+        Adding the charges of the company in a single batch.
+
+        Parameters:
+            dataset: [{volume: string, property: string, nature: string, amount: int, date_charged: int, date_filled: int, currency: string}]: The data of the charges
+            company_detail: int: The identifier of a company
+            buffer: Write_Behind_Buffer|null: The write-behind buffer in which the rows are staged instead of being inserted.
+
+        Returns:
+            int
+        """
+        try:
+            rows: List[Tuple[int, str, str, str, int, int, int, str]] = [(company_detail, str(data["volume"]), str(data["property"]), str(data["nature"]), int(data["amount"]), int(data["date_charged"]), int(data["date_filled"]), str(data["currency"])) for data in dataset]
+            columns: str = "CompanyDetail, volume, property, nature, amount, date_charged, date_filled, currency"
+            if buffer is None:
+                self.postDataBatch(
+                    table=self.getTableName(),
+                    columns=columns,
+                    rows=rows # type: ignore
+                )
+            else:
+                buffer.stage(self.getTableName(), columns, rows) # type: ignore
+            self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
+            return self.created
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
             return self.service_unavailable
\ No newline at end of file
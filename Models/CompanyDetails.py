@@ -25,6 +25,11 @@ class Company_Details(Database_Handler):
     """
     The table which the model is linked to.
     """
+    extraction_failed: int = 2
+    """
+    The extraction status of a company whose corporate registry
+    cannot be stored, which is neither pending nor extracted.
+    """
 
     def __init__(self) -> None:
         """
@@ -77,9 +82,9 @@ class Company_Details(Database_Handler):
             void
         """
         if error.errno == errorcode.ER_DUP_ENTRY:
-            self.getLogger().error(f"Status: 403\nMessage: The record will be skipped as it is already in the relational database server.\nDuplicate Entry Error: {error}\nSQL Error Code: {error.errno}\nData: {data}")
+            self.getLogger().error(f"Status: 403\nMessage: The record will be skipped as it is already in the relational database server.\nDuplicate Entry Error: {error}\nSQL Error Code: {error.errno}", {"Data": data})
         else:
-            self.getLogger().error(f"Status: 503\nCritical Error: {error}\nSQL Error Code: {error.errno}\nData: {data}")
+            self.getLogger().error(f"Status: 503\nCritical Error: {error}\nSQL Error Code: {error.errno}", {"Data": data})
             raise error
 
     def getAmountDownloadedCorporateDocumentsStatus(self, dataset: Union[List[RowType], List[Dict[str, int]]]) -> int:
@@ -109,16 +114,16 @@ class Company_Details(Database_Handler):
             int
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, int]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
-                filter_condition="DATE(FROM_UNIXTIME(date_incorporation)) = %s",
+                filter_condition="date_incorporation >= %s AND date_incorporation < %s",
                 column_names=f"COUNT({self.getTableName()}.identifier) AS amount_found"
             )
             status: int = self.getAmountDownloadedCorporateDocumentsStatus(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}", {"Data": data}
             )
             return int(data[0]["amount_found"]) # type: ignore
         except Error as error:
@@ -139,17 +144,17 @@ class Company_Details(Database_Handler):
             int
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, int]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
                 join_condition=f"DocumentFiles ON DocumentFiles.CompanyDetail = {self.getTableName()}.identifier",
-                filter_condition="DATE(FROM_UNIXTIME(CompanyDetails.date_incorporation)) = %s AND DocumentFiles.identifier IS NOT NULL",
+                filter_condition="CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s AND DocumentFiles.identifier IS NOT NULL",
                 column_names=f"COUNT({self.getTableName()}.identifier) AS amount_found"
             )
             status: int = self.getAmountDownloadedCorporateDocumentsStatus(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}", {"Data": data}
             )
             return int(data[0]["amount_found"]) # type: ignore
         except Error as error:
@@ -171,15 +176,15 @@ class Company_Details(Database_Handler):
             [{identifier: int, business_registration_number: string, name: string, file_number: string, category: string, date_incorporation: int, nature: string, status: string, date_verified: int, is_extracted: int, company_identifier: int, company_type: string}]
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, Union[int, str]]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
-                filter_condition="DATE(FROM_UNIXTIME(date_incorporation)) = %s AND date_verified IS NULL"
+                filter_condition="date_incorporation >= %s AND date_incorporation < %s AND date_verified IS NULL"
             )
             response: Dict[str, Union[int, List[CompanyDetails]]] = self._getCompanyDetailsForDownloadCorporateDocumentFile(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data}
             )
             return response["data"]  # type: ignore
         except Error as error:
@@ -317,7 +322,7 @@ class Company_Details(Database_Handler):
             )[0]
             response: Dict[str, Union[int, CompanyDetails]] = self._getSpecificCompanyDetails(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data}
             )
             return response["data"]  # type: ignore
         except Error as error:
@@ -365,6 +370,41 @@ class Company_Details(Database_Handler):
             "data": data
         }
 
+    def getManyByIdentifiers(self, identifiers: List[int], chunk_size: int = 1000) -> List[CompanyDetails]:
+        """
+        Retrieving the company details of many companies at once.
+        The identifiers are sent in chunks of IN lists instead of
+        one query per company.
+
+        Parameters:
+            identifiers (List[int]): The identifiers of the companies.
+            chunk_size (int): The amount of identifiers per query.
+
+        Returns:
+            [{identifier: int, business_registration_number: string, name: string, file_number: string, category: string, date_incorporation: int, nature: string, status: string, date_verified: int, is_extracted: int, company_identifier: int, company_type: string}]
+        """
+        response: List[CompanyDetails] = []
+        identifiers = list(dict.fromkeys(identifiers))
+        try:
+            for index in range(0, len(identifiers), chunk_size):
+                parameters: Tuple[int, ...] = tuple(identifiers[index:index + chunk_size])
+                data: Union[List[RowType], List[Dict[str, Union[int, str]]]] = self.getData(
+                    table_name=self.getTableName(),
+                    parameters=parameters, # type: ignore
+                    filter_condition=f"identifier IN ({', '.join(['%s'] * len(parameters))})",
+                    column_names=CompanyDetails.columns,
+                    is_dictionary=False
+                )
+                response.extend([CompanyDetails.fromRow(company_detail) for company_detail in data]) # type: ignore
+            self.getLogger().inform(
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {self.ok if len(response) > 0 else self.no_content}\nAmount: {len(response)}"
+            )
+        except Error as error:
+            self.getLogger().error(
+                f"An error occurred in {self.getTableName()}\nStatus: 503\nError: {error}"
+            )
+        return response
+
     def updateCorporateMetadataAuthorisedCompany(self, data: Dict[str, Union[str, int]], identifier: int) -> int:
         """
         Updating the Corporate Metadata for an authorised company.
@@ -468,6 +508,70 @@ class Company_Details(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
         return response
 
+    def failExtraction(self, identifier: int) -> int:
+        """
+        Marking the company as failed, as its corporate registry
+        cannot be stored however many times it is extracted, so that
+        it is no longer extracted.
+
+        Parameters:
+            identifier: int: The identifier of the company.
+
+        Returns:
+            int
+        """
+        response: int
+        parameters: Tuple[int, int] = (self.extraction_failed, identifier)
+        try:
+            self.updateData(
+                table=self.getTableName(),
+                values="is_extracted = %s",
+                condition="identifier = %s",
+                parameters=parameters # type: ignore
+            )
+            response = 202
+            self.getLogger().warn(f"The extraction of the company has failed and it will not be extracted again!\nIdentifier: {identifier}\nStatus: {response}")
+        except Error as error:
+            response = 503
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
+    def getRunStatistics(self, date_incorporation: str) -> Dict[str, int]:
+        """
+        Retrieving all of the counters of a run for a specific date
+        of incorporation in a single aggregate query.
+
+        Parameters:
+            date_incorporation (str): The date at which the company was legally formed.
+
+        Returns:
+            {amount: int, amount_downloaded: int, amount_found: int, amount_extracted: int}
+        """
+        statistics: Dict[str, int] = {
+            "amount": 0,
+            "amount_downloaded": 0,
+            "amount_found": 0,
+            "amount_extracted": 0
+        }
+        try:
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
+            data: Union[List[RowType], List[Dict[str, int]]] = self.getData(
+                table_name=self.getTableName(),
+                parameters=parameters,
+                join_condition=f"DocumentFiles ON DocumentFiles.CompanyDetail = {self.getTableName()}.identifier",
+                filter_condition=f"{self.getTableName()}.date_incorporation >= %s AND {self.getTableName()}.date_incorporation < %s",
+                column_names=f"COUNT(DISTINCT {self.getTableName()}.identifier) AS amount, COUNT(DocumentFiles.identifier) AS amount_downloaded, COALESCE(SUM(DocumentFiles.identifier IS NOT NULL AND {self.getTableName()}.is_extracted = 1), 0) AS amount_found, COUNT(DISTINCT CASE WHEN {self.getTableName()}.is_extracted = 1 THEN {self.getTableName()}.identifier END) AS amount_extracted"
+            )
+            statistics = {key: int(data[0][key]) for key in statistics} # type: ignore
+            self.getLogger().inform(
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {self.ok if statistics['amount'] > 0 else self.no_content}", {"Data": statistics}
+            )
+        except Error as error:
+            self.getLogger().error(
+                f"An error occurred in {self.getTableName()}\nStatus: 503\nError: {error}"
+            )
+        return statistics
+
     def getAmountExtracted(self, date_incorporation: str) -> int:
         """
         Retrieving the amount of corporate registries that are
@@ -480,16 +584,16 @@ class Company_Details(Database_Handler):
             int
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, int]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
-                filter_condition="DATE(FROM_UNIXTIME(date_incorporation)) = %s AND is_extracted = 1",
+                filter_condition="date_incorporation >= %s AND date_incorporation < %s AND is_extracted = 1",
                 column_names=f"COUNT(identifier) AS amount_found"
             )
             status: int = self.getAmountStatus(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}", {"Data": data}
             )
             return int(data[0]["amount_found"]) # type: ignore
         except Error as error:
@@ -0,0 +1,206 @@
+"""
+This module provides the Connection_Pool class, which is
+responsible for keeping a process-wide pool of connections to
+the MySQL database server that every Database_Handler borrows
+from instead of opening its own connection.
+
+Authors:
+    Darkness4869
+"""
+
+
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection, CNX_POOL_MAXSIZE
+from mysql.connector import Error, PoolError
+from typing import Dict, Union
+from threading import Lock
+from time import sleep, time
+from os import getpid
+
+
+class Connection_Pool:
+    """
+    The process-wide pool of connections to the database server.
+    It is created lazily on the first borrow and is shared by all
+    of the models of the application.
+    """
+    pool_name: str = "corporate_database_builder"
+    """
+    The name of the pool on the database connector.
+    """
+    pool_size: int = 10
+    """
+    The amount of connections that are kept in the pool.
+    """
+    timeout: float = 30.0
+    """
+    The amount of seconds to wait for a connection to be released
+    when the pool is exhausted.
+    """
+    __pool: Union[MySQLConnectionPool, None] = None
+    """
+    The pool of connections of the current process.
+    """
+    __process: int = 0
+    """
+    The identifier of the process which created the pool.
+    """
+    __lock: Lock = Lock()
+    """
+    The lock that guards the creation of the pool and its
+    statistics.
+    """
+    __statistics: Dict[str, int] = {
+        "borrowed": 0,
+        "released": 0,
+        "in_use": 0,
+        "peak_in_use": 0,
+        "waits": 0,
+        "failed_health_checks": 0
+    }
+    """
+    The usage statistics of the pool.
+    """
+
+    @classmethod
+    def configure(cls, pool_size: int = 10, timeout: float = 30.0) -> None:
+        """
+        Configuring the pool before it is created.  The
+        configuration is ignored once the pool exists in the
+        current process.
+
+        Parameters:
+            pool_size (int): The amount of connections to keep in the pool.
+            timeout (float): The amount of seconds to wait for a free connection.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the size of the pool is not supported by the connector.
+        """
+        if pool_size < 1 or pool_size > CNX_POOL_MAXSIZE:
+            raise ValueError(f"The size of the pool must be between 1 and {CNX_POOL_MAXSIZE}.\nPool Size: {pool_size}")
+        cls.pool_size = pool_size
+        cls.timeout = timeout
+
+    @classmethod
+    def __getPool(cls, host: str, database: str, username: str, password: str) -> MySQLConnectionPool:
+        """
+        Retrieving the pool of the current process, creating it if
+        it does not exist yet or if it has been inherited from a
+        parent process.
+
+        Parameters:
+            host (str): The host of the database server.
+            database (str): The database of the application.
+            username (str): The user that have access to the database.
+            password (str): The password of the user.
+
+        Returns:
+            MySQLConnectionPool
+        """
+        with cls.__lock:
+            if cls.__pool is None or cls.__process != getpid():
+                cls.__pool = MySQLConnectionPool(
+                    pool_name=f"{cls.pool_name}_{getpid()}",
+                    pool_size=cls.pool_size,
+                    pool_reset_session=True,
+                    host=host,
+                    database=database,
+                    username=username,
+                    password=password
+                )
+                cls.__process = getpid()
+                cls.__statistics = {key: 0 for key in cls.__statistics}
+            return cls.__pool
+
+    @classmethod
+    def getConnection(cls, host: str, database: str, username: str, password: str) -> PooledMySQLConnection:
+        """
+        Borrowing a healthy connection from the pool.  When the pool
+        is exhausted, it waits for a connection to be released until
+        the timeout is reached.
+
+        Parameters:
+            host (str): The host of the database server.
+            database (str): The database of the application.
+            username (str): The user that have access to the database.
+            password (str): The password of the user.
+
+        Returns:
+            PooledMySQLConnection
+
+        Raises:
+            PoolError: If no connection has been released before the timeout.
+        """
+        pool: MySQLConnectionPool = cls.__getPool(host, database, username, password)
+        limit: float = time() + cls.timeout
+        while True:
+            try:
+                connection: PooledMySQLConnection = pool.get_connection()
+                break
+            except PoolError:
+                if time() >= limit:
+                    raise
+                with cls.__lock:
+                    cls.__statistics["waits"] += 1
+                sleep(0.1)
+        cls.__checkHealth(connection)
+        with cls.__lock:
+            cls.__statistics["borrowed"] += 1
+            cls.__statistics["in_use"] += 1
+            cls.__statistics["peak_in_use"] = max(cls.__statistics["peak_in_use"], cls.__statistics["in_use"])
+        return connection
+
+    @classmethod
+    def __checkHealth(cls, connection: PooledMySQLConnection) -> None:
+        """
+        Making sure that the borrowed connection is still alive and
+        reconnecting it otherwise.
+
+        Parameters:
+            connection (PooledMySQLConnection): The borrowed connection.
+
+        Returns:
+            None
+
+        Raises:
+            Error: If the connection cannot be re-established.
+        """
+        try:
+            connection.ping(reconnect=True, attempts=3, delay=1)
+        except Error:
+            with cls.__lock:
+                cls.__statistics["failed_health_checks"] += 1
+            connection.close()
+            raise
+
+    @classmethod
+    def releaseConnection(cls, connection: PooledMySQLConnection) -> None:
+        """
+        Returning the connection to the pool.
+
+        Parameters:
+            connection (PooledMySQLConnection): The borrowed connection.
+
+        Returns:
+            None
+        """
+        connection.close()
+        with cls.__lock:
+            cls.__statistics["released"] += 1
+            cls.__statistics["in_use"] = max(cls.__statistics["in_use"] - 1, 0)
+
+    @classmethod
+    def getStatistics(cls) -> Dict[str, int]:
+        """
+        Retrieving the usage statistics of the pool of the current
+        process.
+
+        Returns:
+            {pool_size: int, borrowed: int, released: int, in_use: int, peak_in_use: int, waits: int, failed_health_checks: int}
+        """
+        with cls.__lock:
+            statistics: Dict[str, int] = dict(cls.__statistics)
+        statistics["pool_size"] = cls.pool_size
+        return statistics
@@ -10,10 +10,14 @@ from mysql.connector.connection import MySQLConnection
 from mysql.connector.cursor import MySQLCursor
 from Environment import Environment
 from Models.Logger import Corporate_Database_Builder_Logger
-from typing import List, Tuple, Union, Any
+from Models.ConnectionPool import Connection_Pool
+from typing import List, Tuple, Union, Any, Iterator, Iterable, Callable
+from itertools import islice
+from contextlib import contextmanager
+from threading import local
+from datetime import datetime, timedelta
 from mysql.connector.types import RowType
-from mysql.connector import Error, errorcode, IntegrityError, InterfaceError
-import mysql.connector
+from mysql.connector import Error, errorcode, IntegrityError, InterfaceError, NotSupportedError
 import logging
 
 
@@ -39,9 +43,11 @@ class Database_Handler:
     The password that allows the required user to connect to the
     database.
     """
-    __database_handler: Union[PooledMySQLConnection, MySQLConnection]
+    __database_handler: Union[PooledMySQLConnection, MySQLConnection, None]
     """
-    The database handler needed to execute the queries needed
+    The database handler needed to execute the queries needed.
+    It is borrowed from the connection pool when a query is sent
+    and returned to it once the result has been consumed.
     """
     __statement: "MySQLCursor"
     """
@@ -62,11 +68,30 @@ class Database_Handler:
     """
     The logger that will all the action of the application.
     """
+    __unit_of_work: local = local()
+    """
+    The unit of work of the current thread.  It holds the
+    connection shared by all of the database handlers while it is
+    active and whether one of their statements has failed.
+    """
+    ok: int = 200
+    """
+    The status code for a success read
+    """
+    no_content: int = 204
+    """
+    The status code for no content.
+    """
+    service_unavailable: int = 503
+    """
+    The status code for service unavailable
+    """
 
     def __init__(self):
         """
-        Instantiating the class which will try to connect to the
-        database.
+        Instantiating the class which will retrieve the credentials
+        of the database server.  The connection itself is borrowed
+        from the shared connection pool when it is needed.
         """
         ENV = Environment()
         self.setLogger(Corporate_Database_Builder_Logger())
@@ -75,21 +100,49 @@ class Database_Handler:
         self.__setDatabase(ENV.getDatabase())
         self.__setUsername(ENV.getUsername())
         self.__setPassword(ENV.getPassword())
+        self.__setDatabaseHandler(None)
+
+    def __connect(self) -> None:
+        """
+        Borrowing a connection from the shared connection pool.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If no connection can be borrowed from the pool.
+        """
         try:
             self.__setDatabaseHandler(
-                mysql.connector.connect(
-                    host=self.__getHost(),
-                    database=self.__getDatabase(),
-                    username=self.__getUsername(),
-                    password=self.__getPassword()
-                ) # type: ignore
+                Connection_Pool.getConnection(
+                    self.__getHost(),
+                    self.__getDatabase(),
+                    self.__getUsername(),
+                    self.__getPassword()
+                )
             )
-            self.getLogger().inform("The application has been successfully connected to the database server!")
+            self.getLogger().debug(f"A connection has been borrowed from the pool.\nStatistics: {Connection_Pool.getStatistics()}")
         except Error as error:
             self.getLogger().error(f"Connection Failed!\nError: {error}")
-            self.close()
             raise RuntimeError(error)
 
+    def _release(self) -> None:
+        """
+        Returning the borrowed connection to the shared connection
+        pool.
+
+        Returns:
+            None
+        """
+        database_handler: Union[PooledMySQLConnection, MySQLConnection, None] = self.__database_handler
+        if database_handler is None:
+            return
+        self.__setDatabaseHandler(None)
+        try:
+            Connection_Pool.releaseConnection(database_handler) # type: ignore
+        except Error as error:
+            self.getLogger().warn(f"The connection cannot be returned to the pool.\nError: {error}")
+
     def __getHost(self) -> str:
         return self.__host
 
@@ -115,11 +168,204 @@ class Database_Handler:
         self.__password = password
 
     def __getDatabaseHandler(self) -> Union[PooledMySQLConnection, MySQLConnection]:
-        return self.__database_handler
+        if self.__database_handler is None and self.__isInUnitOfWork():
+            return Database_Handler.__unit_of_work.connection
+        if self.__database_handler is None:
+            self.__connect()
+        return self.__database_handler # type: ignore
 
-    def __setDatabaseHandler(self, database_handler: Union[PooledMySQLConnection, MySQLConnection]) -> None:
+    def __setDatabaseHandler(self, database_handler: Union[PooledMySQLConnection, MySQLConnection, None]) -> None:
         self.__database_handler = database_handler
 
+    def __isInUnitOfWork(self) -> bool:
+        return getattr(Database_Handler.__unit_of_work, "connection", None) is not None
+
+    @contextmanager
+    def unitOfWork(self) -> Iterator[None]:
+        """
+        Grouping all of the writes of the database handlers of the
+        current thread into a single transaction.  A connection is
+        borrowed for the whole unit of work and shared by all of the
+        database handlers, which are not committing on their own
+        while it is active.  The transaction is committed once the
+        unit of work is completed and it is rolled back if one of
+        its statements has failed, even if the failure has been
+        handled by the model.  A nested unit of work is a savepoint
+        of the one which is already active, so that its failure only
+        rolls back its own statements.
+
+        Returns:
+            Iterator[None]
+
+        Raises:
+            RuntimeError: If the transaction cannot be committed, after it has been rolled back.
+        """
+        unit_of_work: local = Database_Handler.__unit_of_work
+        if self.__isInUnitOfWork():
+            with self.__savepoint():
+                yield
+            return
+        self.__connect()
+        connection: Union[PooledMySQLConnection, MySQLConnection] = self.__database_handler # type: ignore
+        self.__setDatabaseHandler(None)
+        connection.start_transaction()
+        unit_of_work.connection = connection
+        unit_of_work.is_failed = False
+        unit_of_work.depth = 0
+        self.getLogger().debug("A unit of work has been started.")
+        try:
+            yield
+        except BaseException:
+            unit_of_work.is_failed = True
+            raise
+        finally:
+            is_failed: bool = unit_of_work.is_failed
+            unit_of_work.connection = None
+            self.__completeUnitOfWork(connection, is_failed)
+
+    @contextmanager
+    def __savepoint(self) -> Iterator[None]:
+        """
+        Nesting a unit of work into the one which is already active
+        through a savepoint, which is released once the nested unit
+        of work is completed and to which the transaction is rolled
+        back if one of its statements has failed.  The failure is
+        not propagated to the enclosing unit of work.
+
+        Returns:
+            Iterator[None]
+
+        Raises:
+            RuntimeError: If the transaction cannot be rolled back to the savepoint, after the enclosing unit of work has been marked as failed.
+        """
+        unit_of_work: local = Database_Handler.__unit_of_work
+        connection: Union[PooledMySQLConnection, MySQLConnection] = unit_of_work.connection
+        is_enclosing_failed: bool = unit_of_work.is_failed
+        depth: int = unit_of_work.depth + 1
+        name: str = f"unit_of_work_{depth}"
+        self.__executeSavepoint(connection, f"SAVEPOINT {name}")
+        unit_of_work.depth = depth
+        unit_of_work.is_failed = False
+        try:
+            yield
+        except BaseException:
+            unit_of_work.is_failed = True
+            raise
+        finally:
+            is_failed: bool = unit_of_work.is_failed
+            unit_of_work.depth = depth - 1
+            unit_of_work.is_failed = is_enclosing_failed
+            try:
+                self.__executeSavepoint(connection, f"ROLLBACK TO SAVEPOINT {name}" if is_failed else f"RELEASE SAVEPOINT {name}")
+                if is_failed:
+                    self.getLogger().warn(f"The nested unit of work has been rolled back to its savepoint as it has failed.\nSavepoint: {name}")
+            except Error as error:
+                unit_of_work.is_failed = True
+                self.getLogger().error(f"There is an error while completing the nested unit of work.\nSavepoint: {name}\nError: {error}")
+                raise RuntimeError(error)
+
+    def __executeSavepoint(self, connection: Union[PooledMySQLConnection, MySQLConnection], query: str) -> None:
+        """
+        Executing a savepoint statement on the connection of the
+        unit of work.
+
+        Parameters:
+            connection (Union[PooledMySQLConnection, MySQLConnection]): The connection of the unit of work.
+            query (str): The savepoint statement.
+
+        Returns:
+            None
+
+        Raises:
+            Error: If the statement cannot be executed.
+        """
+        statement: MySQLCursor = connection.cursor() # type: ignore
+        try:
+            statement.execute(query)
+        finally:
+            statement.close()
+
+    def __completeUnitOfWork(self, connection: Union[PooledMySQLConnection, MySQLConnection], is_failed: bool) -> None:
+        """
+        Committing or rolling back the transaction of a unit of work
+        before returning its connection to the shared connection
+        pool.
+
+        Parameters:
+            connection (Union[PooledMySQLConnection, MySQLConnection]): The connection of the unit of work.
+            is_failed (bool): Whether one of the statements of the unit of work has failed.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the transaction cannot be committed, after it has been rolled back.
+        """
+        try:
+            if is_failed:
+                connection.rollback()
+                self.getLogger().warn("The unit of work has been rolled back as it has failed.")
+            else:
+                connection.commit()
+                self.getLogger().debug("The unit of work has been committed.")
+        except Error as error:
+            connection.rollback()
+            self.getLogger().error(f"There is an error while committing the unit of work into the database.\nError: {error}")
+            raise RuntimeError(error)
+        finally:
+            try:
+                Connection_Pool.releaseConnection(connection) # type: ignore
+            except Error as error:
+                self.getLogger().warn(f"The connection cannot be returned to the pool.\nError: {error}")
+
+    def failUnitOfWork(self) -> None:
+        """
+        Marking the unit of work of the current thread as failed, so
+        that it is rolled back once it is completed.
+
+        Returns:
+            None
+        """
+        if self.__isInUnitOfWork():
+            Database_Handler.__unit_of_work.is_failed = True
+
+    def isUnitOfWorkFailed(self) -> bool:
+        """
+        Verifying whether the unit of work of the current thread has
+        been marked as failed, which is the case once one of its
+        statements has failed.
+
+        Returns:
+            bool
+        """
+        return self.__isInUnitOfWork() and Database_Handler.__unit_of_work.is_failed
+
+    def __commit(self) -> None:
+        """
+        Committing the transaction unless it belongs to the unit of
+        work, which is committed once it is completed.
+
+        Returns:
+            None
+        """
+        if self.__database_handler is None and self.__isInUnitOfWork():
+            return
+        self.__getDatabaseHandler().commit()
+
+    def __rollback(self) -> None:
+        """
+        Rolling back the transaction.  The transaction of the unit of
+        work is only marked as failed, so that it is rolled back as a
+        whole once it is completed.
+
+        Returns:
+            None
+        """
+        if self.__database_handler is None and self.__isInUnitOfWork():
+            Database_Handler.__unit_of_work.is_failed = True
+            return
+        self.__getDatabaseHandler().rollback()
+
     def __getStatement(self) -> "MySQLCursor":
         return self.__statement
 
@@ -144,13 +390,14 @@ class Database_Handler:
     def setLogger(self, logger: Corporate_Database_Builder_Logger) -> None:
         self.__Logger = logger
 
-    def _query(self, query: str, parameters: Union[Tuple[Any], None]) -> None:
+    def _query(self, query: str, parameters: Union[Tuple[Any], None], is_dictionary: bool = True) -> None:
         """
         Executing a SQL query with optional parameters using a prepared statement.
 
         Parameters:
             query (str): The SQL query string to be executed.
             parameters (Union[Tuple[Any], None]): A tuple of parameters to be used in the query, or None if no parameters are needed.
+            is_dictionary (bool): Whether the rows are returned as dictionaries instead of tuples.
 
         Returns:
             None
@@ -161,14 +408,19 @@ class Database_Handler:
         self.__setStatement(
             self.__getDatabaseHandler().cursor(
                 prepared=True,
-                dictionary=True
+                dictionary=is_dictionary
             )
         )
-        self.getLogger().debug(f"Query to be used as a request to the database server!\nQuery: {query}\nParameters: {parameters}")
+        self.getLogger().debug(f"Query to be used as a request to the database server!\nQuery: {query}", {"Parameters": parameters})
         try:
             self.__getStatement().execute(query, parameters)
         except (IntegrityError, InterfaceError) as error:
             self.__handleQueryError(error)
+        except Error:
+            self.__getStatement().close()
+            self.__rollback()
+            self._release()
+            raise
 
     def __handleQueryError(self, error: Union[IntegrityError, InterfaceError]) -> None:
         """
@@ -186,6 +438,9 @@ class Database_Handler:
         if error.errno == errorcode.ER_DUP_ENTRY or "Duplicate Entry" in str(error).title():
             self.getLogger().warn(f"Duplicate entry error.\nError: {error}")
             return
+        self.__getStatement().close()
+        self.__rollback()
+        self._release()
         raise error
 
     def _execute(self) -> None:
@@ -197,11 +452,13 @@ class Database_Handler:
             void
         """
         try:
-            self.__getDatabaseHandler().commit()
+            self.__commit()
             self.__getStatement().close()
+            self._release()
         except Error as error:
-            self.__getDatabaseHandler().rollback()
+            self.__rollback()
             self.__getStatement().close()
+            self._release()
             self.getLogger().error(f"There is an error while committing transaction into the database.\nError: {error}")
             raise RuntimeError(error)
 
@@ -215,9 +472,10 @@ class Database_Handler:
         """
         result_set = self.__getStatement().fetchall()
         self.__getStatement().close()
+        self._release()
         return result_set
 
-    def getData(self, table_name: str, parameters: Union[Tuple[Any], None] = None, join_condition: str = "", filter_condition: str = "", column_names: str = "*", sort_condition: str = "", limit_condition: int = 0) -> List[RowType]:
+    def getData(self, table_name: str, parameters: Union[Tuple[Any], None] = None, join_condition: str = "", filter_condition: str = "", column_names: str = "*", sort_condition: str = "", limit_condition: int = 0, is_dictionary: bool = True) -> List[RowType]:
         """
         Retrieving data from the database.
 
@@ -229,6 +487,7 @@ class Database_Handler:
             filter_condition    (string):       Items to be filtered with.
             sort_condition      (string):       The items to be sorted.
             limit_condition     (int):          The amount of items to be returned
+            is_dictionary       (bool):         Whether the rows are returned as dictionaries instead of tuples.
 
         Return:
             (array)
@@ -240,10 +499,107 @@ class Database_Handler:
         self._getFilter(filter_condition)
         self._getSort(sort_condition)
         self._getLimit(limit_condition)
-        self.getLogger().inform(f"Query built for retrieving data!\nQuery: {self.getQuery()}\nParameters: {self.getParameters()}")
-        self._query(self.getQuery(), self.getParameters())
+        self.getLogger().inform(f"Query built for retrieving data!\nQuery: {self.getQuery()}", {"Parameters": self.getParameters()})
+        self._query(self.getQuery(), self.getParameters(), is_dictionary)
         return self._resultSet()
 
+    def iterData(self, table_name: str, parameters: Union[Tuple[Any], None] = None, join_condition: str = "", filter_condition: str = "", column_names: str = "*", sort_condition: str = "", batch_size: int = 1) -> Iterator[RowType]:
+        """
+        Streaming data from the database through an unbuffered
+        cursor, so that only a batch of rows is held in memory at a
+        time.  A dedicated connection is borrowed from the pool for
+        the lifetime of the iterator, so that the handler can still
+        be used while the rows are consumed.
+
+        Parameters:
+            table_name (str): The name of the table.
+            parameters (Union[Tuple[Any], None]): The parameters to be passed into the query.
+            join_condition (str): Joining table condition.
+            filter_condition (str): Items to be filtered with.
+            column_names (str): The name of the columns.
+            sort_condition (str): The items to be sorted.
+            batch_size (int): The amount of rows to be fetched per round-trip.
+
+        Returns:
+            Iterator[RowType]
+
+        Raises:
+            RuntimeError: If no connection can be borrowed from the pool.
+        """
+        query = f"SELECT {column_names} FROM {table_name}"
+        self.setQuery(query)
+        self.setParameters(parameters)
+        self._getJoin(join_condition)
+        self._getFilter(filter_condition)
+        self._getSort(sort_condition)
+        self.getLogger().inform(f"Query built for streaming data!\nQuery: {self.getQuery()}\nBatch Size: {batch_size}", {"Parameters": self.getParameters()})
+        try:
+            database_handler: PooledMySQLConnection = Connection_Pool.getConnection(self.__getHost(), self.__getDatabase(), self.__getUsername(), self.__getPassword())
+        except Error as error:
+            self.getLogger().error(f"Connection Failed!\nError: {error}")
+            raise RuntimeError(error)
+        statement: MySQLCursor = database_handler.cursor(dictionary=True) # type: ignore
+        try:
+            statement.execute(self.getQuery(), self.getParameters())
+            rows: List[RowType] = statement.fetchmany(batch_size)
+            while rows:
+                yield from rows
+                rows = statement.fetchmany(batch_size)
+        finally:
+            if database_handler.unread_result:
+                database_handler.consume_results()
+            statement.close()
+            Connection_Pool.releaseConnection(database_handler)
+
+    def iterPages(self, table_name: str, key: str = "identifier", parameters: Union[Tuple[Any, ...], None] = None, filter_condition: str = "", column_names: str = "*", batch_size: int = 1000, is_dictionary: bool = True, row_factory: Union[Callable[[RowType], Any], None] = None) -> Iterator[List[Any]]:
+        """
+        Retrieving the data of a table page by page through keyset
+        pagination.  Each page is a short query which resumes after
+        the last key of the previous page, so that only one page is
+        held in memory and no connection is held between pages.
+
+        Parameters:
+            table_name (str): The name of the table.
+            key (str): The unique and indexed column to paginate on.
+            parameters (Union[Tuple[Any, ...], None]): The parameters of the filter condition.
+            filter_condition (str): Items to be filtered with.
+            column_names (str): The name of the columns, which must contain the key.
+            batch_size (int): The amount of rows per page.
+            is_dictionary (bool): Whether the rows are returned as dictionaries instead of tuples, in which case the key must be the first column.
+            row_factory (Union[Callable[[RowType], Any], None]): The function building the data transfer object of a row, without which the rows are yielded as they are retrieved.
+
+        Returns:
+            Iterator[List[Any]]
+
+        Raises:
+            Error: If a page cannot be retrieved, after it has been logged.
+        """
+        condition: str = f"({filter_condition}) AND {key} > %s" if filter_condition else f"{key} > %s"
+        last_key: Any = 0
+        amount: int = 0
+        try:
+            while True:
+                page: List[RowType] = self.getData(
+                    table_name=table_name,
+                    parameters=tuple(parameters or ()) + (last_key,), # type: ignore
+                    filter_condition=condition,
+                    column_names=column_names,
+                    sort_condition=f"{key} ASC",
+                    limit_condition=batch_size,
+                    is_dictionary=is_dictionary
+                )
+                if not page:
+                    break
+                amount += len(page)
+                yield page if row_factory is None else [row_factory(row) for row in page]
+                if len(page) < batch_size:
+                    break
+                last_key = page[-1][key] if is_dictionary else page[-1][0] # type: ignore
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {table_name}\nStatus: {self.service_unavailable}\nAmount: {amount}\nError: {error}")
+            raise
+        self.getLogger().inform(f"The data from {table_name} has been retrieved page by page!\nStatus: {self.ok if amount > 0 else self.no_content}\nAmount: {amount}", {"Filter": filter_condition})
+
     def _getJoin(self, condition: str) -> None:
         """
         Building the query needed for retrieving data that is in at
@@ -310,7 +666,24 @@ class Database_Handler:
             query = self.getQuery()
         self.setQuery(query)
 
-    def postData(self, table: str, columns: str, values: str, parameters: Tuple[Any]) -> None:
+    def _getDateRange(self, date: str) -> Tuple[int, int]:
+        """
+        Building the half-open range of Unix timestamps covering a
+        day, so that the timestamp columns can be filtered through
+        their indexes.  The day is interpreted in the local timezone
+        of the application, which is the same as the one of the
+        database server.
+
+        Parameters:
+            date (str): The day in the format YYYY-MM-DD.
+
+        Returns:
+            Tuple[int, int]: The start of the day and the start of the next day.
+        """
+        start: datetime = datetime.strptime(date, "%Y-%m-%d")
+        return (int(start.timestamp()), int((start + timedelta(days=1)).timestamp()))
+
+    def postData(self, table: str, columns: str, values: str, parameters: Tuple[Any]) -> int:
         """
         Creating records to store data into the database server.
 
@@ -320,15 +693,249 @@ class Database_Handler:
             values:     (string):   Data to be inserted
 
         Return:
-            (void)
+            (int):  The identifier generated for the record, which is 0 when it is not inserted.
         """
         query = f"INSERT INTO {table}({columns}) VALUES ({values})"
         self.setQuery(query)
         self.setParameters(parameters)
-        self.getLogger().inform(f"Query built for adding data!\nQuery: {self.getQuery()}\nParameters: {self.getParameters()}")
+        self.getLogger().inform(f"Query built for adding data!\nQuery: {self.getQuery()}", {"Parameters": self.getParameters()})
         self.__startTransaction()
         self._query(self.getQuery(), self.getParameters())
+        identifier: int = int(self.__getStatement().lastrowid or 0)
         self._execute()
+        return identifier
+
+    def postDataBatch(self, table: str, columns: str, rows: List[Tuple[Any, ...]], chunk_size: int = 1000) -> None:
+        """
+        Creating records in batches to store data into the database
+        server.  Each chunk is sent as a multi-row insert and is
+        committed on its own.
+
+        Parameters:
+            table (str): The name of the table.
+            columns (str): The names of the columns.
+            rows (List[Tuple[Any, ...]]): The rows to be inserted, in the order of the columns.
+            chunk_size (int): The amount of rows to be inserted per commit.
+
+        Returns:
+            None
+
+        Raises:
+            Error: If a chunk cannot be inserted, after it has been rolled back.
+        """
+        values: str = ", ".join(["%s"] * len(columns.split(",")))
+        query = f"INSERT INTO {table}({columns}) VALUES ({values})"
+        self.setQuery(query)
+        self.setParameters(None)
+        self.getLogger().inform(f"Query built for adding data in batches!\nQuery: {self.getQuery()}\nAmount: {len(rows)}\nChunk Size: {chunk_size}")
+        try:
+            for start in range(0, len(rows), chunk_size):
+                self.__startTransaction()
+                self.__setStatement(self.__getDatabaseHandler().cursor())
+                self.__getStatement().executemany(self.getQuery(), rows[start:start + chunk_size])
+                self.__commit()
+                self.__getStatement().close()
+        except Error as error:
+            self.__rollback()
+            self.__getStatement().close()
+            self._release()
+            self.getLogger().error(f"There is an error while adding data in batches into the database.\nRow: {start}\nError: {error}")
+            raise
+        self._release()
+
+    def replaceDataBatch(self, table: str, columns: str, rows: Iterable[Tuple[Any, ...]], chunk_size: int = 1000) -> int:
+        """
+        Replacing all of the records of a specific table.  The rows
+        are loaded in batches into a shadow table having the same
+        structure, which is then swapped with the live table in a
+        single atomic rename, so that the live table is never seen
+        partially loaded and is left untouched if the load fails.
+        The rows are consumed lazily between the chunks, so that they
+        can be produced page by page, even through this handler.
+        It is refused inside a unit of work, as the data definition
+        statements are committed implicitly, and on a table having
+        foreign keys, as they are not copied into the shadow table
+        and the ones referencing it would follow the previous table.
+        The swap is successful once the tables are renamed, even if
+        the previous table cannot be dropped.
+
+        Parameters:
+            table (str): The name of the table.
+            columns (str): The names of the columns.
+            rows (Iterable[Tuple[Any, ...]]): The rows to be inserted, in the order of the columns.
+            chunk_size (int): The amount of rows to be inserted per commit.
+
+        Returns:
+            int: The amount of rows inserted.
+
+        Raises:
+            NotSupportedError: If a unit of work is active or if the table has foreign keys.
+            Error: If the shadow table cannot be loaded or swapped, after it has been dropped.
+        """
+        if self.__isInUnitOfWork():
+            raise NotSupportedError(msg=f"The shadow table of {table} cannot be swapped inside a unit of work, as the data definition statements are committed implicitly.")
+        foreign_keys: List[str] = self.getForeignKeys(table)
+        if foreign_keys:
+            raise NotSupportedError(msg=f"The shadow table of {table} cannot be swapped, as its foreign keys would not follow it.\nForeign Keys: {', '.join(foreign_keys)}")
+        shadow_table: str = f"{table}_new"
+        previous_table: str = f"{table}_old"
+        values: str = ", ".join(["%s"] * len(columns.split(",")))
+        query: str = f"INSERT INTO {shadow_table}({columns}) VALUES ({values})"
+        self.getLogger().inform(f"Replacing the data through a shadow table!\nTable: {table}\nShadow Table: {shadow_table}\nChunk Size: {chunk_size}")
+        amount: int = 0
+        iterator: Iterator[Tuple[Any, ...]] = iter(rows)
+        try:
+            self.__define(f"DROP TABLE IF EXISTS {shadow_table}, {previous_table}")
+            self.__define(f"CREATE TABLE {shadow_table} LIKE {table}")
+            chunk: List[Tuple[Any, ...]] = list(islice(iterator, chunk_size))
+            while chunk:
+                self.__startTransaction()
+                self.__setStatement(self.__getDatabaseHandler().cursor())
+                try:
+                    self.__getStatement().executemany(query, chunk)
+                    self.__getDatabaseHandler().commit()
+                finally:
+                    self.__getStatement().close()
+                self._release()
+                amount += len(chunk)
+                chunk = list(islice(iterator, chunk_size))
+            self.__define(f"RENAME TABLE {table} TO {previous_table}, {shadow_table} TO {table}")
+        except Error as error:
+            if self.__database_handler is not None:
+                self.__getDatabaseHandler().rollback()
+                self._release()
+            self.getLogger().error(f"The shadow table cannot be swapped with the live table.\nTable: {table}\nShadow Table: {shadow_table}\nRow: {amount}\nError: {error}")
+            try:
+                self.__define(f"DROP TABLE IF EXISTS {shadow_table}")
+            except Error as drop_error:
+                self.getLogger().warn(f"The shadow table cannot be dropped.\nTable: {shadow_table}\nError: {drop_error}")
+            raise
+        try:
+            self.__define(f"DROP TABLE {previous_table}")
+        except Error as error:
+            self.getLogger().warn(f"The shadow table has been swapped with the live table but the previous table cannot be dropped.\nTable: {table}\nPrevious Table: {previous_table}\nError: {error}")
+        self.getLogger().inform(f"The shadow table has been swapped with the live table!\nTable: {table}\nAmount: {amount}")
+        return amount
+
+    def rewriteDataBatch(self, table: str, columns: str, rows: Iterable[Tuple[Any, ...]], chunk_size: int = 1000) -> int:
+        """
+        Replacing all of the records of a specific table which cannot
+        be swapped with a shadow table.  The rows are read before the
+        table is emptied, as they can be produced from the table
+        itself, and the deletion and the insertion are done in a
+        single unit of work, so that the table is left untouched if
+        the load fails.
+
+        Parameters:
+            table (str): The name of the table.
+            columns (str): The names of the columns.
+            rows (Iterable[Tuple[Any, ...]]): The rows to be inserted, in the order of the columns.
+            chunk_size (int): The amount of rows to be inserted per statement.
+
+        Returns:
+            int: The amount of rows inserted.
+
+        Raises:
+            Error: If the table cannot be emptied or loaded, after the unit of work has been rolled back.
+            RuntimeError: If the unit of work cannot be committed, after it has been rolled back.
+        """
+        dataset: List[Tuple[Any, ...]] = list(rows)
+        self.getLogger().inform(f"Replacing the data in a unit of work!\nTable: {table}\nAmount: {len(dataset)}\nChunk Size: {chunk_size}")
+        with self.unitOfWork():
+            self.deleteData(table=table, parameters=None)
+            self.postDataBatch(table, columns, dataset, chunk_size)
+        return len(dataset)
+
+    def getForeignKeys(self, table: str) -> List[str]:
+        """
+        Retrieving the foreign keys which are declared on a specific
+        table as well as the ones which reference it.
+
+        Parameters:
+            table (str): The name of the table.
+
+        Returns:
+            List[str]: The foreign keys, as the table declaring them followed by their name.
+        """
+        result_set: List[RowType] = self.getData(
+            table_name="information_schema.KEY_COLUMN_USAGE",
+            parameters=(table, table), # type: ignore
+            filter_condition="TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL AND (TABLE_NAME = %s OR REFERENCED_TABLE_NAME = %s)",
+            column_names="DISTINCT TABLE_NAME, CONSTRAINT_NAME"
+        )
+        return [f"{row['TABLE_NAME']}.{row['CONSTRAINT_NAME']}" for row in result_set] # type: ignore
+
+    def __define(self, query: str) -> None:
+        """
+        Executing a data definition statement which is committed
+        implicitly by the database server.
+
+        Parameters:
+            query (str): The data definition statement.
+
+        Returns:
+            None
+
+        Raises:
+            Error: If the statement cannot be executed.
+        """
+        self.getLogger().debug(f"Data definition statement to be sent to the database server!\nQuery: {query}")
+        self.__setStatement(self.__getDatabaseHandler().cursor())
+        try:
+            self.__getStatement().execute(query)
+        finally:
+            self.__getStatement().close()
+            self._release()
+
+    def updateDataBatch(self, table: str, columns: str, keys: str, rows: List[Tuple[Any, ...]], chunk_size: int = 1000) -> List[bool]:
+        """
+        Updating records in batches in a specific table.  Each chunk
+        is loaded into a temporary staging table and applied with a
+        single joined update which is committed on its own.
+
+        Parameters:
+            table (str): The name of the table.
+            columns (str): The names of the columns to be modified.
+            keys (str): The names of the columns identifying the records.
+            rows (List[Tuple[Any, ...]]): The rows to be applied, containing the keys followed by the columns.
+            chunk_size (int): The amount of rows to be applied per commit.
+
+        Returns:
+            List[bool]: Whether each chunk has been committed.
+        """
+        staging_table: str = f"{table}Staging"
+        key_names: List[str] = [key.strip() for key in keys.split(",")]
+        column_names: List[str] = [column.strip() for column in columns.split(",")]
+        values: str = ", ".join(["%s"] * (len(key_names) + len(column_names)))
+        join_condition: str = " AND ".join([f"{table}.{key} = {staging_table}.{key}" for key in key_names])
+        assignments: str = ", ".join([f"{table}.{column} = {staging_table}.{column}" for column in column_names])
+        query = f"UPDATE {table} INNER JOIN {staging_table} ON {join_condition} SET {assignments}"
+        self.setQuery(query)
+        self.setParameters(None)
+        self.getLogger().inform(f"Query built for updating data in batches!\nQuery: {self.getQuery()}\nAmount: {len(rows)}\nChunk Size: {chunk_size}")
+        statuses: List[bool] = []
+        self.__setStatement(self.__getDatabaseHandler().cursor())
+        try:
+            self.__getStatement().execute(f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging_table} AS SELECT {', '.join(key_names + column_names)} FROM {table} LIMIT 0")
+            for start in range(0, len(rows), chunk_size):
+                try:
+                    self.__startTransaction()
+                    self.__getStatement().execute(f"DELETE FROM {staging_table}")
+                    self.__getStatement().executemany(f"INSERT INTO {staging_table}({', '.join(key_names + column_names)}) VALUES ({values})", rows[start:start + chunk_size])
+                    self.__getStatement().execute(self.getQuery())
+                    self.__commit()
+                    statuses.append(True)
+                except Error as error:
+                    self.__rollback()
+                    self.getLogger().error(f"There is an error while updating data in batches into the database.\nRow: {start}\nError: {error}")
+                    statuses.append(False)
+            self.__getStatement().execute(f"DROP TEMPORARY TABLE IF EXISTS {staging_table}")
+        except Error as error:
+            self.getLogger().error(f"The staging table cannot be used to update data in batches.\nTable: {staging_table}\nError: {error}")
+            statuses += [False] * (len(range(0, len(rows), chunk_size)) - len(statuses))
+        self.__getStatement().close()
+        self._release()
+        return statuses
 
     def __startTransaction(self) -> None:
         """
@@ -337,6 +944,8 @@ class Database_Handler:
         Returns:
             None
         """
+        if self.__database_handler is None and self.__isInUnitOfWork():
+            return
         if self.__getDatabaseHandler().in_transaction:
             self.getLogger().warn(f"Model: Database_Handler\nMethod: postData\nMessage: The application is already in a transaction.")
             return
@@ -360,7 +969,7 @@ class Database_Handler:
         self.setQuery(query)
         self.setParameters(parameters)
         self._getFilter(condition)
-        self.getLogger().inform(f"Query built for updating data!\nQuery: {self.getQuery()}\nParameters: {self.getParameters()}")
+        self.getLogger().inform(f"Query built for updating data!\nQuery: {self.getQuery()}", {"Parameters": self.getParameters()})
         self._query(self.getQuery(), self.getParameters())
         self._execute()
 
@@ -380,19 +989,20 @@ class Database_Handler:
         self.setQuery(query)
         self.setParameters(parameters)
         self._getFilter(condition)
-        self.getLogger().inform(f"Query built for removing data!\nQuery: {self.getQuery()}\nParameters: {self.getParameters()}")
+        self.getLogger().inform(f"Query built for removing data!\nQuery: {self.getQuery()}", {"Parameters": self.getParameters()})
         self.__startTransaction()
         self._query(self.getQuery(), self.getParameters())
         self._execute()
 
     def close(self) -> None:
         """
-        Closing the database handler.
+        Closing the database handler by returning its connection to
+        the shared connection pool.
 
         Returns:
             None
         """
-        if not self.__getDatabaseHandler().is_connected():
+        if self.__database_handler is None:
             return
-        self.__getDatabaseHandler().close()
+        self._release()
         self.getLogger().inform("Database connection closed.")
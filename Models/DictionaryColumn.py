@@ -0,0 +1,82 @@
+"""
+This module provides the Dictionary_Column class, which is a
+dictionary encoded column of the data transfer objects being
+curated, so that the curation rules are evaluated once per
+distinct value instead of once per record.
+
+Authors:
+    Darkness4869
+"""
+
+
+from typing import Any, Callable, Dict, Iterable, List
+
+
+class Dictionary_Column:
+    """
+    A column of the data transfer objects which is dictionary
+    encoded.  Every distinct value is stored once along with the
+    records holding it, a rule is applied as a mask over the
+    distinct values and the curated values are written back into
+    the records, which remain the data transfer objects used for
+    the writes.
+    """
+    __name: str
+    """
+    The name of the attribute of the records.
+    """
+    __dictionary: Dict[Any, List[Any]]
+    """
+    The records indexed by the distinct values of the column.
+    """
+
+    def __init__(self, records: Iterable[Any], name: str) -> None:
+        """
+        Encoding the column of the records.
+
+        Parameters:
+            records (Iterable[Any]): The data transfer objects.
+            name (str): The name of the attribute to be encoded.
+        """
+        self.setName(name)
+        dictionary: Dict[Any, List[Any]] = {}
+        for record in records:
+            dictionary.setdefault(getattr(record, name), []).append(record)
+        self.setDictionary(dictionary)
+
+    def getName(self) -> str:
+        return self.__name
+
+    def setName(self, name: str) -> None:
+        self.__name = name
+
+    def getDictionary(self) -> Dict[Any, List[Any]]:
+        return self.__dictionary
+
+    def setDictionary(self, dictionary: Dict[Any, List[Any]]) -> None:
+        self.__dictionary = dictionary
+
+    def replace(self, predicate: Callable[[Any], bool], replacement: Any) -> int:
+        """
+        Replacing the values which are matching the predicate.  The
+        predicate is evaluated once per distinct value and only the
+        records of the values which are changed are written.
+
+        Parameters:
+            predicate (Callable[[Any], bool]): The rule to be matched by the values.
+            replacement (Any): The value replacing the matching ones.
+
+        Returns:
+            int: The amount of records matching the predicate.
+        """
+        matches: List[Any] = [value for value in self.getDictionary() if predicate(value)]
+        amount: int = 0
+        for value in matches:
+            amount += len(self.getDictionary()[value])
+            if value == replacement:
+                continue
+            records: List[Any] = self.getDictionary().pop(value)
+            for record in records:
+                setattr(record, self.getName(), replacement)
+            self.getDictionary().setdefault(replacement, []).extend(records)
+        return amount
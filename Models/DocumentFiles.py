@@ -9,7 +9,7 @@ Authors:
 
 from Models.DatabaseHandler import Database_Handler
 from Data.DocumentFiles import DocumentFiles
-from typing import Dict, Union, Tuple, List, Any
+from typing import Dict, Union, Tuple, List, Any, Iterator
 from mysql.connector.types import RowType
 from mysql.connector.errors import Error
 
@@ -105,18 +105,18 @@ class Document_Files(Database_Handler):
             [{identifier: int, file_data: bytes, company_detail: int}]
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, Union[int, bytes]]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
                 join_condition=f"CompanyDetails ON {self.getTableName()}.CompanyDetail = CompanyDetails.identifier",
-                filter_condition="CompanyDetails.is_extracted = 0 AND DATE(FROM_UNIXTIME(CompanyDetails.date_incorporation)) = %s",
+                filter_condition="CompanyDetails.is_extracted = 0 AND CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s",
                 column_names=f"{self.getTableName()}.identifier, {self.getTableName()}.file_data, {self.getTableName()}.CompanyDetail",
                 sort_condition=f"{self.getTableName()}.identifier ASC"
             )
             response: Dict[str, Union[int, List[DocumentFiles]]] = self._getCorporateRegistries(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data}
             )
             return response["data"] # type: ignore
         except Error as error:
@@ -125,6 +125,41 @@ class Document_Files(Database_Handler):
             )
             return []
 
+    def iterCorporateRegistries(self, date_incorporation: str, batch_size: int = 1) -> Iterator[DocumentFiles]:
+        """
+        Streaming the corporate registries based on the date of
+        incorporation of the company, so that only one corporate
+        registry is held in memory at a time.
+
+        Parameters:
+            date_incorporation (str): The date of incorporation of the company.
+            batch_size (int): The amount of corporate registries to be fetched per round-trip.
+
+        Returns:
+            Iterator[DocumentFiles]
+
+        Raises:
+            Error: If the corporate registries cannot be streamed, after it has been logged.
+        """
+        amount: int = 0
+        try:
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
+            for row in self.iterData(
+                table_name=self.getTableName(),
+                parameters=parameters,
+                join_condition=f"CompanyDetails ON {self.getTableName()}.CompanyDetail = CompanyDetails.identifier",
+                filter_condition="CompanyDetails.is_extracted = 0 AND CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s",
+                column_names=f"{self.getTableName()}.identifier, {self.getTableName()}.file_data, {self.getTableName()}.CompanyDetail",
+                sort_condition=f"{self.getTableName()}.identifier ASC",
+                batch_size=batch_size
+            ):
+                amount += 1
+                yield DocumentFiles(row) # type: ignore
+            self.getLogger().inform(f"The data from {self.getTableName()} has been streamed!\nStatus: {self.ok if amount > 0 else self.no_content}\nAmount: {amount}")
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nAmount: {amount}\nError: {error}")
+            raise
+
     def _getCorporateRegistries(self, dataset: Union[List[RowType], List[Dict[str, Union[int, bytes]]]]) -> Dict[str, Union[int, List[DocumentFiles]]]:
         """
         Retrieving the correct data type for the application.
@@ -180,17 +215,17 @@ class Document_Files(Database_Handler):
             int
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, int]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
                 join_condition=f"CompanyDetails ON {self.getTableName()}.CompanyDetail = CompanyDetails.identifier",
-                filter_condition="DATE(FROM_UNIXTIME(CompanyDetails.date_incorporation)) = %s",
+                filter_condition="CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s",
                 column_names=f"COUNT({self.getTableName()}.identifier) AS amount_found"
             )
             status: int = self.getAmountStatus(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}", {"Data": data}
             )
             return int(data[0]["amount_found"]) # type: ignore
         except Error as error:
@@ -211,17 +246,17 @@ class Document_Files(Database_Handler):
             int
         """
         try:
-            parameters: Tuple[str] = (date_incorporation,)
+            parameters: Tuple[int, int] = self._getDateRange(date_incorporation)
             data: Union[List[RowType], List[Dict[str, int]]] = self.getData(
                 table_name=self.getTableName(),
                 parameters=parameters,
                 join_condition=f"CompanyDetails ON {self.getTableName()}.CompanyDetail = CompanyDetails.identifier",
-                filter_condition="DATE(FROM_UNIXTIME(CompanyDetails.date_incorporation)) = %s AND CompanyDetails.is_extracted = 1",
+                filter_condition="CompanyDetails.date_incorporation >= %s AND CompanyDetails.date_incorporation < %s AND CompanyDetails.is_extracted = 1",
                 column_names=f"COUNT({self.getTableName()}.identifier) AS amount_found"
             )
             status: int = self.getAmountStatus(data)
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: {status}", {"Data": data}
             )
             return int(data[0]["amount_found"]) # type: ignore
         except Error as error:
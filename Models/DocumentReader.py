@@ -13,18 +13,55 @@ from Models.Logger import Corporate_Database_Builder_Logger
 from Data.DocumentFiles import DocumentFiles
 from Data.CompanyDetails import CompanyDetails
 from Environment import Environment
-from typing import Dict, Tuple, Union, List
+from typing import Dict, Tuple, Union, List, Any, Set
 from pdfminer.high_level import extract_text
 from datetime import date, datetime
 from json import dumps
-from re import L, findall, search, split
+from re import L, findall, search, split, compile, escape, Pattern
 from Models.OfficeBearers import Office_Bearers
 from Models.Shareholders import Shareholders
 from pdfminer.pdfparser import PDFSyntaxError
 from Models.CompanyDetails import Company_Details
 from Models.DocumentFiles import Document_Files
 from os import remove
+from io import BytesIO
 from time import time
+from functools import lru_cache
+
+
+_worker_document_reader: Union["Document_Reader", None] = None
+"""
+The document reader of the current worker process of the
+parallel extraction.
+"""
+boilerplate_pattern: Pattern[str] = compile("|".join([escape(value) for value in (
+    "Computer Generated Document",
+    "DISCLAIMER NOTICE",
+    "While we endeavour to keep the information up to date and as far as possible accurate, we cannot give any guarantee about the completeness, accuracy,",
+    "reliability of the information contained on the report.",
+    "\x0c"
+)]))
+"""
+The pattern of the page footers and of the disclaimer notice
+of the corporate registry.
+"""
+
+
+@lru_cache(maxsize=None)
+def compileExclusions(exclusions: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compiling the values that the lines of a section must not
+    contain into a single pattern.
+
+    Parameters:
+        exclusions (Tuple[str, ...]): The values that the lines must not contain.
+
+    Returns:
+        Pattern[str]
+    """
+    if len(exclusions) == 0:
+        return compile(r"(?!)")
+    return compile("|".join([escape(value) for value in exclusions]))
 
 
 class Document_Reader:
@@ -64,13 +101,39 @@ class Document_Reader:
     The model which will interact exclusively with the Document
     Files table.
     """
+    __debug_mode: bool
+    """
+    Whether the portable document files and the extracted data
+    are written into the cache directory of the application.
+    Otherwise, the corporate registries are parsed in memory.
+    """
+    __result_set: List[str]
+    """
+    The lines of the corporate registry that are being
+    extracted.
+    """
+    __positions: Dict[str, int]
+    """
+    The position of the first occurrence of every line of the
+    corporate registry that is being extracted.
+    """
+    __boilerplates: Set[str]
+    """
+    The page footers and the lines of the disclaimer notice of
+    the corporate registry that is being extracted.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, debug_mode: bool = False) -> None:
         """
         Initializing the document reader which will import and
         initialize the dependencies.
+
+        Parameters:
+            debug_mode (bool): Whether the portable document files and the extracted data are written into the cache directory.
         """
         self.ENV = Environment()
+        self.setDebugMode(debug_mode)
+        self._indexResultSet([])
         self.setLogger(Corporate_Database_Builder_Logger())
         self.setOfficeBearer(Office_Bearers())
         self.setShareholder(Shareholders())
@@ -78,6 +141,12 @@ class Document_Reader:
         self.setDocumentFiles(Document_Files())
         self.getLogger().inform("The builder has been initialized and all of its dependencies are injected!")
 
+    def getDebugMode(self) -> bool:
+        return self.__debug_mode
+
+    def setDebugMode(self, debug_mode: bool) -> None:
+        self.__debug_mode = debug_mode
+
     def getDocumentFiles(self) -> Document_Files:
         return self.__document_files
 
@@ -108,6 +177,28 @@ class Document_Reader:
     def setShareholder(self, shareholders: Shareholders) -> None:
         self.__shareholders = shareholders
 
+    @staticmethod
+    def extractDataInProcess(dataset: DocumentFiles, company_detail: CompanyDetails, debug_mode: bool = False) -> Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None]:
+        """
+        Generating the portable document file of the corporate
+        registry and extracting its data from within a worker
+        process.  The document reader is instantiated once per
+        worker process.
+
+        Parameters:
+            dataset (DocumentFiles): The dataset of the corporate registry retrieved from the relational database server.
+            company_detail (CompanyDetails): The data of the Company Details.
+            debug_mode (bool): Whether the portable document files and the extracted data are written into the cache directory.
+
+        Returns:
+            Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None]
+        """
+        global _worker_document_reader
+        if _worker_document_reader is None:
+            _worker_document_reader = Document_Reader(debug_mode)
+        status: int = _worker_document_reader.generatePortableDocumentFile(dataset)
+        return _worker_document_reader.extractData(status, dataset, company_detail)
+
     def generatePortableDocumentFile(self, dataset: DocumentFiles) -> int:
         """
         Generating the portable document file based on the dataset
@@ -119,14 +210,177 @@ class Document_Reader:
         Returns:
             int
         """
+        status: int = 201
+        if not self.getDebugMode():
+            self.getLogger().debug(f"The portable document file of the corporate registry will be parsed in memory.\nDocument File Identifier: {dataset.identifier}\nCompany Detail Identifier: {dataset.company_detail}\nStatus: {status}")
+            return status
         file_name: str = f"{self.ENV.getDirectory()}Cache/CorporateDocumentFile/Documents/{dataset.company_detail}.pdf"
         file = open(file_name, "wb")
         file.write(dataset.file_data)
         file.close()
-        status: int = 201
         self.getLogger().inform(f"The portable document file of the corporate registry has been generated!\nLocation: {file_name}\nDocument File Identifier: {dataset.identifier}\nCompany Detail Identifier: {dataset.company_detail}\nStatus: {status}")
         return status
 
+    def _extractText(self, dataset: DocumentFiles, file_name: str) -> str:
+        """
+        Extracting the text of the corporate registry, either from
+        the file data in memory or from the portable document file
+        in the cache directory when the debug mode is enabled.
+
+        Parameters:
+            dataset (DocumentFiles): The dataset of the corporate registry retrieved from the relational database server.
+            file_name (str): The location of the portable document file in the cache directory.
+
+        Returns:
+            str
+        """
+        if self.getDebugMode():
+            return extract_text(file_name)
+        return extract_text(BytesIO(dataset.file_data))
+
+    def _cacheExtractedData(self, file_name: str, data: Dict[str, Any]) -> None:
+        """
+        Writing the extracted data into the cache directory when the
+        debug mode is enabled.
+
+        Parameters:
+            file_name (str): The location of the cache file.
+            data (Dict[str, Any]): The data extracted from the corporate registry.
+
+        Returns:
+            None
+        """
+        if not self.getDebugMode():
+            return
+        cache_file = open(file_name, "w")
+        cache_file.write(dumps(data, indent=4))
+        cache_file.close()
+
+    def _removePortableDocumentFile(self, file_name: str) -> None:
+        """
+        Removing the portable document file from the cache directory
+        when the debug mode is enabled.
+
+        Parameters:
+            file_name (str): The location of the portable document file.
+
+        Returns:
+            None
+        """
+        if not self.getDebugMode():
+            return
+        remove(file_name)
+
+    def _indexResultSet(self, result_set: List[str]) -> None:
+        """
+        Scanning the lines of the corporate registry once to store
+        the position of every header as well as the boilerplate
+        lines, so that the extractors do not have to search the
+        result set for each of their sections.
+
+        Parameters:
+            result_set (List[str]): The result set which is based from the portable document file version of the corporate registry.
+
+        Returns:
+            None
+        """
+        positions: Dict[str, int] = {}
+        boilerplates: Set[str] = set()
+        for index, value in enumerate(result_set):
+            positions.setdefault(value, index)
+            if boilerplate_pattern.search(value) is not None:
+                boilerplates.add(value)
+        self.__result_set = result_set
+        self.__positions = positions
+        self.__boilerplates = boilerplates
+
+    def _getIndex(self, result_set: List[str], header: str) -> int:
+        """
+        Retrieving the position of the first occurrence of the
+        header in the result set from the index of the corporate
+        registry.
+
+        Parameters:
+            result_set (List[str]): The result set which is based from the portable document file version of the corporate registry.
+            header (str): The header of the section.
+
+        Returns:
+            int
+
+        Raises:
+            ValueError: If the header is not in the result set.
+        """
+        if result_set is not self.__result_set:
+            return result_set.index(header)
+        if header not in self.__positions:
+            raise ValueError(f"{header!r} is not in list")
+        return self.__positions[header]
+
+    def _hasLine(self, result_set: List[str], header: str) -> bool:
+        """
+        Verifying whether the header is in the result set from the
+        index of the corporate registry.
+
+        Parameters:
+            result_set (List[str]): The result set which is based from the portable document file version of the corporate registry.
+            header (str): The header of the section.
+
+        Returns:
+            bool
+        """
+        if result_set is not self.__result_set:
+            return header in result_set
+        return header in self.__positions
+
+    def _isBoilerplate(self, value: str) -> bool:
+        """
+        Verifying whether the line is a page footer or a part of the
+        disclaimer notice of the corporate registry.
+
+        Parameters:
+            value (str): The line of the corporate registry.
+
+        Returns:
+            bool
+        """
+        if value in self.__boilerplates:
+            return True
+        return value not in self.__positions and boilerplate_pattern.search(value) is not None
+
+    def _filterSection(self, result_set: List[str], exclusions: Tuple[str, ...], is_boilerplate_excluded: bool = False) -> List[str]:
+        """
+        Removing the lines of the section which contain any of the
+        excluded values in a single pass.
+
+        Parameters:
+            result_set (List[str]): The lines of the section.
+            exclusions (Tuple[str, ...]): The values that the lines must not contain.
+            is_boilerplate_excluded (bool): Whether the page footers and the disclaimer notice are removed as well.
+
+        Returns:
+            List[str]
+        """
+        pattern: Pattern[str] = compileExclusions(exclusions)
+        if is_boilerplate_excluded:
+            return [value for value in result_set if not self._isBoilerplate(value) and pattern.search(value) is None]
+        return [value for value in result_set if pattern.search(value) is None]
+
+    def _excludeLines(self, result_set: List[str], excluded_lines: List[Any]) -> List[str]:
+        """
+        Removing the lines which have already been extracted from the
+        result set in a single pass, by looking them up in a set
+        instead of scanning the extracted lines for each line.
+
+        Parameters:
+            result_set (List[str]): The lines of the section.
+            excluded_lines (List[Any]): The lines that have already been extracted.
+
+        Returns:
+            List[str]
+        """
+        exclusions: Set[Any] = set(excluded_lines)
+        return [value for value in result_set if value not in exclusions]
+
     def extractData(self, status: int, dataset: DocumentFiles, company_detail: CompanyDetails) -> Union[Dict[str, Union[int, Dict[str, Union[str, int]], List[Dict[str, str]], List[Dict[str, Union[str, int]]], List[Dict[str, int]], Dict[str, Union[Dict[str, Union[int, str]], float]], Dict[str, Union[Dict[str, Union[int, str]], Dict[str, Union[Dict[str, float], float]]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]]]], Dict[str, Union[int, Dict[str, Union[str, int]], Dict[str, str], List[Dict[str, Union[str, int]]], Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]], Dict[str, Union[Dict[str, str], List[Dict[str, int]]]]]], None]:
         """
         Extracting the data from the portable document file version
@@ -174,9 +428,9 @@ class Document_Reader:
                 "status": 404
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             company_details: Dict[str, Union[str, int]] = self.extractCompanyDetails(portable_document_file_data_result_set)
             business_details: List[Dict[str, str]] = self.extractDataForeignDomesticBusinessDetails(portable_document_file_data_result_set)
             state_capital: List[Dict[str, Union[str, int, float]]] = self.extractStateCapital(portable_document_file_data_result_set)
@@ -214,14 +468,13 @@ class Document_Reader:
                 "details": details, # type: ignore
                 "objections": objections
             }
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
             status = self.getCompanyDetails().invalidateCompany(dataset.company_detail)
             status = self.getDocumentFiles().deleteDocumentFile(dataset.company_detail) if status == 202 else status
-            remove(file_name) if status == 204 else None
+            self._removePortableDocumentFile(file_name) if status == 204 else None
             status = 403 if status == 204 else status
             self.getLogger().error(f"Data cannot be extracted due to an error in the file type.\nStatus: {status}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}\nError: {error}")
             return {
@@ -243,17 +496,13 @@ class Document_Reader:
         start_index: int = result_set.index("Office Bearers") + 1
         end_index: int = result_set.index("Shareholders")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Position" not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "Shareholders" not in value]
+        result_set = self._filterSection(result_set, ("Position", "Name", "Service Address", "Appointed Date", "Shareholders"))
         date_appointments: List[str] = self.extractOfficeBearersDateAppointments(result_set)
-        result_set = [value for value in result_set if value not in date_appointments]
+        result_set = self._excludeLines(result_set, date_appointments)
         positions: List[str] = self.extractDataForeignDomesticOfficeBearersPositions(result_set)
-        result_set = [value for value in result_set if value not in positions]
+        result_set = self._excludeLines(result_set, positions)
         names: List[str] = self.extractOfficeBearersNames(result_set)
-        result_set = [value for value in result_set if value not in names]
+        result_set = self._excludeLines(result_set, names)
         addresses: List[str] = self.extractDataForeignDomesticOfficeBearersAddresses(result_set)
         if len(addresses) > 0:
             response = self._extractDataForeignDomesticOfficeBearersWithAddress(date_appointments, positions, names, addresses)
@@ -355,22 +604,13 @@ class Document_Reader:
         start_index: int = result_set.index("Business Details")
         end_index: int = result_set.index("Particulars of Stated Capital")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Business Details" not in value]
-        result_set = [value for value in result_set if "Business Registration No" not in value]
-        result_set = [value for value in result_set if "Business Name" not in value]
-        result_set = [value for value in result_set if "Nature of Business" not in value]
-        result_set = [value for value in result_set if "Principal Place of Business" not in value]
-        result_set = [value for value in result_set if "Particulars of Stated Capital" not in value]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "/" not in value]
-        result_set = [value for value in result_set if "Private" not in value]
-        result_set = [value for value in result_set if "Live" not in value]
+        result_set = self._filterSection(result_set, ("Business Details", "Business Registration No", "Business Name", "Nature of Business", "Principal Place of Business", "Particulars of Stated Capital", ":", "/", "Private", "Live"))
         dataset: List[str] = [value for value in result_set if "Court" in value.title() or "Street" in value.title() or "Mauritius".upper() in value or "Rodrigues".upper() in value]
         operational_addresses: List[str] = self.extractBusinessDetailsOperationalAddresses(result_set)
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         dataset = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == True and "/" in value]
         natures: List[str] = self.extractBusinessDetailsNatures(result_set)
-        names: List[str] = [value for value in result_set if value not in dataset]
+        names: List[str] = self._excludeLines(result_set, dataset)
         limitation: int = min([len(names), len(natures), len(operational_addresses)])
         for index in range(0, limitation, 1):
             response.append({
@@ -403,9 +643,9 @@ class Document_Reader:
                 "status": 404
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             company_details: Dict[str, Union[str, int]] = self.extractDataGlobalBusinessCompanyCompanyDetails(portable_document_file_data_result_set)
             business_details: Dict[str, str] = self.extractDataGlobalBusinessCompanyBusinessDetails(portable_document_file_data_result_set)
             state_capital: List[Dict[str, Union[str, int, float]]] = self.extractDataGlobalBusinessCompanyStatedCapital(portable_document_file_data_result_set)
@@ -423,14 +663,13 @@ class Document_Reader:
                 "administrators": administrators,
                 "liquidators": liquidators
             }
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
             status = self.getCompanyDetails().invalidateCompany(dataset.company_detail)
             status = self.getDocumentFiles().deleteDocumentFile(dataset.company_detail) if status == 202 else status
-            remove(file_name) if status == 204 else None
+            self._removePortableDocumentFile(file_name) if status == 204 else None
             status = 403 if status == 204 else status
             self.getLogger().error(f"Data cannot be extracted due to an error in the file type.\nStatus: {status}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}\nError: {error}")
             return {
@@ -452,21 +691,17 @@ class Document_Reader:
             start_index: int = result_set.index("Particulars of Stated Capital")
             end_index: int = result_set.index("Certificate (Issued by Other Institutions)")
             result_set = result_set[start_index:end_index]
-            result_set = [value for value in result_set if "Particulars of Stated Capital" not in value]
-            result_set = [value for value in result_set if "Type of Shares" not in value]
-            result_set = [value for value in result_set if "No. of Shares Currency" not in value]
-            result_set = [value for value in result_set if "Stated Capital" not in value]
-            result_set = [value for value in result_set if "Amount Unpaid Par Value" not in value]
+            result_set = self._filterSection(result_set, ("Particulars of Stated Capital", "Type of Shares", "No. of Shares Currency", "Stated Capital", "Amount Unpaid Par Value"))
             dataset: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == False]
             types: List[str] = self.extractDataGlobalBusinessCompanyStatedCapitalTypes(result_set)
-            result_set = [value for value in result_set if value not in dataset]
+            result_set = self._excludeLines(result_set, dataset)
             dataset = [value for value in result_set if bool(search(r"[\d]+", value)) == True and bool(search(r"[A-z]+", value)) == True]
             amounts: List[int] = self.extractDataGlobalBusinessCompanyStatedCapitalAmounts(result_set)
             currencies: List[str] = self.extractDataGlobalBusinessCompanyStatedCapitalCurrencies(result_set)
-            result_set = [value for value in result_set if value not in dataset]
+            result_set = self._excludeLines(result_set, dataset)
             dataset = [value for value in result_set if bool(search(r"[\d]+", value)) == True and " " not in value]
             stated_capital: List[float] = self.extractDataGlobalBusinessCompanyStatedCapitalStatedCapital(result_set)
-            result_set = [value for value in result_set if value not in dataset]
+            result_set = self._excludeLines(result_set, dataset)
             amount_unpaid: List[float] = self.extractDataGlobalBusinessCompanyStatedCapitalAmountUnpaid(result_set)
             response = self._extractDataGlobalBusinessCompanyStatedCapital(types, amounts, currencies, stated_capital, amount_unpaid)
         else:
@@ -626,10 +861,7 @@ class Document_Reader:
         start_index: int = result_set.index("Affidavits of Liquidator") + 1
         end_index: int = result_set.index("Receivers") if "Receivers" in result_set else result_set.index("This is a Computer Generated Document.")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Appointed Date:" not in value]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
+        result_set = self._filterSection(result_set, ("Appointed Date:", "Date Filed", "From", "To"))
         if len(result_set) < 3:
             return response
         for index in range(0, len(result_set), 3):
@@ -691,8 +923,7 @@ class Document_Reader:
         start_index = result_set.index("Administrators")
         end_index = result_set.index("Accounts of Administrator")
         dataset: List[str] = result_set[start_index:end_index] + date_appointeds
-        dataset = [value for value in dataset if "Administrators" not in value]
-        dataset = [value for value in dataset if "To" not in value]
+        dataset = self._filterSection(dataset, ("Administrators", "To"))
         administrator: Dict[str, Union[str, int]] = self._extractDataGlobalBusinessCompanyAdministrators(dataset)
         start_index = result_set.index("Accounts of Administrator")
         end_index = result_set.index("Liquidators")
@@ -743,10 +974,7 @@ class Document_Reader:
             {name: string, designation: string, address: string, date_appointed: int}
         """
         response: Dict[str, Union[str, int]]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
+        result_set = self._filterSection(result_set, (":", "Page", " of ", "Appointed Date"))
         validateds: List[str] = [value for value in result_set if "/" not in value]
         if len(validateds) == 0:
             return {}
@@ -881,39 +1109,20 @@ class Document_Reader:
         start_index: int = result_set.index("Office Bearers") + 1
         end_index: int = result_set.index("Liquidators") if "Liquidators" in result_set else len(result_set)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Position" not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "Receivers" not in value]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Reports of Receiver" not in value]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "Affidavits of Receiver" not in value]
-        result_set = [value for value in result_set if "Administrators" not in value]
+        result_set = self._filterSection(result_set, ("Position", "Name", "Service Address", "Appointed Date", "Receivers", ":", "Reports of Receiver", "Date Filed", "From", "Affidavits of Receiver", "Administrators"))
         result_set = [value for value in result_set if value != "To"]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Accounts of Administrator" not in value]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "This is a Computer Generated Document." not in value]
-        result_set = [value for value in result_set if "DISCLAIMER NOTICE" not in value]
-        result_set = [value for value in result_set if "While we endeavour to keep the information up to date and as far as possible accurate, we cannot give any guarantee about the completeness, accuracy," not in value]
-        result_set = [value for value in result_set if "\x0c" not in value]
+        result_set = self._filterSection(result_set, ("Page", " of ", "Accounts of Administrator", "Date Filed", "This is a Computer Generated Document.", "DISCLAIMER NOTICE", "While we endeavour to keep the information up to date and as far as possible accurate, we cannot give any guarantee about the completeness, accuracy,", "\x0c"))
         date_appointments: List[str] = [value for value in result_set if "/" in value and bool(search(r"[\d]+", value)) == True and bool(search(r"[A-Z]+", value)) == False]
-        result_set = [value for value in result_set if value not in date_appointments]
+        result_set = self._excludeLines(result_set, date_appointments)
         positions: List[str] = [value for value in result_set if  value in possible_positions]
-        result_set = [value for value in result_set if value not in positions]
+        result_set = self._excludeLines(result_set, positions)
         dataset: List[str] = [value for value in result_set if bool(search(r"[\w]+", value)) == True and ("Street".upper() in value.upper() or "Court".upper() in value.upper() or "Avenue".upper() in value.upper() or "Tower".upper() in value.upper() or "Floor".upper() in value.upper())]
         addresses: List[str] = self.extractDataGlobalBusinessCompanyOfficeBearersAddress(result_set)
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         names = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and "Mauritius".upper() not in value]
-        names = [value for value in names if "MANAGEMENT" not in value]
-        names = [value for value in names if "COMPANY" not in value]
-        result_set = [value for value in result_set if value not in names]
-        result_set = [value for value in result_set if "MANAGEMENT" not in value]
-        result_set = [value for value in result_set if "COMPANY" not in value]
+        names = self._filterSection(names, ("MANAGEMENT", "COMPANY"))
+        result_set = self._excludeLines(result_set, names)
+        result_set = self._filterSection(result_set, ("MANAGEMENT", "COMPANY"))
         if len(result_set) > 0:
             dataset = [value.replace("Mauritius".upper(), "") for value in addresses]
             addresses = [value_address + value_result_set for value_address, value_result_set in zip(dataset, result_set)]
@@ -1011,9 +1220,9 @@ class Document_Reader:
                 "status": 404
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             company_details: Dict[str, Union[str, int]] = self._extractDataAuthorisedCompanyCompanyDetails(portable_document_file_data_result_set)
             business_details: Dict[str, str] = self._extractDataAuthorisedCompanyBusinessDetails(portable_document_file_data_result_set)
             office_bearers: List[Dict[str, Union[str, int]]] = self._extractDataAuthorisedCompanyOfficeBearers(portable_document_file_data_result_set)
@@ -1029,14 +1238,13 @@ class Document_Reader:
                 "administrators": administrators,
                 "liquidators": liquidators
             }
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
             status = self.getCompanyDetails().invalidateCompany(dataset.company_detail)
             status = self.getDocumentFiles().deleteDocumentFile(dataset.company_detail) if status == 202 else status
-            remove(file_name) if status == 204 else None
+            self._removePortableDocumentFile(file_name) if status == 204 else None
             status = 403 if status == 204 else status
             self.getLogger().error(f"Data cannot be extracted due to an error in the file type.\nStatus: {status}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}\nError: {error}")
             return {
@@ -1057,10 +1265,10 @@ class Document_Reader:
         start_header: str = "Liquidators"
         end_header: str = "This is a Computer Generated Document."
         response: Dict[str, Union[Dict[str, str], List[Dict[str, int]]]] = {}
-        if start_header not in portable_document_file_data:
+        if not self._hasLine(portable_document_file_data, start_header):
             return response
-        start_index: int = portable_document_file_data.index(start_header)
-        end_index: int = portable_document_file_data.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_data, start_header)
+        end_index: int = self._getIndex(portable_document_file_data, end_header)
         result_set: List[str] = portable_document_file_data[start_index:end_index]
         liquidator: Dict[str, str] = self.__extractDataAuthorisedCompanyLiquidators(result_set)
         affidavits: List[Dict[str, int]] = self._extractDataAuthorisedCompanyLiquidatorsAffidavits(result_set)
@@ -1082,10 +1290,7 @@ class Document_Reader:
         """
         start_index: int = result_set.index("Affidavits of Liquidator") + 1
         result_set = result_set[start_index:]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
+        result_set = self._filterSection(result_set, (":", "Date Filed", "From", "To"))
         if len(result_set) > 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader._extractDataAuthorisedCompanyLiquidatorsAffidavits()")
             exit()
@@ -1105,11 +1310,7 @@ class Document_Reader:
         start_index: int = result_set.index("Liquidators") + 1
         end_index: int = result_set.index("Affidavits of Liquidator")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "/" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if "of" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
+        result_set = self._filterSection(result_set, (":", "/", "Page", "of", "Appointed Date"))
         if len(result_set) == 0:
             return {}
         self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader.__extractDataAuthorisedCompanyLiquidators()")
@@ -1128,10 +1329,10 @@ class Document_Reader:
         start_header: str = "Administrators"
         end_header: str = "Liquidators"
         response: Dict[str, Union[Dict[str, str], List[Dict[str, int]]]] = {}
-        if start_header not in portable_document_file_data:
+        if not self._hasLine(portable_document_file_data, start_header):
             return response
-        start_index: int = portable_document_file_data.index(start_header)
-        end_index: int = portable_document_file_data.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_data, start_header)
+        end_index: int = self._getIndex(portable_document_file_data, end_header)
         result_set: List[str] = portable_document_file_data[start_index:end_index]
         administrator: Dict[str, str] = self.__extractDataAuthorisedCompanyAdministrators(result_set)
         accounts: List[Dict[str, int]] = self._extractDataAuthorisedCompanyAdministratorsAccounts(result_set)
@@ -1182,11 +1383,7 @@ class Document_Reader:
         start_index: int = result_set.index("Administrators") + 1
         end_index: int = result_set.index("Accounts of Administrator")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "To" not in value]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "/" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if "of" not in value]
+        result_set = self._filterSection(result_set, ("To", ":", "/", "Page", "of"))
         if len(result_set) == 0:
             return {}
         self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader.__extractDataAuthorisedCompanyAdministrators()")
@@ -1206,31 +1403,19 @@ class Document_Reader:
         start_header: str = "Office Bearers"
         end_header: str = "Receivers"
         response: List[Dict[str, Union[str, int]]] = []
-        start_index: int = portable_document_file_data.index(start_header)
-        end_index: int = portable_document_file_data.index(end_header) if end_header in portable_document_file_data else len(portable_document_file_data)
+        start_index: int = self._getIndex(portable_document_file_data, start_header)
+        end_index: int = self._getIndex(portable_document_file_data, end_header) if self._hasLine(portable_document_file_data, end_header) else len(portable_document_file_data)
         result_set: List[str] = portable_document_file_data[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Computer Generated Document" not in value]
-        result_set = [value for value in result_set if "DISCLAIMER NOTICE" not in value]
-        result_set = [value for value in result_set if "While we endeavour to keep the information up to date and as far as possible accurate, we cannot give any guarantee about the completeness, accuracy," not in value]
-        result_set = [value for value in result_set if "reliability of the information contained on the report." not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if "of" not in value]
-        result_set = [value for value in result_set if "\x0c" not in value]
-        result_set = [value for value in result_set if "Position" not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Page", "of", "Position", "Name", "Appointed Date", "Service Address"), True)
         dataset: List[str] = [value for value in result_set if "/" in value and bool(search(r"[\d]+", value)) == True and bool(search(r"[A-Z]+", value)) == False]
         date_appointments: List[str] = self.extractOfficeBearersDateAppointments(result_set)
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         positions: List[str] = self.extractOfficeBearersPositions(result_set)
-        result_set = [value for value in result_set if value not in positions]
+        result_set = self._excludeLines(result_set, positions)
         dataset = [value for value in result_set if "Lane" in value or "Street" in value or "Road" in value or "Floor" in value or "Tower" in value or "Lane".upper() in value or "Street".upper() in value or "Road".upper() in value or "Floor".upper() in value or "Tower".upper() in value]
         addresses: List[str] = self._extractDataAuthorisedCompanyOfficeBearersAddresses(result_set)
-        result_set = [value for value in result_set if value not in dataset]
-        names: List[str] = [value for value in result_set if value not in addresses]
+        result_set = self._excludeLines(result_set, dataset)
+        names: List[str] = self._excludeLines(result_set, addresses)
         limitation: int = min([len(date_appointments), len(positions), len(addresses), len(names)])
         for index in range(0, limitation, 1):
             response.append({
@@ -1272,7 +1457,7 @@ class Document_Reader:
         """
         response: Dict[str, str]
         start_index: int = [index for index, value in enumerate(portable_document_file_data) if "Registered Office Address:" in value][0]
-        end_index: int = portable_document_file_data.index("Office Bearers")
+        end_index: int = self._getIndex(portable_document_file_data, "Office Bearers")
         result_set: List[str] = portable_document_file_data[start_index:end_index]
         response = {
             "registered_address": " ".join([value.split(": ")[-1] for value in result_set]).title()
@@ -1291,11 +1476,10 @@ class Document_Reader:
             {name: string, file_number: string, category: string, date_incorporation: int, nature: string, status: string}
         """
         response: Dict[str, Union[str, int]]
-        start_index: int = portable_document_file_data.index("Company Details") + 1
-        end_index: int = portable_document_file_data.index("Office Bearers")
+        start_index: int = self._getIndex(portable_document_file_data, "Company Details") + 1
+        end_index: int = self._getIndex(portable_document_file_data, "Office Bearers")
         result_set: List[str] = portable_document_file_data[start_index:end_index]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Registrar of Companies" not in value]
+        result_set = self._filterSection(result_set, (":", "Registrar of Companies"))
         response = {
             "name": result_set[1],
             "file_number": result_set[0],
@@ -1359,9 +1543,9 @@ class Document_Reader:
                 "status": extraction_status
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             company_details: Dict[str, Union[str, int]] = self.extractCompanyDetails(portable_document_file_data_result_set)
             business_details: List[Dict[str, str]] = self.extractDataDomesticPublicBusinessDetails(portable_document_file_data_result_set)
             certificates: List[Dict[str, Union[str, int]]] = self.extractCertificates(portable_document_file_data_result_set)
@@ -1399,8 +1583,7 @@ class Document_Reader:
                 "details": details,
                 "objections": objections
             }
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
@@ -1422,20 +1605,18 @@ class Document_Reader:
             [{name: string, amount: int, type: string, currency: string}]
         """
         response: List[Dict[str, Union[str, int]]] = []
-        start_index: int = portable_document_file_result_set.index("Shareholders") + 1
-        end_index: int = portable_document_file_result_set.index("Members (Applicable for Company Limited by Guarantee or Shares and Guarantee)")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Shareholders") + 1
+        end_index: int = self._getIndex(portable_document_file_result_set, "Members (Applicable for Company Limited by Guarantee or Shares and Guarantee)")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Type of Shares" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
+        result_set = self._filterSection(result_set, ("Name", "Type of Shares", "Currency"))
         dataset: List[str] = [value for value in result_set if bool(search(r"[\d]+", value)) == True and bool(search(r"[A-Z]+", value)) == True and bool(search(r"[^\w\s]+", value)) == False]
         amount_of_shares: List[int] = self.extractShareholdersAmountShares(result_set)
         type_of_shares: List[str] = self.extractShareholdersTypeShares(result_set)
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         names: List[str] = [value for value in result_set if bool(search(r"[A-z\s]+", value)) == True and "Mauritius" not in value]
-        names = [name for index, name in enumerate(names) if all(name not in names for name in names[:index])]
+        names = list(dict.fromkeys(names))
         dataset = [value for value in result_set if bool(search(r"[A-z\s]+", value)) == True and "Mauritius" not in value]
-        currencies: List[str] = [value for value in result_set if value not in dataset]
+        currencies: List[str] = self._excludeLines(result_set, dataset)
         for index in range(0, min([len(names), len(amount_of_shares), len(type_of_shares), len(currencies)]), 1):
             response.append({
                 "name": names[index].title(),
@@ -1458,16 +1639,16 @@ class Document_Reader:
         """
         response: List[Dict[str, str]] = []
         registered_address: str = " ".join([value for value in portable_document_file_result_set[[index for index, value in enumerate(portable_document_file_result_set) if "Registered Office Address" in value][0]].split(": ")[-1].split(" ") if value != ""])
-        start_index: int = portable_document_file_result_set.index("Business Details")
-        end_index: int = portable_document_file_result_set.index("Particulars of Stated Capital")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Business Details")
+        end_index: int = self._getIndex(portable_document_file_result_set, "Particulars of Stated Capital")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         result_set = [value for value in result_set if "Business" not in value]
         dataset: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and "Mauritius".upper() in value]
         operational_addresses: List[str] = self.extractBusinessDetailsOperationalAddresses(result_set)
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         dataset = [value for value in result_set if (bool(search(r"[A-Z]+", value)) == True or bool(search(r"[a-z]+", value)) == True) and bool(search(r"[\w]+", value)) == True]
         natures: List[str] = [value for value in result_set if (bool(search(r"[A-Z]+", value)) == True or bool(search(r"[a-z]+", value)) == True) and bool(search(r"[\w]+", value)) == True]
-        names: List[str] = [value for value in result_set if value not in dataset]
+        names: List[str] = self._excludeLines(result_set, dataset)
         for index in range(0, min([len(names), len(natures), len(operational_addresses)]), 1):
             response.append({
                 "registered_address": registered_address.title(),
@@ -1501,19 +1682,18 @@ class Document_Reader:
                 "status": 404
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             business_registration_number: Union[str, None] = self.extractDataDomesticCivilBusinessRegistrationNumber(portable_document_file_data_result_set)
             response = self._extractDataDomesticCivil(portable_document_file_data_result_set, business_registration_number)
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
             status = self.getCompanyDetails().invalidateCompany(dataset.company_detail)
             status = self.getDocumentFiles().deleteDocumentFile(dataset.company_detail) if status == 202 else status
-            remove(file_name) if status == 204 else None
+            self._removePortableDocumentFile(file_name) if status == 204 else None
             status = 403 if status == 204 else status
             self.getLogger().error(f"Data cannot be extracted due to an error in the file type.\nStatus: {status}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}\nError: {error}")
             return {
@@ -1544,19 +1724,18 @@ class Document_Reader:
                 "status": 404
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             business_registration_number: Union[str, None] = self.extractDataDomesticCivilBusinessRegistrationNumber(portable_document_file_data_result_set)
             response = self._extractDataDomesticCivil(portable_document_file_data_result_set, business_registration_number)
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
             status = self.getCompanyDetails().invalidateCompany(dataset.company_detail)
             status = self.getDocumentFiles().deleteDocumentFile(dataset.company_detail) if status == 202 else status
-            remove(file_name) if status == 204 else None
+            self._removePortableDocumentFile(file_name) if status == 204 else None
             status = 403 if status == 204 else status
             self.getLogger().error(f"Data cannot be extracted due to an error in the file type.\nStatus: {status}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}\nError: {error}")
             return {
@@ -1660,18 +1839,7 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Type" not in value]
-        result_set = [value for value in result_set if "Start Date" not in value]
-        result_set = [value for value in result_set if "End Date" not in value]
-        result_set = [value for value in result_set if "Status" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
-        result_set = [value for value in result_set if "PART" not in value]
-        result_set = [value for value in result_set if "Mauritius Rupee" not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Type", "Start Date", "End Date", "Status", "Currency", "PART", "Mauritius Rupee", "Name", "Service Address", "Appointed Date"))
         if len(result_set) == 0:
             return response
         if len(result_set) < 4:
@@ -1725,9 +1893,7 @@ class Document_Reader:
         start_index: int = result_set.index("Accounts of Administrator") + 1
         end_index: int = result_set.index("Winding Up Details")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
+        result_set = self._filterSection(result_set, ("Date Filed", "From", "To"))
         if len(result_set) > 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader._extractDataDomesticCivilCivilAdministratorsAccounts()")
             exit()
@@ -1781,9 +1947,7 @@ class Document_Reader:
         result_set = result_set[start_index:end_index]
         start_index = result_set.index("Name:")
         result_set = result_set[start_index:]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if "Date Issued" not in value]
-        result_set = [value for value in result_set if " of " not in value]
+        result_set = self._filterSection(result_set, ("Page", "Date Issued", " of "))
         receiver: Dict[str, Union[str, int]] = self.__extractDataDomesticCivilCivilReceivers(result_set)
         reports: List[Dict[str, int]] = self._extractDataDomesticCivilCivilReports(result_set)
         affidavits: List[Dict[str, int]] = self._extractDataDomesticCivilCivilAffidavits(result_set)
@@ -1816,9 +1980,7 @@ class Document_Reader:
         end_index = int(len(date_to) / 2)
         date_to = date_to[:end_index]
         result_set = dataset + date_to
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
+        result_set = self._filterSection(result_set, ("Date Filed", "From", "To"))
         if len(result_set) > 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader._extractDataDomesticCivilCivilAffidavits()")
             exit()
@@ -1849,9 +2011,7 @@ class Document_Reader:
         end_index = int(len(date_to) / 2)
         date_to = date_to[:end_index]
         result_set = dataset + date_to
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
+        result_set = self._filterSection(result_set, ("Date Filed", "From", "To"))
         if len(result_set) > 0:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader._extractDataDomesticCivilCivilReports()")
             exit()
@@ -1921,19 +2081,10 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "/" not in value]
-        result_set = [value for value in result_set if "Shares" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
-        result_set = [value for value in result_set if "REUNION" not in value]
-        result_set = [value for value in result_set if "MAURITIUS" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Name", "Service Address", "Appointed Date", "/", "Shares", "Currency", "REUNION", "MAURITIUS"))
         names = [name for name in result_set if bool(search(r"[\d]+", name)) == False]
         names = [name for name in names if bool(search(r"[a-z]+", name)) == False]
-        result_set = [value for value in result_set if value not in names]
+        result_set = self._excludeLines(result_set, names)
         amounts: List[int] = self._extractDataDomesticCivilCivilShareholdersAmount(result_set)
         shareholders_types: Dict[str, List[str]] = self._extractDataDomesticCivilCivilShareholdersType(result_set)
         types: List[str] = shareholders_types["types"]
@@ -2007,21 +2158,14 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "Position" not in value]
-        result_set = [value for value in result_set if "Office Bearers" not in value]
-        result_set = [value for value in result_set if "Associes" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Name", "Service Address", "Appointed Date", "Position", "Office Bearers", "Associes"))
         date_appointeds: List[str] = self._extractDataDomesticCivilCivilOfficeBearersDateAppointed(result_set)
-        result_set = [value for value in result_set if value not in date_appointeds]
+        result_set = self._excludeLines(result_set, date_appointeds)
         office_bearers_addresses: Dict[str, List[str]] = self._extractDataDomesticCivilCivilOfficeBearersAddresses(result_set)
         result_set = office_bearers_addresses["result_set"]
         addresses: List[str] = office_bearers_addresses["addresses"]
         positions: List[str] = self._extractDataDomesticCivilCivilOfficeBearersPositions(result_set)
-        names: List[str] = [value for value in result_set if value not in positions]
+        names: List[str] = self._excludeLines(result_set, positions)
         limitation: int = min([len(date_appointeds), len(addresses), len(positions), len(names)])
         for index in range(0, limitation, 1):
             response.append({
@@ -2074,8 +2218,8 @@ class Document_Reader:
             cities = self.__extractDataDomesticCivilCivilOfficeBearersAddressesCity(cities, city)
         for index in range(0, min([len(localities), len(cities)]), 1):
             addresses.append(f"{localities[index]} {cities[index]}")
-        result_set = [value for value in result_set if value not in localities]
-        result_set = [value for value in result_set if value not in cities]
+        result_set = self._excludeLines(result_set, localities)
+        result_set = self._excludeLines(result_set, cities)
         result_set = [value for value in result_set if "MAURITIUS" not in value]
         response = {
             "result_set": result_set,
@@ -2180,24 +2324,12 @@ class Document_Reader:
         start_index: int = result_set.index(start_header) + 1
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Type of Shares" not in value]
-        result_set = [value for value in result_set if "No. of Shares Currency" not in value]
-        result_set = [value for value in result_set if "Stated Capital" not in value]
-        result_set = [value for value in result_set if "Amount Unpaid" not in value]
-        result_set = [value for value in result_set if "Valeur" not in value]
-        result_set = [value for value in result_set if "Nominale" not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
-        result_set = [value for value in result_set if "Start Date" not in value]
-        result_set = [value for value in result_set if "End Date" not in value]
-        result_set = [value for value in result_set if "Status" not in value]
+        result_set = self._filterSection(result_set, ("Type of Shares", "No. of Shares Currency", "Stated Capital", "Amount Unpaid", "Valeur", "Nominale", "Name", "Service Address", "Appointed Date", "Currency", "Start Date", "End Date", "Status"))
         types: List[str] = self._extractDataDomesticCivilCivilStateCapitalTypes(result_set)
-        result_set = [value for value in result_set if value not in types]
+        result_set = self._excludeLines(result_set, types)
         amounts: List[int] = self._extractDataDomesticCivilCivilStateCapitalAmount(result_set)
         currencies: List[str] = self._extractDataDomesticCivilCivilStateCapitalCurrency(result_set)
-        result_set = [value for value in result_set if value not in currencies]
+        result_set = self._excludeLines(result_set, currencies)
         stated_capitals: List[int] = self._extractDataDomesticCivilCivilStateCapitalStatedCapital(result_set)
         result_set = [value for value in result_set if value not in str(amounts)]
         amount_unpaids: List[int] = self._extractDataDomesticCivilCivilStateCapitalAmountUnpaid(result_set)
@@ -2388,8 +2520,7 @@ class Document_Reader:
         result_set = [value for value in result_set if "/" not in value]
         result_set = [value for value in result_set if bool(search(r"[\d]+", value)) == True]
         result_set = [value for value in result_set if bool(search(r"[a-z]+", value)) == True]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if "of" not in value]
+        result_set = self._filterSection(result_set, ("Page", "of"))
         response: List[int] = [int(value.split(" ")[0]) for value in result_set if bool(search(r"[\d]+", value)) == True]
         return response
 
@@ -2408,8 +2539,7 @@ class Document_Reader:
         start_index: int = result_set.index("Business Details") + 1
         end_index: int = result_set.index("Particulars of Stated Capital")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Business" not in value]
+        result_set = self._filterSection(result_set, (":", "Business"))
         if len(result_set) > 0:
             self.getLogger().error(f"The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader._extractDataDomesticCivilCivilBusinessDetails()\nAmount of Data: {len(result_set)}")
             exit()
@@ -2435,9 +2565,7 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Registrar of Companies" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Registrar of Companies"))
         category: str = result_set[[index for index, value in enumerate(result_set) if "Category" in value][0]].split(": ")[-1]
         result_set = [value for value in result_set if ":" not in value]
         file_number: str = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[0-9]+", value)) == True][0]
@@ -2503,9 +2631,9 @@ class Document_Reader:
                 "status": status
             }
         try:
-            portable_document_file_data: str = extract_text(file_name)
-            cache_file = open(cache_data_file_name, "w")
+            portable_document_file_data: str = self._extractText(dataset, file_name)
             portable_document_file_data_result_set: List[str] = list(filter(None, portable_document_file_data.split("\n")))
+            self._indexResultSet(portable_document_file_data_result_set)
             company_details: Dict[str, Union[str, int]] = self.extractCompanyDetails(portable_document_file_data_result_set)
             business_details: List[Dict[str, str]] = self.extractBusinessDetails(portable_document_file_data_result_set)
             certificates: List[Dict[str, Union[str, int]]] = self.extractCertificates(portable_document_file_data_result_set)
@@ -2544,14 +2672,13 @@ class Document_Reader:
                 "details": details,
                 "objections": objections
             }
-            cache_file.write(dumps(response, indent=4))
-            cache_file.close()
+            self._cacheExtractedData(cache_data_file_name, response)
             self.getLogger().inform(f"Data has been extracted from the portable document file version of the corporate registry.\nStatus: {response['status']}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}")
             return response
         except PDFSyntaxError as error:
             status = self.getCompanyDetails().invalidateCompany(dataset.company_detail)
             status = self.getDocumentFiles().deleteDocumentFile(dataset.company_detail) if status == 202 else status
-            remove(file_name) if status == 204 else None
+            self._removePortableDocumentFile(file_name) if status == 204 else None
             status = 403 if status == 204 else status
             self.getLogger().error(f"Data cannot be extracted due to an error in the file type.\nStatus: {status}\nDocument File Identifier: {dataset.identifier}\nFile Location: {file_name}\nCompany Details Identifier: {dataset.company_detail}\nError: {error}")
             return {
@@ -2569,7 +2696,7 @@ class Document_Reader:
             [{date_objection: int, objector: string}]
         """
         response: List[Dict[str, Union[int, str]]] = []
-        start_index: int = portable_document_file_result_set.index("Objections")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Objections")
         end_index: int = next((index for index, value in enumerate(portable_document_file_result_set) if value.startswith("Last Annual Registration Fee Paid:")), len(portable_document_file_result_set))
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         result_set = [value for value in result_set if "Object" not in value]
@@ -2596,17 +2723,10 @@ class Document_Reader:
         response: List[Dict[str, Union[str, int, None]]] = []
         start_header: str = "Winding Up Details"
         end_header: str = "Objections"
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Object" not in value]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Type" not in value]
-        result_set = [value for value in result_set if "Start Date" not in value]
-        result_set = [value for value in result_set if "End Date" not in value]
-        result_set = [value for value in result_set if "Status" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Object", ":", "Type", "Start Date", "End Date", "Status"))
         if len(result_set) < 3:
             return response
         if len(result_set) == 3:
@@ -2641,10 +2761,10 @@ class Document_Reader:
         start_header: str = "Administrators"
         end_header: str = "Page 6"
         response: Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]] = {}
-        if start_header not in portable_document_file_result_set:
+        if not self._hasLine(portable_document_file_result_set, start_header):
             return response
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         administrator: Dict[str, Union[str, int]] = self._extractAdministrators(result_set)
         accounts: List[Dict[str, int]] = self.extractAdministratorsAccounts(result_set)
@@ -2715,10 +2835,10 @@ class Document_Reader:
         start_header: str = "Receivers"
         end_header: str = "Accounts of Administrator"
         response: Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]] = {}
-        if start_header not in portable_document_file_result_set:
+        if not self._hasLine(portable_document_file_result_set, start_header):
             return response
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header) + 1
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header) + 1
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         receiver: Dict[str, Union[str, int]] = self._extractReceivers(result_set)
         reports: List[Dict[str, int]] = self.extractReceiversReports(result_set)
@@ -2750,14 +2870,9 @@ class Document_Reader:
         start_index: int = result_set.index("Affidavits of Receiver") + 1
         end_index: int = result_set.index("Administrators")
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Appointed" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Date Issued" not in value]
+        result_set = self._filterSection(result_set, ("Appointed", "Page", " of ", "Date Issued"))
         result_set = result_set + date_to
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
+        result_set = self._filterSection(result_set, ("Date Filed", "From", "To"))
         if len(result_set) >= 3:
             self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader.extractReceiversAffidavits()")
             exit()
@@ -2831,12 +2946,12 @@ class Document_Reader:
         start_header: str = "Liquidators"
         end_header: str = "Receivers"
         response: Dict[str, Union[Dict[str, Union[str, int]], List[Dict[str, int]]]] = {}
-        if start_header not in portable_document_file_result_set:
+        if not self._hasLine(portable_document_file_result_set, start_header):
             return response
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        start_index = portable_document_file_result_set.index("Appointed Date:")
+        start_index = self._getIndex(portable_document_file_result_set, "Appointed Date:")
         end_index = start_index + 6
         date_appointeds = [value for value in portable_document_file_result_set[start_index:end_index] if "Appointed Date:" in value or "/" in value]
         start_index = int(len(date_appointeds) * (2 / 3)) - 1
@@ -2865,15 +2980,7 @@ class Document_Reader:
         """
         start_index: int = result_set.index("Affidavits of Liquidator") + 1
         result_set = result_set[start_index:]
-        result_set = [value for value in result_set if "Affidavits of Liquidator" not in value]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "From" not in value]
-        result_set = [value for value in result_set if "To" not in value]
-        result_set = [value for value in result_set if "Appointed Date:" not in value]
-        result_set = [value for value in result_set if "Receivers" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if ":" not in value]
+        result_set = self._filterSection(result_set, ("Affidavits of Liquidator", "Date Filed", "From", "To", "Appointed Date:", "Receivers", "Page", " of ", ":"))
         result_set = [value for value in result_set if "/" in value]
         if len(result_set) <= 3:
             return []
@@ -2898,13 +3005,7 @@ class Document_Reader:
         end_index: int = result_set.index("Affidavits of Liquidator")
         dataset = result_set[start_index:end_index]
         dataset = [value for value in dataset if bool(search(r"[0-9]", value)) == False]
-        dataset = [value for value in dataset if ":" not in value]
-        dataset = [value for value in dataset if "Name" not in value]
-        dataset = [value for value in dataset if "Service Address" not in value]
-        dataset = [value for value in dataset if "Appointed Date" not in value]
-        dataset = [value for value in dataset if "No. of Shares Type of Shares" not in value]
-        dataset = [value for value in dataset if "Currency" not in value]
-        dataset = [value for value in dataset if "Mauritius Rupee" not in value]
+        dataset = self._filterSection(dataset, (":", "Name", "Service Address", "Appointed Date", "No. of Shares Type of Shares", "Currency", "Mauritius Rupee"))
         if len(dataset) <= 2 or len(date_appointeds) == 0:
             return {}
         self.getLogger().error("The application will abort the extraction as the function has not been implemented!\nStatus: 503\nFunction: Document_Reader._extractLiquidators()")
@@ -2922,36 +3023,12 @@ class Document_Reader:
             [{volume: int, property: string, nature: string, amount: int, date_charged: int, date_filled: int, currency: string}]
         """
         start_header: str = "Charges"
-        end_header: str = "Liquidators" if "Liquidators" in portable_document_file_result_set else "Winding Up Details"
+        end_header: str = "Liquidators" if self._hasLine(portable_document_file_result_set, "Liquidators") else "Winding Up Details"
         response: List[Dict[str, Union[int, str]]] = []
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header) if end_header in portable_document_file_result_set else len(portable_document_file_result_set)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header) if self._hasLine(portable_document_file_result_set, end_header) else len(portable_document_file_result_set)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Winding Up Details" not in value]
-        result_set = [value for value in result_set if "Type" not in value]
-        result_set = [value for value in result_set if "Objections" not in value]
-        result_set = [value for value in result_set if "Objection Date" not in value]
-        result_set = [value for value in result_set if "Objector" not in value]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Start Date" not in value]
-        result_set = [value for value in result_set if "End Date" not in value]
-        result_set = [value for value in result_set if "Status" not in value]
-        result_set = [value for value in result_set if "Computer Generated Document" not in value]
-        result_set = [value for value in result_set if "DISCLAIMER NOTICE" not in value]
-        result_set = [value for value in result_set if "While we endeavour to keep the information up to date and as far as possible accurate, we cannot give any guarantee about the completeness, accuracy," not in value]
-        result_set = [value for value in result_set if "reliability of the information contained on the report." not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if "of" not in value]
-        result_set = [value for value in result_set if "\x0c" not in value]
-        result_set = [value for value in result_set if "Charges" not in value]
-        result_set = [value for value in result_set if "Volume" not in value]
-        result_set = [value for value in result_set if "Property" not in value]
-        result_set = [value for value in result_set if "Nature" not in value]
-        result_set = [value for value in result_set if "Amount Date Charged" not in value]
-        result_set = [value for value in result_set if "Amount" not in value]
-        result_set = [value for value in result_set if "Date Charged" not in value]
-        result_set = [value for value in result_set if "Date Filed" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
+        result_set = self._filterSection(result_set, ("Winding Up Details", "Type", "Objections", "Objection Date", "Objector", ":", "Start Date", "End Date", "Status", "Page", "of", "Charges", "Volume", "Property", "Nature", "Amount Date Charged", "Amount", "Date Charged", "Date Filed", "Currency"), True)
         if len(result_set) == 0:
             return response
         processed_volume: Dict[str, List[str]] = self.extractChargesVolumes(result_set)
@@ -2965,10 +3042,10 @@ class Document_Reader:
         amounts: List[int] = [int(value.replace(",", "")) for value in result_set if bool(search(r"[0-9]+", value)) == True]
         result_set = [value for value in result_set if bool(search(r"[0-9]+", value)) == False]
         natures: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == False]
-        result_set = [value for value in result_set if value not in natures]
+        result_set = self._excludeLines(result_set, natures)
         result_set = self.extractChargesProcessedResultSet(result_set)
         properties: List[str] = self.extractChargesProperties(result_set)
-        result_set = [value for value in result_set if value not in properties]
+        result_set = self._excludeLines(result_set, properties)
         currencies: List[str] = self.extractChargesCurrencies(result_set, len(properties))
         limitation: int = min(len(volumes), len(dates_charged), len(dates_filled), len(amounts), len(natures), len(properties), len(currencies))
         for index in range(0, limitation, 1):
@@ -3044,7 +3121,7 @@ class Document_Reader:
             {dates_charged: [string], dates_filled: [string], result_set: [string]}
         """
         dates: List[str] = [value for value in result_set if bool(search(r"[0-9]+", value)) == True and "/" in value]
-        result_set = [value for value in result_set if value not in dates]
+        result_set = self._excludeLines(result_set, dates)
         dates_charged: List[str] = []
         dates_filled: List[str] = []
         for index in range(0, len(dates), 2):
@@ -3068,9 +3145,9 @@ class Document_Reader:
         """
         volumes: List[str] = []
         volume_first_part: List[str] = [value for value in result_set if bool(search(r"[0-9]+", value)) == True and "/" in value and bool(search(r"[A-Z]+", value)) == True]
-        result_set = [value for value in result_set if value not in volume_first_part]
+        result_set = self._excludeLines(result_set, volume_first_part)
         volume_second_part: List[str] = [value for value in result_set if bool(search(r"[0-9]+", value)) == True and "/" not in value]
-        result_set = [value for value in result_set if value not in volume_second_part]
+        result_set = self._excludeLines(result_set, volume_second_part)
         volumes_limitation: int = min(len(volume_first_part), len(volume_second_part))
         for index in range(0, volumes_limitation, 1):
             volumes.append(f"{volume_first_part[index]}{volume_second_part[index]}")
@@ -3107,8 +3184,8 @@ class Document_Reader:
         """
         start_header: str = "BALANCE SHEET"
         end_header: str = "Charges"
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         balance_sheet: Dict[str, Union[int, str]] = self._extractBalanceSheet(result_set)
         assets: Dict[str, Union[Dict[str, float], float]] = self.extractBalanceSheetAssets(result_set)
@@ -3245,8 +3322,7 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header))
         non_current: Dict[str, float] = self.extractBalanceSheetAssetsNonCurrent(result_set)
         current: Dict[str, float] = self.extractBalanceSheetAssetsCurrent(result_set)
         if not non_current and not current:
@@ -3334,9 +3410,7 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if ":" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, ":"))
         if len(result_set) == 0:
             return {}
         if len(result_set) > 0 and len(result_set) < 3:
@@ -3369,9 +3443,7 @@ class Document_Reader:
         start_index: int = result_set.index(start_header)
         end_index: int = result_set.index(end_header)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if ":" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, ":"))
         if len(result_set) < 4:
             return {}
         financial_year: int = datetime.strptime(result_set[0], "%d/%m/%Y").year - 1
@@ -3398,8 +3470,8 @@ class Document_Reader:
         """
         start_header: str = "Last Financial Summary Filed"
         end_header: str = "BALANCE SHEET"
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         line_break: str = "-" * 10
         financial_summary: Dict[str, Union[int, str]] = self._extractProfitStatements(result_set)
@@ -3408,8 +3480,7 @@ class Document_Reader:
         start_index = result_set.index(start_header)
         end_index = result_set.index(end_header) if end_header in result_set else len(result_set)
         result_set = result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header))
         result_set = [value for value in result_set if bool(search(r"[A-z]+", value)) == False]
         result_set = [value for value in result_set if "/" not in value]
         if not financial_summary and len(result_set) == 0:
@@ -3454,17 +3525,10 @@ class Document_Reader:
         response: List[Dict[str, Union[int, str]]] = []
         start_header: str = "Financial Summary/Statements filed for last 3 years"
         end_header: str = "Last Financial Summary Filed"
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if start_header not in value]
-        result_set = [value for value in result_set if end_header not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Date Issued" not in value]
-        result_set = [value for value in result_set if "Financial Year Ended" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
-        result_set = [value for value in result_set if "Date Approved" not in value]
+        result_set = self._filterSection(result_set, (start_header, end_header, "Page", " of ", "Date Issued", "Financial Year Ended", "Currency", "Date Approved"))
         if len(result_set) < 3:
             return response
         for index in range(0, len(result_set), 3):
@@ -3511,8 +3575,8 @@ class Document_Reader:
         response: List[Dict[str, int]] = []
         start_header: str = "Annual Return filed for last 3 years"
         end_header: str = "Financial Summary/Statements filed for last 3 years"
-        start_index: int = portable_document_file_result_set.index(start_header)
-        end_index: int = portable_document_file_result_set.index(end_header)
+        start_index: int = self._getIndex(portable_document_file_result_set, start_header)
+        end_index: int = self._getIndex(portable_document_file_result_set, end_header)
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         result_set = [value for value in result_set if "/" in value and bool(search(r"[0-9]+", value)) == True]
         if len(result_set) < 3:
@@ -3538,15 +3602,10 @@ class Document_Reader:
             [{name: string, amount: int, date_start: int, currency: string}]
         """
         response: List[Dict[str, Union[str, int]]]
-        start_index: int = portable_document_file_result_set.index("Members (Applicable for Company Limited by Guarantee or Shares and Guarantee)") + 1
-        end_index: int = portable_document_file_result_set.index("Annual Return filed for last 3 years")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Members (Applicable for Company Limited by Guarantee or Shares and Guarantee)") + 1
+        end_index: int = self._getIndex(portable_document_file_result_set, "Annual Return filed for last 3 years")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Date" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Amount" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
+        result_set = self._filterSection(result_set, ("Date", "Page", " of ", "Name", "Amount", "Currency"))
         if len(result_set) > 0:
             response = self._extractMembers(result_set)
         else:
@@ -3568,11 +3627,11 @@ class Document_Reader:
         possible_currencies: List[str] = self.getShareholder().getPossibleCurrencies()
         dataset: List[str] = [value for value in result_set if bool(search(r"[\d]+", value)) == True and "/" not in value]
         amounts: List[int] = [int(value.replace(",", "")) for value in result_set if bool(search(r"[\d]+", value)) == True and "/" not in value]
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         date_starts: List[str] = [value for value in result_set if bool(search(r"[\d]+", value)) == True]
-        result_set = [value for value in result_set if value not in date_starts]
+        result_set = self._excludeLines(result_set, date_starts)
         currencies: List[str] = [value for value in result_set if value in possible_currencies]
-        names: List[str] = [value for value in result_set if value not in currencies]
+        names: List[str] = self._excludeLines(result_set, currencies)
         limitation: int = min([len(amounts), len(date_starts), len(currencies), len(names)])
         for index in range(0, limitation, 1):
             response.append({
@@ -3594,19 +3653,12 @@ class Document_Reader:
         Returns:
             [{certificate: string, type: str, date_effective: int, date_expiry: int}]
         """
-        start_index: int = portable_document_file_result_set.index("Certificate (Issued by Other Institutions)")
-        end_index: int = portable_document_file_result_set.index("Office Bearers")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Certificate (Issued by Other Institutions)")
+        end_index: int = self._getIndex(portable_document_file_result_set, "Office Bearers")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
         end_index = result_set.index("Name") if "Name" in result_set else len(result_set)
         result_set = result_set[:end_index] if "Name" in result_set else result_set
-        result_set = [value for value in result_set if "Certificate (Issued by Other Institutions)" not in value]
-        result_set = [value for value in result_set if "Certificate" not in value]
-        result_set = [value for value in result_set if "Type" not in value]
-        result_set = [value for value in result_set if "Effective Date" not in value]
-        result_set = [value for value in result_set if "Expiry Date" not in value]
-        result_set = [value for value in result_set if "Page" not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Date Issued" not in value]
+        result_set = self._filterSection(result_set, ("Certificate (Issued by Other Institutions)", "Certificate", "Type", "Effective Date", "Expiry Date", "Page", " of ", "Date Issued"))
         result_set = [value for value in result_set if bool(search(r"[A-z]+", value)) == True]
         if len(result_set) < 4:
             return []
@@ -3694,23 +3746,18 @@ class Document_Reader:
             [{name: string, amount: int, type: string, currency: string}]
         """
         response: List[Dict[str, Union[str, int]]] = []
-        start_index: int = portable_document_file_result_set.index("Shareholders") + 1
-        end_index: int = portable_document_file_result_set.index("Members (Applicable for Company Limited by Guarantee or Shares and Guarantee)")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Shareholders") + 1
+        end_index: int = self._getIndex(portable_document_file_result_set, "Members (Applicable for Company Limited by Guarantee or Shares and Guarantee)")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Type of Shares" not in value]
-        result_set = [value for value in result_set if "Currency" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "/" not in value]
+        result_set = self._filterSection(result_set, ("Name", "Type of Shares", "Currency", "Service Address", "Appointed Date", "/"))
         dataset: List[str] = [value for value in result_set if bool(search(r"[\d]+", value)) == True and bool(search(r"[A-Z]+", value)) == True and bool(search(r"[^\w\s]+", value)) == False]
         amount_of_shares: List[int] = self.extractShareholdersAmountShares(result_set)
         type_of_shares: List[str] = self.extractShareholdersTypeShares(result_set)
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         names: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and "Mauritius" not in value]
-        names = [name for index, name in enumerate(names) if all(name not in names for name in names[:index])]
+        names = list(dict.fromkeys(names))
         dataset = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and "Mauritius" not in value]
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         currencies: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == True]
         for index in range(0, min([len(names), len(amount_of_shares), len(type_of_shares), len(currencies)]), 1):
             response.append({
@@ -3905,20 +3952,16 @@ class Document_Reader:
             [{position: string, name: string, address: string, date_appointment: int}]
         """
         response: List[Dict[str, Union[str, int]]] = []
-        start_index: int = portable_document_file_result_set.index("Office Bearers") + 1
-        end_index: int = portable_document_file_result_set.index("No. of Shares Type of Shares")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Office Bearers") + 1
+        end_index: int = self._getIndex(portable_document_file_result_set, "No. of Shares Type of Shares")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Position" not in value]
-        result_set = [value for value in result_set if "Name" not in value]
-        result_set = [value for value in result_set if "Service Address" not in value]
-        result_set = [value for value in result_set if "Appointed Date" not in value]
-        result_set = [value for value in result_set if "Shareholders" not in value]
+        result_set = self._filterSection(result_set, ("Position", "Name", "Service Address", "Appointed Date", "Shareholders"))
         date_appointments: List[str] = self.extractOfficeBearersDateAppointments(result_set)
-        result_set = [value for value in result_set if value not in date_appointments]
+        result_set = self._excludeLines(result_set, date_appointments)
         positions: List[str] = self.extractOfficeBearersPositions(result_set)
-        result_set = [value for value in result_set if value not in positions]
+        result_set = self._excludeLines(result_set, positions)
         names: List[str] = self.extractOfficeBearersNames(result_set)
-        result_set = [value for value in result_set if value not in names]
+        result_set = self._excludeLines(result_set, names)
         addresses: List[str] = self.extractOfficeBearersAddresses(result_set)
         limitation: int = min([len(date_appointments), len(positions), len(names), len(addresses)])
         for index in range(0, limitation, 1):
@@ -3947,27 +3990,20 @@ class Document_Reader:
             [{type: string, amount: int, currency: string, state_capital: int, amount_unpaid: float}]
         """
         response: List[Dict[str, Union[str, int, float]]] = []
-        start_index: int = portable_document_file_result_set.index("Type of Shares")
-        end_index: int = portable_document_file_result_set.index("Certificate (Issued by Other Institutions)")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Type of Shares")
+        end_index: int = self._getIndex(portable_document_file_result_set, "Certificate (Issued by Other Institutions)")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Type of Shares" not in value]
-        result_set = [value for value in result_set if "No. of Shares Currency" not in value]
-        result_set = [value for value in result_set if "Stated Capital" not in value]
-        result_set = [value for value in result_set if "Amount Unpaid Par Value" not in value]
-        result_set = [value for value in result_set if "Page " not in value]
-        result_set = [value for value in result_set if " of " not in value]
-        result_set = [value for value in result_set if "Date" not in value]
-        result_set = [value for value in result_set if "/" not in value]
+        result_set = self._filterSection(result_set, ("Type of Shares", "No. of Shares Currency", "Stated Capital", "Amount Unpaid Par Value", "Page ", " of ", "Date", "/"))
         types: List[str] = [f"{value} SHARES" for value in " ".join([value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == False]).split(" SHARES") if value != ""]
         dataset: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == False]
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         amounts: List[int] = self.extractStateCapitalAmount(result_set)
         currencies: List[str] = self.extractStateCapitalCurrency(result_set)
         dataset = [value for value in result_set if bool(search(r"[\d]+", value)) == True and bool(search(r"[A-z]+", value)) == True]
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         stated_capitals: List[float] = self.extractStateCapitalStatedCapital(result_set)
         dataset = [value for value in result_set if bool(search(r"[\d]+", value)) == True and "," in value]
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         amount_unpaids: List[float] = self.extractStateCapitalAmountUnpaid(result_set)
         limitation: int = min([len(types), len(amounts), len(currencies), len(stated_capitals), len(amount_unpaids)])
         for index in range(0, limitation, 1):
@@ -4079,21 +4115,16 @@ class Document_Reader:
         """
         response: List[Dict[str, str]] = []
         registered_address: str = " ".join([value for value in portable_document_file_result_set[[index for index, value in enumerate(portable_document_file_result_set) if "Registered Office Address" in value][0]].split(": ")[-1].split(" ") if value != ""])
-        start_index: int = portable_document_file_result_set.index("Business Details")
-        end_index: int = portable_document_file_result_set.index("Type of Shares")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Business Details")
+        end_index: int = self._getIndex(portable_document_file_result_set, "Type of Shares")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if "Business Details" not in value]
-        result_set = [value for value in result_set if "Business Registration No" not in value]
-        result_set = [value for value in result_set if "Business Name" not in value]
-        result_set = [value for value in result_set if "Nature of Business" not in value]
-        result_set = [value for value in result_set if "Principal Place of Business" not in value]
-        result_set = [value for value in result_set if "Particulars of Stated Capital" not in value]
+        result_set = self._filterSection(result_set, ("Business Details", "Business Registration No", "Business Name", "Nature of Business", "Principal Place of Business", "Particulars of Stated Capital"))
         operational_addresses: List[str] = self.extractBusinessDetailsOperationalAddresses(result_set)
         dataset: List[str] = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and "Mauritius".upper() in value]
-        result_set = [value for value in result_set if value not in dataset]
+        result_set = self._excludeLines(result_set, dataset)
         dataset = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True and bool(search(r"[a-z]+", value)) == True and "/" in value]
         natures: List[str] = self.extractBusinessDetailsNatures(result_set)
-        names: List[str] = [value for value in result_set if value not in dataset]
+        names: List[str] = self._excludeLines(result_set, dataset)
         limitation: int = min([len(names), len(natures), len(operational_addresses)])
         for index in range(0, limitation, 1):
             response.append({
@@ -4152,12 +4183,10 @@ class Document_Reader:
         """
         response: Dict[str, Union[str, int]]
         business_registration_number: str = portable_document_file_result_set[[index for index, value in enumerate(portable_document_file_result_set) if "Business Registration No.:" in value][0]].split(" ")[-1]
-        start_index: int = portable_document_file_result_set.index("Company Details") + 1
-        end_index: int = portable_document_file_result_set.index("Business Name")
+        start_index: int = self._getIndex(portable_document_file_result_set, "Company Details") + 1
+        end_index: int = self._getIndex(portable_document_file_result_set, "Business Name")
         result_set: List[str] = portable_document_file_result_set[start_index:end_index]
-        result_set = [value for value in result_set if ":" not in value]
-        result_set = [value for value in result_set if "Registrar of Companies" not in value]
-        result_set = [value for value in result_set if "Business Details" not in value]
+        result_set = self._filterSection(result_set, (":", "Registrar of Companies", "Business Details"))
         file_number: str = result_set[0]
         result_set = [value for value in result_set if file_number not in value]
         name: str = [value for value in result_set if bool(search(r"[A-Z]+", value)) == True][0]
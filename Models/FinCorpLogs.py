@@ -61,7 +61,7 @@ class FinCorp_Logs(Database_Handler):
                 filter_condition="status <= 499 AND method_name = %s"
             )
             response: Dict[str, Union[int, List[FinCorpLogs]]] = self._getSuccessfulLogs(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data})
             return response["data"]  # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: 503\nError: {error}")
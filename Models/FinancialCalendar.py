@@ -56,7 +56,7 @@ class Financial_Calendar(Database_Handler):
                 column_names="YEAR(CURDATE()) AS year, quarter, FROM_UNIXTIME(UNIX_TIMESTAMP(CONCAT(YEAR(CURDATE()), '-', start_date)), '%m/%d/%Y') AS start_date, FROM_UNIXTIME(UNIX_TIMESTAMP(CONCAT(YEAR(CURDATE()), '-', end_date)), '%m/%d/%Y') AS end_date"
             )[0]
             self.getLogger().inform(
-                f"The data from {self.getTableName()} has been retrieved!\nStatus: 200\nData: {data}"
+                f"The data from {self.getTableName()} has been retrieved!\nStatus: 200", {"Data": data}
             )
             return FinancialCalendar(data)
         except Error as error:
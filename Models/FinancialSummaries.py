@@ -59,31 +59,41 @@ class Financial_Summaries(Database_Handler):
     def setTableName(self, table_name: str) -> None:
         self.__table_name = table_name
 
-    def addFinancialSummary(self, financial_summary: Dict[str, Union[int, str]], company_detail: int) -> int:
+    def addFinancialSummary(self, financial_summary: Dict[str, Union[int, str]], company_detail: int) -> Dict[str, int]:
         """
         Adding the financial summary data of the company into the
-        relational database server.
+        relational database server.  When it has already been
+        stored, the identifier of the stored one is returned.
 
         Parameters:
             financial_summary: {financial_year: int, currency: string, date_approved: int}: The data that has been extracted for the table.
             company_detail: int: The identifier of the company.
 
         Returns:
-            int
+            {status: int, identifier: int}
         """
         try:
             parameters: Tuple[int, int, str, int] = (company_detail, int(financial_summary["financial_year"]), str(financial_summary["currency"]), int(financial_summary["date_approved"]))
-            self.postData(
+            identifier: int = self.postData(
                 table=self.getTableName(),
                 columns="CompanyDetail, financial_year, currency, date_approved",
                 values="%s, %s, %s, %s",
                 parameters=parameters # type: ignore
             )
+            if identifier == 0:
+                identifier = self.getSpecific(company_detail, int(financial_summary["financial_year"])).identifier
+                self.getLogger().warn(f"The financial summary has already been stored, so its stored identifier is used.\nIdentifier: {identifier}")
             self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
-            return self.created
+            return {
+                "status": self.created,
+                "identifier": identifier
+            }
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
-            return self.service_unavailable
+            return {
+                "status": self.service_unavailable,
+                "identifier": 0
+            }
 
     def getSpecific(self, company_detail: int, financial_year: int) -> FinancialSummaries:
         """
@@ -104,7 +114,7 @@ class Financial_Summaries(Database_Handler):
                 parameters=parameters # type: ignore
             )
             response: Dict[str, Union[int, FinancialSummaries]] = self._getSpecific(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data})
             return response["data"] # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
@@ -147,7 +157,7 @@ class Financial_Summaries(Database_Handler):
                 condition="identifier = %s AND CompanyDetail = %s",
                 parameters=parameters # type: ignore
             )
-            self.getLogger().inform(f"The data from {self.getTableName()} has been updated!\nStatus: {self.accepted}\nData: {data}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been updated!\nStatus: {self.accepted}", {"Data": data})
             return self.accepted
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
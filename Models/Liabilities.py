@@ -55,30 +55,41 @@ class Liabilities(Database_Handler):
     def setTableName(self, table_name: str) -> None:
         self.__table_name = table_name
 
-    def addLiabilities(self, data: Dict[str, Union[Dict[str, float], float]], balance_sheet: int) -> int:
+    def addLiabilities(self, data: Dict[str, Union[Dict[str, float], float]], balance_sheet: int) -> Dict[str, int]:
         """
-        Adding the balance sheet of the company.
+        Adding the liabilities of the balance sheet.  When they have
+        already been stored, the identifier of the stored ones is
+        returned.
 
         Parameters:
             data: {equity_and_liabilities: {share_capital: float, other_reserves: float, retained_earnings: float, others: float, total: float}, non_current: {long_term_borrowings: float, deferred_tax: float, long_term_provisions: float, others: float, total: float}, current: {trade: float, short_term_borrowings: float, current_tax_payable: float, short_term_provisions: float, others: float, total: float}, total_liabilities: float, total_equity_and_liabilities: float}: The data of the assets.
             balance_sheet: int: The identifier of a balance sheet.
 
         Returns:
-            int
+            {status: int, identifier: int}
         """
         try:
             parameters: Tuple[int, float, float] = (balance_sheet, float(data["total_liabilities"]), float(data["total_equity_and_liabilities"])) # type: ignore
-            self.postData(
+            identifier: int = self.postData(
                 table=self.getTableName(),
                 columns="BalanceSheet, total_liabilities, total_equity_and_liabilities",
                 values="%s, %s, %s",
                 parameters=parameters # type: ignore
             )
+            if identifier == 0:
+                identifier = self.getSpecific(balance_sheet).identifier
+                self.getLogger().warn(f"The liabilities have already been stored, so their stored identifier is used.\nIdentifier: {identifier}")
             self.getLogger().inform(f"The data has been successfully stored.\nStatus: {self.created}")
-            return self.created
+            return {
+                "status": self.created,
+                "identifier": identifier
+            }
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
-            return self.service_unavailable
+            return {
+                "status": self.service_unavailable,
+                "identifier": 0
+            }
 
     def getSpecific(self, balance_sheet: int) -> data_object:
         """
@@ -98,7 +109,7 @@ class Liabilities(Database_Handler):
                 parameters=parameters # type: ignore
             )
             response: Dict[str, Union[int, data_object]] = self._getSpecific(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {data}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}", {"Data": data})
             return response["data"] # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
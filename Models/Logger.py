@@ -9,8 +9,16 @@ Authors:
 
 
 from logging.__init__ import Logger
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from Environment import Environment
+from typing import Any, Dict, List, Union
+from hashlib import sha1
+from dataclasses import is_dataclass, fields
+from multiprocessing import Queue
+from threading import Lock
+from multiprocessing.util import Finalize
 import logging
+import sys
 
 
 class Corporate_Database_Builder_Logger:
@@ -22,79 +30,215 @@ class Corporate_Database_Builder_Logger:
     It is responsible for logging all of the actions done by the
     application.
     """
+    level: int = logging.DEBUG
+    """
+    The lowest level of the messages of the application to be
+    logged.  The payloads of the messages below it are never
+    formatted.
+    """
+    root_level: int = logging.WARNING
+    """
+    The lowest level of the messages of the libraries to be
+    logged, so that their debugging messages are not written.
+    """
+    payload_limit: int = 1024
+    """
+    The maximum amount of characters of a payload to be logged,
+    beyond which it is truncated.
+    """
+    payload_rows: int = 10
+    """
+    The maximum amount of rows of a payload to be logged, beyond
+    which only its amount of rows is logged.
+    """
+    is_console_echoed: bool = True
+    """
+    Whether the messages are also written on the standard output.
+    """
+    max_bytes: int = 10 * 1024 * 1024
+    """
+    The size in bytes of the log file at which it is rotated.
+    """
+    backup_count: int = 5
+    """
+    The amount of rotated log files to be kept.
+    """
+    __listener: Union[QueueListener, None] = None
+    """
+    The listener which writes the queued records on the file and
+    the console from its own thread.  It is shared by all of the
+    loggers of the process which has started it as well as by its
+    forked workers.
+    """
+    __lock: Lock = Lock()
+    """
+    The lock ensuring that the listener is only started once.
+    """
 
     def __init__(self) -> None:
         """
         Instantiating the Logger which will keep track of everything
-        that the application does.
-        """
-        ENV = Environment()
-        logging.basicConfig(
-            filename=f"{ENV.getDirectory()}/Logs/CDB.log",
-            encoding="utf-8",
-            filemode="a",
-            format="----------\nCurrent Time: %(asctime)s\nModule: %(name)s\nLog Level: %(levelname)s\nMessage: %(message)s"
-        )
+        that the application does.  The records are queued and are
+        written by a listener shared by the process, so that logging
+        never blocks on the disk or the terminal.
+        """
+        Corporate_Database_Builder_Logger._listen()
         self.setLogger(logging.getLogger(__name__))
 
+    @classmethod
+    def _listen(cls) -> None:
+        """
+        Starting the listener and routing the records through its
+        queue, once.  The queue is shared with the forked workers,
+        which inherit its handler, so that their records are written
+        by the listener of the parent process instead of each worker
+        opening and rotating the log file on its own.  The listener
+        is stopped at the exit before the queue is closed, so that
+        the remaining records are written.
+
+        Returns:
+            void
+        """
+        with cls.__lock:
+            if cls.__listener is not None:
+                return
+            ENV = Environment()
+            file_handler: RotatingFileHandler = RotatingFileHandler(
+                filename=f"{ENV.getDirectory()}/Logs/CDB.log",
+                mode="a",
+                maxBytes=cls.max_bytes,
+                backupCount=cls.backup_count,
+                encoding="utf-8",
+                delay=True
+            )
+            file_handler.setFormatter(logging.Formatter("----------\nCurrent Time: %(asctime)s\nModule: %(name)s\nLog Level: %(levelname)s\nMessage: %(message)s"))
+            handlers: List[logging.Handler] = [file_handler]
+            if cls.is_console_echoed:
+                console_handler: logging.StreamHandler = logging.StreamHandler(sys.stdout)
+                console_handler.setFormatter(logging.Formatter("%(message)s"))
+                handlers.append(console_handler)
+            queue: Queue = Queue()
+            root: Logger = logging.getLogger()
+            root.addHandler(QueueHandler(queue))
+            root.setLevel(cls.root_level)
+            cls.__listener = QueueListener(queue, *handlers, respect_handler_level=True)
+            cls.__listener.start()
+            Finalize(None, cls.__listener.stop, exitpriority=20)
+
     def getLogger(self) -> Logger:
         return self.__logger
 
     def setLogger(self, logger: Logger) -> None:
+        logger.setLevel(self.level)
         self.__logger = logger
 
-    def debug(self, message: str) -> None:
+    def summarise(self, payload: Any) -> str:
+        """
+        Summarising a payload to be logged, so that binary data is
+        logged as its length and its hash, large result sets as
+        their amount of rows and long values are truncated.
+
+        Parameters:
+            payload (Any): The payload to be summarised.
+
+        Returns:
+            str
+        """
+        summary: str
+        if isinstance(payload, (bytes, bytearray, memoryview)):
+            summary = f"<{len(payload)} bytes, SHA-1: {sha1(payload).hexdigest()}>"
+        elif isinstance(payload, (list, tuple)) and len(payload) > self.payload_rows:
+            summary = f"<{len(payload)} rows>"
+        elif isinstance(payload, tuple):
+            summary = f"({', '.join([self.summarise(value) for value in payload])})"
+        elif isinstance(payload, list):
+            summary = f"[{', '.join([self.summarise(value) for value in payload])}]"
+        elif is_dataclass(payload) and not isinstance(payload, type):
+            summary = f"{type(payload).__name__}({', '.join([f'{field.name}={self.summarise(getattr(payload, field.name))}' for field in fields(payload)])})"
+        elif isinstance(payload, dict):
+            summary = f"{{{', '.join([f'{key!r}: {self.summarise(value)}' for key, value in payload.items()])}}}"
+        else:
+            summary = repr(payload)
+        if len(summary) > self.payload_limit:
+            summary = f"{summary[:self.payload_limit]}... <{len(summary)} characters>"
+        return summary
+
+    def _format(self, message: str, payloads: Union[Dict[str, Any], None]) -> str:
+        """
+        Formatting the message along with the summaries of its
+        payloads.
+
+        Parameters:
+            message (str): The action done.
+            payloads (Union[Dict[str, Any], None]): The payloads of the action indexed by their labels.
+
+        Returns:
+            str
+        """
+        if not payloads:
+            return message
+        return message + "".join([f"\n{label}: {self.summarise(payload)}" for label, payload in payloads.items()])
+
+    def debug(self, message: str, payloads: Union[Dict[str, Any], None] = None) -> None:
         """
         Logging the data for debugging
 
         Parameters:
             message: string: The action done.
+            payloads: {string: any}|null: The payloads of the action indexed by their labels, which are only summarised when the level is enabled.
 
         Returns:
             void
         """
-        self.getLogger().setLevel(logging.DEBUG)
+        if not self.getLogger().isEnabledFor(logging.DEBUG):
+            return
+        message = self._format(message, payloads)
         self.getLogger().debug(message)
-        print(message)
 
-    def inform(self, message: str) -> None:
+    def inform(self, message: str, payloads: Union[Dict[str, Any], None] = None) -> None:
         """
         Logging informational data.
 
         Parameters:
             message: string: The action done.
+            payloads: {string: any}|null: The payloads of the action indexed by their labels, which are only summarised when the level is enabled.
 
         Returns:
             void
         """
-        self.getLogger().setLevel(logging.INFO)
+        if not self.getLogger().isEnabledFor(logging.INFO):
+            return
+        message = self._format(message, payloads)
         self.getLogger().info(message)
-        print(message)
 
-    def warn(self, message: str) -> None:
+    def warn(self, message: str, payloads: Union[Dict[str, Any], None] = None) -> None:
         """
         Logging the data for a warning.
 
         Parameters:
             message: string: The action done.
+            payloads: {string: any}|null: The payloads of the action indexed by their labels, which are only summarised when the level is enabled.
 
         Returns:
             void
         """
-        self.getLogger().setLevel(logging.WARNING)
+        if not self.getLogger().isEnabledFor(logging.WARNING):
+            return
+        message = self._format(message, payloads)
         self.getLogger().warning(message)
-        print(message)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, payloads: Union[Dict[str, Any], None] = None) -> None:
         """
         Logging the data for an error.
 
         Parameters:
             message: string: The action done.
+            payloads: {string: any}|null: The payloads of the action indexed by their labels, which are only summarised when the level is enabled.
 
         Returns:
             void
         """
-        self.getLogger().setLevel(logging.ERROR)
+        if not self.getLogger().isEnabledFor(logging.ERROR):
+            return
+        message = self._format(message, payloads)
         self.getLogger().error(message)
-        print(message)
@@ -8,7 +8,8 @@ Authors:
 
 
 from Models.DatabaseHandler import Database_Handler
-from typing import Union, Dict, Tuple, List
+from Models.WriteBehindBuffer import Write_Behind_Buffer
+from typing import Union, Dict, Tuple, List, Iterator, Iterable, Callable
 from mysql.connector.errors import Error
 from mysql.connector.types import RowType
 from Data.Members import Member as Member_Data
@@ -87,6 +88,37 @@ class Member(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
         return response
 
+    def addMembersBatch(self, dataset: List[Dict[str, Union[str, int]]], company_detail: int, buffer: Union[Write_Behind_Buffer, None] = None) -> int:
+        """
+        Adding the members data of the company into the relational
+        database server in a single batch.
+
+        Parameters:
+            dataset: [{name: string, amount: int, date_start: int, currency: string}]: The data that has been extracted for the members table.
+            company_detail: int: The identifier of the company.
+            buffer: Write_Behind_Buffer|null: The write-behind buffer in which the rows are staged instead of being inserted.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: List[Tuple[str, int, int, str, int]] = [(str(data["name"]), int(data["amount"]), int(data["date_start"]), str(data["currency"]), company_detail) for data in dataset]
+            columns: str = "name, amount, date_start, currency, CompanyDetail"
+            if buffer is None:
+                self.postDataBatch(
+                    table=self.getTableName(),
+                    columns=columns,
+                    rows=rows # type: ignore
+                )
+            else:
+                buffer.stage(self.getTableName(), columns, rows) # type: ignore
+            response = self.created
+        except Error as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
     def get(self) -> List[Member_Data]:
         """
         Retrieving all of the data from the Members table.
@@ -99,7 +131,7 @@ class Member(Database_Handler):
                 table_name=self.getTableName()
             )
             response: Dict[str, Union[int, List[Member_Data]]] = self._get(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {response['data']}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
             return response["data"]  # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
@@ -123,6 +155,120 @@ class Member(Database_Handler):
             "data": data
         }
 
+    def iterAll(self, batch_size: int = 1000) -> Iterator[List[Member_Data]]:
+        """
+        Retrieving all of the data from the Members table page by
+        page, so that only one page is held in memory at a time.
+
+        Parameters:
+            batch_size (int): The amount of members per page.
+
+        Returns:
+            Iterator[List[Member_Data]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=Member_Data.columns,
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=Member_Data.fromRow
+        ) # type: ignore
+
+    def iterUncurated(self, batch_size: int = 1000) -> Iterator[List[Member_Data]]:
+        """
+        Retrieving the data from the Members table which has not
+        been curated yet page by page.
+
+        Parameters:
+            batch_size (int): The amount of members per page.
+
+        Returns:
+            Iterator[List[Member_Data]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=Member_Data.columns,
+            filter_condition="is_curated = 0",
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=Member_Data.fromRow
+        ) # type: ignore
+
+    def getUncurated(self) -> List[Member_Data]:
+        """
+        Retrieving the data from the Members table which has
+        not been curated yet.
+
+        Returns:
+            [{identifier: int, CompanyDetail: int, name: string, amount: int, date_start: int, currency: string}]
+        """
+        try:
+            data: Union[List[RowType], List[Dict[str, Union[int, str]]]] = self.getData(
+                table_name=self.getTableName(),
+                filter_condition="is_curated = 0"
+            )
+            response: Dict[str, Union[int, List[Member_Data]]] = self._get(data)
+            self.getLogger().inform(f"The data from {self.getTableName()} which has not been curated has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
+            return response["data"]  # type: ignore
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return []
+
+    def deleteMany(self, identifiers: List[int], chunk_size: int = 1000) -> int:
+        """
+        Deleting the members which have been discarded by the
+        curation.
+
+        Parameters:
+            identifiers (List[int]): The identifiers of the members.
+            chunk_size (int): The amount of members to be deleted per query.
+
+        Returns:
+            int
+        """
+        try:
+            for index in range(0, len(identifiers), chunk_size):
+                parameters: Tuple[int, ...] = tuple(identifiers[index:index + chunk_size])
+                self.deleteData(
+                    table=self.getTableName(),
+                    parameters=parameters, # type: ignore
+                    condition=f"identifier IN ({', '.join(['%s'] * len(parameters))})"
+                )
+            response = self.no_content
+            self.getLogger().inform(f"The data from {self.getTableName()} has been deleted!\nStatus: {response}\nAmount: {len(identifiers)}")
+            return response
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return self.service_unavailable
+
+    def updateCuratedMembers(self, dataset: List[Member_Data], chunk_size: int = 1000) -> List[int]:
+        """
+        Updating the curated members in batches and marking them
+        as curated, while preserving their identifiers.
+
+        Parameters:
+            dataset (List[Member_Data]): The curated members.
+            chunk_size (int): The amount of members to be updated per commit.
+
+        Returns:
+            List[int]: The status of each chunk.
+        """
+        rows: List[Tuple[int, int, str, int, int, str, int]] = [(member.identifier, member.CompanyDetail, member.name, member.amount, member.date_start, member.currency, 1) for member in dataset]
+        statuses: List[bool] = self.updateDataBatch(
+            table=self.getTableName(),
+            columns="CompanyDetail, name, amount, date_start, currency, is_curated",
+            keys="identifier",
+            rows=rows, # type: ignore
+            chunk_size=chunk_size
+        )
+        return [202 if status else 503 for status in statuses]
+
     def delete(self) -> int:
         """
         Deleting the data that is in the relational database server.
@@ -142,6 +288,66 @@ class Member(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
             return self.service_unavailable
 
+    def replaceCuratedMembers(self, dataset: Iterable[Member_Data], chunk_size: int = 1000) -> int:
+        """
+        Replacing all of the members by the curated ones through a
+        shadow table which is swapped with the live table once it
+        has been fully loaded.  The curated members are consumed
+        lazily, so that they can be curated page by page.  A table
+        having foreign keys cannot be swapped, so its curated members
+        are read and rewritten in a single unit of work instead.
+
+        Parameters:
+            dataset (Iterable[Member_Data]): The curated members.
+            chunk_size (int): The amount of members to be inserted per commit.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: Iterator[Tuple[int, int, str, int, int, str, int]] = ((member.identifier, member.CompanyDetail, member.name, member.amount, member.date_start, member.currency, 1) for member in dataset)
+            replace: Callable[..., int] = self.rewriteDataBatch if self.getForeignKeys(self.getTableName()) else self.replaceDataBatch
+            amount: int = replace(
+                table=self.getTableName(),
+                columns="identifier, CompanyDetail, name, amount, date_start, currency, is_curated",
+                rows=rows, # type: ignore
+                chunk_size=chunk_size
+            )
+            response = self.created
+            self.getLogger().inform(f"The data from {self.getTableName()} has been replaced!\nStatus: {response}\nAmount: {amount}")
+        except (Error, RuntimeError) as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
+    def addCuratedMembers(self, dataset: List[Member_Data], chunk_size: int = 1000) -> int:
+        """
+        Adding the curated members data of the companies into the
+        relational database server in batches.
+
+        Parameters:
+            dataset (List[Member_Data]): The curated members.
+            chunk_size (int): The amount of members to be inserted per commit.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: List[Tuple[int, int, str, int, int, str, int]] = [(member.identifier, member.CompanyDetail, member.name, member.amount, member.date_start, member.currency, 1) for member in dataset]
+            self.postDataBatch(
+                table=self.getTableName(),
+                columns="identifier, CompanyDetail, name, amount, date_start, currency, is_curated",
+                rows=rows, # type: ignore
+                chunk_size=chunk_size
+            )
+            response = self.created
+        except Error as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
     def addCuratedMember(self, data: Member_Data) -> int:
         """
         Adding the member data of the company into the relational
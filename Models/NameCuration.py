@@ -0,0 +1,64 @@
+"""
+This module provides the curation of the names of the
+shareholders and of the members, which rejects the addresses and
+the headers of the corporate registries that are extracted as
+names.  It does not depend on the builder, so that it can be
+used and measured on its own.
+
+Authors:
+    Darkness4869
+"""
+
+
+from re import compile, escape, Pattern
+
+
+name_blacklist_pattern: Pattern[str] = compile("|".join([escape(keyword) for keyword in (
+    "service address",
+    "street",
+    "lane",
+    "morcellement",
+    "port louis",
+    "mauritius rupee",
+    "avenue",
+    "quatre bornes",
+    "vacoas",
+    "office bearers",
+    "position",
+    "gerant",
+    "date issued",
+    "road",
+    ",",
+    "part",
+    "d'interet",
+    "louis mauritius",
+    " rd ",
+    "floor",
+    "goodlands",
+    "nhdc",
+    "mahebourg",
+    "rue",
+    " morc "
+)]))
+"""
+The keywords of the addresses and the headers of the corporate
+registries that are extracted as the names of the shareholders
+and members.
+"""
+
+
+def isCuratedName(name: str) -> bool:
+    """
+    Verifying whether the name of the shareholder or of the member
+    is not an address or a header of the corporate registry, by
+    lowering it once and matching it against all of the
+    blacklisted keywords at once.
+
+    Parameters:
+        name (str): The name of the shareholder or of the member.
+
+    Returns:
+        bool
+    """
+    name = name.lower()
+    return name != "mauritius" and name_blacklist_pattern.search(name) is None
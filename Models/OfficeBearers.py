@@ -8,7 +8,8 @@ Authors:
 
 
 from Models.DatabaseHandler import Database_Handler
-from typing import Union, Dict, Tuple, List
+from Models.WriteBehindBuffer import Write_Behind_Buffer
+from typing import Union, Dict, Tuple, List, Iterator, Iterable, Callable
 from mysql.connector.errors import Error
 from mysql.connector.types import RowType
 from Data.OfficeBearers import OfficeBearer
@@ -88,6 +89,37 @@ class Office_Bearers(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
         return response
 
+    def addDirectorsBatch(self, dataset: List[Dict[str, Union[str, int]]], company_detail: int, buffer: Union[Write_Behind_Buffer, None] = None) -> int:
+        """
+        Adding the directors data of the company into the relational
+        database server in a single batch.
+
+        Parameters:
+            dataset: [{position: string, name: string, address: string, date_appointment: int}]: The data that has been extracted for the office bearers table.
+            company_detail: int: The identifier of the company.
+            buffer: Write_Behind_Buffer|null: The write-behind buffer in which the rows are staged instead of being inserted.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: List[Tuple[str, str, str, int, int]] = [(str(data["position"]), str(data["name"]), str(data["address"]), int(data["date_appointment"]), company_detail) for data in dataset]
+            columns: str = "position, name, address, date_appointment, CompanyDetail"
+            if buffer is None:
+                self.postDataBatch(
+                    table=self.getTableName(),
+                    columns=columns,
+                    rows=rows # type: ignore
+                )
+            else:
+                buffer.stage(self.getTableName(), columns, rows) # type: ignore
+            response = self.created
+        except Error as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
     def getPossiblePositions(self) -> List[str]:
         """
         Retrieving all of the possible positions that are stored in
@@ -105,7 +137,7 @@ class Office_Bearers(Database_Handler):
             )
             dataset: Dict[str, Union[int, List[str]]] = self._getPossiblePositions(result_set)
             response = dataset["response"] # type: ignore
-            self.getLogger().inform(f"The data from the {self.getTableName()} table has been successfully retrieved.\nStatus: {dataset['status']}\nData: {dataset['response']}")
+            self.getLogger().inform(f"The data from the {self.getTableName()} table has been successfully retrieved.\nStatus: {dataset['status']}", {"Data": dataset['response']})
         except Error as error:
             status = self.service_unavailable
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {status}\nError: {error}")
@@ -181,7 +213,7 @@ class Office_Bearers(Database_Handler):
                 table_name=self.getTableName()
             )
             response: Dict[str, Union[int, List[OfficeBearer]]] = self._get(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {response['data']}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
             return response["data"]  # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
@@ -205,6 +237,120 @@ class Office_Bearers(Database_Handler):
             "data": data
         }
 
+    def iterAll(self, batch_size: int = 1000) -> Iterator[List[OfficeBearer]]:
+        """
+        Retrieving all of the data from the Office Bearer table page by
+        page, so that only one page is held in memory at a time.
+
+        Parameters:
+            batch_size (int): The amount of office bearers per page.
+
+        Returns:
+            Iterator[List[OfficeBearer]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=OfficeBearer.columns,
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=OfficeBearer.fromRow
+        ) # type: ignore
+
+    def iterUncurated(self, batch_size: int = 1000) -> Iterator[List[OfficeBearer]]:
+        """
+        Retrieving the data from the Office Bearer table which has not
+        been curated yet page by page.
+
+        Parameters:
+            batch_size (int): The amount of office bearers per page.
+
+        Returns:
+            Iterator[List[OfficeBearer]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=OfficeBearer.columns,
+            filter_condition="is_curated = 0",
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=OfficeBearer.fromRow
+        ) # type: ignore
+
+    def getUncurated(self) -> List[OfficeBearer]:
+        """
+        Retrieving the data from the Office Bearer table which has
+        not been curated yet.
+
+        Returns:
+            [{identifier: int, CompanyDetail: int, position: string, name: string, address: string|null, date_appointment: int}]
+        """
+        try:
+            data: Union[List[RowType], List[Dict[str, Union[int, str, None, float]]]] = self.getData(
+                table_name=self.getTableName(),
+                filter_condition="is_curated = 0"
+            )
+            response: Dict[str, Union[int, List[OfficeBearer]]] = self._get(data)
+            self.getLogger().inform(f"The data from {self.getTableName()} which has not been curated has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
+            return response["data"]  # type: ignore
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return []
+
+    def deleteMany(self, identifiers: List[int], chunk_size: int = 1000) -> int:
+        """
+        Deleting the office bearers which have been discarded by the
+        curation.
+
+        Parameters:
+            identifiers (List[int]): The identifiers of the office bearers.
+            chunk_size (int): The amount of office bearers to be deleted per query.
+
+        Returns:
+            int
+        """
+        try:
+            for index in range(0, len(identifiers), chunk_size):
+                parameters: Tuple[int, ...] = tuple(identifiers[index:index + chunk_size])
+                self.deleteData(
+                    table=self.getTableName(),
+                    parameters=parameters, # type: ignore
+                    condition=f"identifier IN ({', '.join(['%s'] * len(parameters))})"
+                )
+            response = self.no_content
+            self.getLogger().inform(f"The data from {self.getTableName()} has been deleted!\nStatus: {response}\nAmount: {len(identifiers)}")
+            return response
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return self.service_unavailable
+
+    def updateCuratedOfficeBearers(self, dataset: List[OfficeBearer], chunk_size: int = 1000) -> List[int]:
+        """
+        Updating the curated office bearers in batches and marking them
+        as curated, while preserving their identifiers.
+
+        Parameters:
+            dataset (List[OfficeBearer]): The curated office bearers.
+            chunk_size (int): The amount of office bearers to be updated per commit.
+
+        Returns:
+            List[int]: The status of each chunk.
+        """
+        rows: List[Tuple[int, int, str, str, Union[str, None], int, int]] = [(office_bearer.identifier, office_bearer.CompanyDetail, office_bearer.position, office_bearer.name, office_bearer.address, office_bearer.date_appointment, 1) for office_bearer in dataset]
+        statuses: List[bool] = self.updateDataBatch(
+            table=self.getTableName(),
+            columns="CompanyDetail, position, name, address, date_appointment, is_curated",
+            keys="identifier",
+            rows=rows, # type: ignore
+            chunk_size=chunk_size
+        )
+        return [202 if status else 503 for status in statuses]
+
     def delete(self) -> int:
         """
         Deleting the data that is in the relational database server.
@@ -224,6 +370,66 @@ class Office_Bearers(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
             return self.service_unavailable
 
+    def replaceCuratedOfficeBearers(self, dataset: Iterable[OfficeBearer], chunk_size: int = 1000) -> int:
+        """
+        Replacing all of the office bearers by the curated ones through a
+        shadow table which is swapped with the live table once it
+        has been fully loaded.  The curated office bearers are consumed
+        lazily, so that they can be curated page by page.  A table
+        having foreign keys cannot be swapped, so its curated office bearers
+        are read and rewritten in a single unit of work instead.
+
+        Parameters:
+            dataset (Iterable[OfficeBearer]): The curated office bearers.
+            chunk_size (int): The amount of office bearers to be inserted per commit.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: Iterator[Tuple[int, int, str, str, Union[str, None], int, int]] = ((office_bearer.identifier, office_bearer.CompanyDetail, office_bearer.position, office_bearer.name, office_bearer.address, office_bearer.date_appointment, 1) for office_bearer in dataset)
+            replace: Callable[..., int] = self.rewriteDataBatch if self.getForeignKeys(self.getTableName()) else self.replaceDataBatch
+            amount: int = replace(
+                table=self.getTableName(),
+                columns="identifier, CompanyDetail, position, name, address, date_appointment, is_curated",
+                rows=rows, # type: ignore
+                chunk_size=chunk_size
+            )
+            response = self.created
+            self.getLogger().inform(f"The data from {self.getTableName()} has been replaced!\nStatus: {response}\nAmount: {amount}")
+        except (Error, RuntimeError) as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
+    def addCuratedOfficeBearers(self, dataset: List[OfficeBearer], chunk_size: int = 1000) -> int:
+        """
+        Adding the curated office bearers data of the companies into
+        the relational database server in batches.
+
+        Parameters:
+            dataset (List[OfficeBearer]): The curated office bearers.
+            chunk_size (int): The amount of office bearers to be inserted per commit.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: List[Tuple[int, int, str, str, Union[str, None], int, int]] = [(office_bearer.identifier, office_bearer.CompanyDetail, office_bearer.position, office_bearer.name, office_bearer.address, office_bearer.date_appointment, 1) for office_bearer in dataset]
+            self.postDataBatch(
+                table=self.getTableName(),
+                columns="identifier, CompanyDetail, position, name, address, date_appointment, is_curated",
+                rows=rows, # type: ignore
+                chunk_size=chunk_size
+            )
+            response = self.created
+        except Error as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
     def addCuratedDirectors(self, data: OfficeBearer) -> int:
         """
         Adding the directors data of the company into the relational
@@ -3,7 +3,8 @@ The Model which will interact exclusively with the
 Shareholders table.
 """
 from Models.DatabaseHandler import Database_Handler
-from typing import Union, Dict, Tuple, List
+from Models.WriteBehindBuffer import Write_Behind_Buffer
+from typing import Union, Dict, Tuple, List, Iterator, Iterable, Callable
 from mysql.connector.errors import Error
 from mysql.connector.types import RowType
 from Data.Shareholders import Shareholder
@@ -83,6 +84,37 @@ class Shareholders(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
         return response
 
+    def addShareholdersBatch(self, dataset: List[Dict[str, Union[str, int]]], company_detail: int, buffer: Union[Write_Behind_Buffer, None] = None) -> int:
+        """
+        Adding the shareholders data of the company into the
+        relational database server in a single batch.
+
+        Parameters:
+            dataset: [{name: string, amount_shares: int, type_shares: string, currency: string}]: The data that has been extracted for the shareholders table.
+            company_detail: int: The identifier of the company.
+            buffer: Write_Behind_Buffer|null: The write-behind buffer in which the rows are staged instead of being inserted.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: List[Tuple[str, int, str, str, int]] = [(str(data["name"]), int(data["amount_shares"]), str(data["type_shares"]), str(data["currency"]), company_detail) for data in dataset]
+            columns: str = "name, amount_shares, type_shares, currency, CompanyDetail"
+            if buffer is None:
+                self.postDataBatch(
+                    table=self.getTableName(),
+                    columns=columns,
+                    rows=rows # type: ignore
+                )
+            else:
+                buffer.stage(self.getTableName(), columns, rows) # type: ignore
+            response = self.created
+        except Error as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
     def getPossibleShareTypes(self) -> List[str]:
         """
         Retrieving all of the possible share types that are stored
@@ -100,7 +132,7 @@ class Shareholders(Database_Handler):
             )
             dataset: Dict[str, Union[int, List[str]]] = self._getPossibleShareTypes(result_set)
             response = dataset["response"] # type: ignore
-            self.getLogger().inform(f"The data from the {self.getTableName()} table has been successfully retrieved.\nStatus: {dataset['status']}\nData: {dataset['response']}")
+            self.getLogger().inform(f"The data from the {self.getTableName()} table has been successfully retrieved.\nStatus: {dataset['status']}", {"Data": dataset['response']})
         except Error as error:
             status = self.service_unavailable
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {status}\nError: {error}")
@@ -149,7 +181,7 @@ class Shareholders(Database_Handler):
             )
             dataset: Dict[str, Union[int, List[str]]] = self._getPossibleCurrencies(result_set)
             response = dataset["response"] # type: ignore
-            self.getLogger().inform(f"The data from the {self.getTableName()} table has been successfully retrieved.\nStatus: {dataset['status']}\nData: {dataset['response']}")
+            self.getLogger().inform(f"The data from the {self.getTableName()} table has been successfully retrieved.\nStatus: {dataset['status']}", {"Data": dataset['response']})
         except Error as error:
             status = self.service_unavailable
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {status}\nError: {error}")
@@ -193,7 +225,7 @@ class Shareholders(Database_Handler):
                 table_name=self.getTableName()
             )
             response: Dict[str, Union[int, List[Shareholder]]] = self._get(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {response['data']}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
             return response["data"]  # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
@@ -217,6 +249,120 @@ class Shareholders(Database_Handler):
             "data": data
         }
 
+    def iterAll(self, batch_size: int = 1000) -> Iterator[List[Shareholder]]:
+        """
+        Retrieving all of the data from the Shareholders table page by
+        page, so that only one page is held in memory at a time.
+
+        Parameters:
+            batch_size (int): The amount of shareholders per page.
+
+        Returns:
+            Iterator[List[Shareholder]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=Shareholder.columns,
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=Shareholder.fromRow
+        ) # type: ignore
+
+    def iterUncurated(self, batch_size: int = 1000) -> Iterator[List[Shareholder]]:
+        """
+        Retrieving the data from the Shareholders table which has not
+        been curated yet page by page.
+
+        Parameters:
+            batch_size (int): The amount of shareholders per page.
+
+        Returns:
+            Iterator[List[Shareholder]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=Shareholder.columns,
+            filter_condition="is_curated = 0",
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=Shareholder.fromRow
+        ) # type: ignore
+
+    def getUncurated(self) -> List[Shareholder]:
+        """
+        Retrieving the data from the Shareholders table which has
+        not been curated yet.
+
+        Returns:
+            [{identifier: int, CompanyDetail: int, name: string, amount_shares: int, type_shares: string, currency: string}]
+        """
+        try:
+            data: Union[List[RowType], List[Dict[str, Union[int, str]]]] = self.getData(
+                table_name=self.getTableName(),
+                filter_condition="is_curated = 0"
+            )
+            response: Dict[str, Union[int, List[Shareholder]]] = self._get(data)
+            self.getLogger().inform(f"The data from {self.getTableName()} which has not been curated has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
+            return response["data"]  # type: ignore
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return []
+
+    def deleteMany(self, identifiers: List[int], chunk_size: int = 1000) -> int:
+        """
+        Deleting the shareholders which have been discarded by the
+        curation.
+
+        Parameters:
+            identifiers (List[int]): The identifiers of the shareholders.
+            chunk_size (int): The amount of shareholders to be deleted per query.
+
+        Returns:
+            int
+        """
+        try:
+            for index in range(0, len(identifiers), chunk_size):
+                parameters: Tuple[int, ...] = tuple(identifiers[index:index + chunk_size])
+                self.deleteData(
+                    table=self.getTableName(),
+                    parameters=parameters, # type: ignore
+                    condition=f"identifier IN ({', '.join(['%s'] * len(parameters))})"
+                )
+            response = self.no_content
+            self.getLogger().inform(f"The data from {self.getTableName()} has been deleted!\nStatus: {response}\nAmount: {len(identifiers)}")
+            return response
+        except Error as error:
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
+            return self.service_unavailable
+
+    def updateCuratedShareholders(self, dataset: List[Shareholder], chunk_size: int = 1000) -> List[int]:
+        """
+        Updating the curated shareholders in batches and marking them
+        as curated, while preserving their identifiers.
+
+        Parameters:
+            dataset (List[Shareholder]): The curated shareholders.
+            chunk_size (int): The amount of shareholders to be updated per commit.
+
+        Returns:
+            List[int]: The status of each chunk.
+        """
+        rows: List[Tuple[int, int, str, int, str, str, int]] = [(shareholder.identifier, shareholder.CompanyDetail, shareholder.name, shareholder.amount_shares, shareholder.type_shares, shareholder.currency, 1) for shareholder in dataset]
+        statuses: List[bool] = self.updateDataBatch(
+            table=self.getTableName(),
+            columns="CompanyDetail, name, amount_shares, type_shares, currency, is_curated",
+            keys="identifier",
+            rows=rows, # type: ignore
+            chunk_size=chunk_size
+        )
+        return [202 if status else 503 for status in statuses]
+
     def delete(self) -> int:
         """
         Deleting the data that is in the relational database server.
@@ -236,6 +382,66 @@ class Shareholders(Database_Handler):
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {self.service_unavailable}\nError: {error}")
             return self.service_unavailable
 
+    def replaceCuratedShareholders(self, dataset: Iterable[Shareholder], chunk_size: int = 1000) -> int:
+        """
+        Replacing all of the shareholders by the curated ones through a
+        shadow table which is swapped with the live table once it
+        has been fully loaded.  The curated shareholders are consumed
+        lazily, so that they can be curated page by page.  A table
+        having foreign keys cannot be swapped, so its curated shareholders
+        are read and rewritten in a single unit of work instead.
+
+        Parameters:
+            dataset (Iterable[Shareholder]): The curated shareholders.
+            chunk_size (int): The amount of shareholders to be inserted per commit.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: Iterator[Tuple[int, int, str, int, str, str, int]] = ((shareholder.identifier, shareholder.CompanyDetail, shareholder.name, shareholder.amount_shares, shareholder.type_shares, shareholder.currency, 1) for shareholder in dataset)
+            replace: Callable[..., int] = self.rewriteDataBatch if self.getForeignKeys(self.getTableName()) else self.replaceDataBatch
+            amount: int = replace(
+                table=self.getTableName(),
+                columns="identifier, CompanyDetail, name, amount_shares, type_shares, currency, is_curated",
+                rows=rows, # type: ignore
+                chunk_size=chunk_size
+            )
+            response = self.created
+            self.getLogger().inform(f"The data from {self.getTableName()} has been replaced!\nStatus: {response}\nAmount: {amount}")
+        except (Error, RuntimeError) as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
+    def addCuratedShareholders(self, dataset: List[Shareholder], chunk_size: int = 1000) -> int:
+        """
+        Adding the curated shareholders data of the companies into
+        the relational database server in batches.
+
+        Parameters:
+            dataset (List[Shareholder]): The curated shareholders.
+            chunk_size (int): The amount of shareholders to be inserted per commit.
+
+        Returns:
+            int
+        """
+        response: int
+        try:
+            rows: List[Tuple[int, int, str, int, str, str, int]] = [(shareholder.identifier, shareholder.CompanyDetail, shareholder.name, shareholder.amount_shares, shareholder.type_shares, shareholder.currency, 1) for shareholder in dataset]
+            self.postDataBatch(
+                table=self.getTableName(),
+                columns="identifier, CompanyDetail, name, amount_shares, type_shares, currency, is_curated",
+                rows=rows, # type: ignore
+                chunk_size=chunk_size
+            )
+            response = self.created
+        except Error as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: {response}\nError: {error}")
+        return response
+
     def addCuratedShareholder(self, data: Shareholder) -> int:
         """
         Adding the shareholder data of the company into the
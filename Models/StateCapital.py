@@ -9,7 +9,7 @@ Authors:
 
 from Data.StateCapital import StateCapital
 from Models.DatabaseHandler import Database_Handler
-from typing import Union, Dict, Tuple, List
+from typing import Union, Dict, Tuple, List, Iterator
 from mysql.connector.errors import Error
 from mysql.connector.types import RowType
 
@@ -85,7 +85,7 @@ class State_Capital(Database_Handler):
                 table_name=self.getTableName()
             )
             response: Dict[str, Union[int, List[StateCapital]]] = self._get(data)
-            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nData: {response['data']}")
+            self.getLogger().inform(f"The data from {self.getTableName()} has been retrieved!\nStatus: {response['status']}\nAmount: {len(response['data'])}")
             return response["data"]  # type: ignore
         except Error as error:
             self.getLogger().error(f"An error occurred in {self.getTableName()}\nStatus: 503\nError: {error}")
@@ -109,6 +109,50 @@ class State_Capital(Database_Handler):
             "data": data
         }
 
+    def iterAll(self, batch_size: int = 1000) -> Iterator[List[StateCapital]]:
+        """
+        Retrieving all of the data from the State Capital table page by
+        page, so that only one page is held in memory at a time.
+
+        Parameters:
+            batch_size (int): The amount of stated capitals per page.
+
+        Returns:
+            Iterator[List[StateCapital]]
+
+        Raises:
+            Error: If a page cannot be retrieved.
+        """
+        return self.iterPages(
+            table_name=self.getTableName(),
+            column_names=StateCapital.columns,
+            batch_size=batch_size,
+            is_dictionary=False,
+            row_factory=StateCapital.fromRow
+        ) # type: ignore
+
+    def updateStatedCapitals(self, dataset: List[StateCapital], chunk_size: int = 1000) -> List[int]:
+        """
+        Updating the type and the currency of the stated capitals in
+        batches.
+
+        Parameters:
+            dataset (List[StateCapital]): The curated stated capitals.
+            chunk_size (int): The amount of stated capitals to be updated per commit.
+
+        Returns:
+            List[int]: The status of each chunk.
+        """
+        rows: List[Tuple[int, int, str, str]] = [(stated_capital.identifier, stated_capital.CompanyDetail, str(stated_capital.type), str(stated_capital.currency)) for stated_capital in dataset]
+        statuses: List[bool] = self.updateDataBatch(
+            table=self.getTableName(),
+            columns="type, currency",
+            keys="identifier, CompanyDetail",
+            rows=rows, # type: ignore
+            chunk_size=chunk_size
+        )
+        return [202 if status else 503 for status in statuses]
+
     def updateStatedCapital(self, stated_capital: StateCapital) -> int:
         """
         Updating the data that is stored in the relational database
@@ -0,0 +1,263 @@
+"""
+This module provides the Write_Behind_Buffer class, which is
+responsible for accumulating the rows of the child tables of the
+corporate registries across many documents, so that they are
+inserted in large batches per table instead of a few rows per
+company.
+
+Authors:
+    Darkness4869
+"""
+
+
+from Models.DatabaseHandler import Database_Handler
+from mysql.connector.errors import Error
+from typing import ContextManager, Dict, List, Tuple, Union, Any
+from time import time
+
+
+class Write_Behind_Buffer(Database_Handler):
+    """
+    The write-behind buffer of the child tables of the corporate
+    registries.  A group of corporate registries is stored in a
+    single unit of work which is opened by the buffer, each of
+    them in a nested unit of work of its own.  The rows of the
+    corporate registry being stored are staged until it is
+    stored, after which they are pending until the buffer is
+    flushed.  The flush inserts the pending rows per table, marks
+    the companies of the group as extracted and completes the unit
+    of work, so that the parent rows, the child rows and the
+    extraction status of the companies are committed or rolled
+    back together.  It is triggered by the amount of pending rows,
+    the amount of pending companies or the age of the group, and
+    it has to be triggered once more when the extraction ends.
+    """
+    size: int = 10000
+    """
+    The amount of pending rows beyond which the buffer is flushed.
+    """
+    registries: int = 500
+    """
+    The amount of pending companies beyond which the buffer is
+    flushed, which bounds the size of the transaction of the
+    group.
+    """
+    interval: float = 60.0
+    """
+    The age in seconds of the group beyond which the buffer is
+    flushed.
+    """
+    chunk_size: int = 1000
+    """
+    The amount of rows to be inserted per statement.
+    """
+    __table_name: str
+    """
+    The table which holds the extraction status of the companies.
+    """
+    __staged: Dict[str, Tuple[str, List[Tuple[Any, ...]]]]
+    """
+    The columns and the rows of the corporate registry being
+    stored, indexed by their table.
+    """
+    __pending: Dict[str, Tuple[str, List[Tuple[Any, ...]]]]
+    """
+    The columns and the rows of the stored corporate registries
+    of the group, indexed by their table.
+    """
+    __companies: List[int]
+    """
+    The identifiers of the companies of the stored corporate
+    registries of the group.
+    """
+    __unit_of_work: Union[ContextManager[None], None]
+    """
+    The unit of work of the group, which is active until the
+    buffer is flushed.
+    """
+    __started: float
+    """
+    The time at which the unit of work of the group has been
+    opened.
+    """
+    service_unavailable: int = 503
+    """
+    The status code for service unavailable
+    """
+    created: int = 201
+    """
+    The status code for a success creation
+    """
+    no_content: int = 204
+    """
+    The status code for no content.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializing the buffer with no group.
+        """
+        super().__init__()
+        self.setTableName("CompanyDetails")
+        self.setStaged({})
+        self.setPending({})
+        self.setCompanies([])
+        self.setUnitOfWork(None)
+        self.setStarted(0.0)
+        self.getLogger().inform("The model has been successfully been initiated with its dependencies.")
+
+    def getTableName(self) -> str:
+        return self.__table_name
+
+    def setTableName(self, table_name: str) -> None:
+        self.__table_name = table_name
+
+    def getStaged(self) -> Dict[str, Tuple[str, List[Tuple[Any, ...]]]]:
+        return self.__staged
+
+    def setStaged(self, staged: Dict[str, Tuple[str, List[Tuple[Any, ...]]]]) -> None:
+        self.__staged = staged
+
+    def getPending(self) -> Dict[str, Tuple[str, List[Tuple[Any, ...]]]]:
+        return self.__pending
+
+    def setPending(self, pending: Dict[str, Tuple[str, List[Tuple[Any, ...]]]]) -> None:
+        self.__pending = pending
+
+    def getCompanies(self) -> List[int]:
+        return self.__companies
+
+    def setCompanies(self, companies: List[int]) -> None:
+        self.__companies = companies
+
+    def getUnitOfWork(self) -> Union[ContextManager[None], None]:
+        return self.__unit_of_work
+
+    def setUnitOfWork(self, unit_of_work: Union[ContextManager[None], None]) -> None:
+        self.__unit_of_work = unit_of_work
+
+    def getStarted(self) -> float:
+        return self.__started
+
+    def setStarted(self, started: float) -> None:
+        self.__started = started
+
+    def open(self) -> None:
+        """
+        Opening the unit of work of the group, unless it is already
+        active, so that the corporate registries are stored in it.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If no connection can be borrowed from the pool.
+        """
+        if self.getUnitOfWork() is not None:
+            return
+        unit_of_work: ContextManager[None] = self.unitOfWork()
+        unit_of_work.__enter__()
+        self.setUnitOfWork(unit_of_work)
+        self.setStarted(time())
+
+    def stage(self, table: str, columns: str, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Staging the rows of the corporate registry being stored.
+
+        Parameters:
+            table (str): The name of the table.
+            columns (str): The names of the columns.
+            rows (List[Tuple[Any, ...]]): The rows to be inserted, in the order of the columns.
+
+        Returns:
+            None
+        """
+        self.getStaged().setdefault(table, (columns, []))[1].extend(rows)
+
+    def rollback(self) -> None:
+        """
+        Discarding the staged rows of a corporate registry which
+        cannot be stored.
+
+        Returns:
+            None
+        """
+        self.setStaged({})
+
+    def commit(self, company_detail: int) -> None:
+        """
+        Adding the staged rows of a corporate registry which has
+        been stored to the pending rows of the group, along with its
+        company, which is marked as extracted once they are flushed.
+
+        Parameters:
+            company_detail (int): The identifier of the company.
+
+        Returns:
+            None
+        """
+        for table, (columns, rows) in self.getStaged().items():
+            self.getPending().setdefault(table, (columns, []))[1].extend(rows)
+        self.getCompanies().append(company_detail)
+        self.setStaged({})
+
+    def isDue(self) -> bool:
+        """
+        Verifying whether the buffer has to be flushed, because of
+        the amount of pending rows or companies, or because of the
+        age of the group.
+
+        Returns:
+            bool
+        """
+        amount: int = sum([len(rows) for _, rows in self.getPending().values()])
+        return amount >= self.size or len(self.getCompanies()) >= self.registries or time() - self.getStarted() >= self.interval
+
+    def flush(self) -> int:
+        """
+        Inserting the pending rows of the group in batches, marking
+        its companies as extracted and completing its unit of work.
+        The unit of work is rolled back when the flush fails, in
+        which case the corporate registries of the group are
+        extracted again in the next run.
+
+        Returns:
+            int
+        """
+        unit_of_work: Union[ContextManager[None], None] = self.getUnitOfWork()
+        if unit_of_work is None:
+            return self.no_content
+        pending: Dict[str, Tuple[str, List[Tuple[Any, ...]]]] = self.getPending()
+        companies: List[int] = self.getCompanies()
+        amount: int = sum([len(rows) for _, rows in pending.values()])
+        self.setUnitOfWork(None)
+        self.setPending({})
+        self.setCompanies([])
+        self.setStaged({})
+        response: int = self.created
+        try:
+            try:
+                for table, (columns, rows) in pending.items():
+                    self.postDataBatch(table, columns, rows, self.chunk_size)
+                for start in range(0, len(companies), self.chunk_size):
+                    identifiers: List[int] = companies[start:start + self.chunk_size]
+                    self.updateData(
+                        table=self.getTableName(),
+                        values="is_extracted = %s",
+                        condition=f"identifier IN ({', '.join(['%s'] * len(identifiers))})",
+                        parameters=(1, *identifiers) # type: ignore
+                    )
+            except Error as error:
+                self.failUnitOfWork()
+                response = self.service_unavailable
+                self.getLogger().error(f"An error occurred while flushing the write-behind buffer.  The corporate registries of the group will be extracted in the next run.\nStatus: {response}\nAmount: {amount}\nCompanies: {len(companies)}\nError: {error}")
+            if response == self.created and self.isUnitOfWorkFailed():
+                response = self.service_unavailable
+                self.getLogger().error(f"The unit of work of the write-behind buffer has failed outside of its corporate registries.  The corporate registries of the group will be extracted in the next run.\nStatus: {response}\nAmount: {amount}\nCompanies: {len(companies)}")
+            unit_of_work.__exit__(None, None, None)
+        except RuntimeError as error:
+            response = self.service_unavailable
+            self.getLogger().error(f"The unit of work of the write-behind buffer cannot be committed.  The corporate registries of the group will be extracted in the next run.\nStatus: {response}\nAmount: {amount}\nCompanies: {len(companies)}\nError: {error}")
+        if response == self.created:
+            self.getLogger().inform(f"The write-behind buffer has been flushed.\nStatus: {response}\nAmount: {amount}\nCompanies: {len(companies)}")
+        return response